@@ -28,6 +28,12 @@
 #  the parent class, allows the child class to appropriately interface with
 #  the Spinnaker SDK.
 
+import logging
+import logging.handlers
+import queue
+import sys
+import threading
+
 import PySpin
 
 
@@ -35,12 +41,32 @@ class EventType:
     """
     'Enum' for choosing whether to register a event specifically for exposure end events
     or universally for all events.
+
+    SPECIFIC lets the SDK filter out every other event type before the handler is
+    called. GENERIC is kept to demonstrate generic registration; every device event
+    then reaches the handler, which has to discard the ones it is not interested in.
+    CHUNK_DATA registers no event handler at all; the exposure information is read
+    from the chunk data embedded in each image instead.
     """
     GENERIC = 0
     SPECIFIC = 1
+    CHUNK_DATA = 2
 
-CHOSEN_EVENT = EventType.GENERIC  # change me!
+CHOSEN_EVENT = EventType.SPECIFIC  # change me!
 NUM_IMAGES = 10  # number of images to acquire
+PRINT_EVENTS = False  # print every device event as it is received
+SAVE_QUEUE_SIZE = 4  # number of grabbed images that may wait to be saved
+SAVE_QUEUE_TIMEOUT = 1.0  # number of seconds between checks that the saving thread is still running
+CHUNK_SELECTOR_ENTRIES = ("Timestamp", "FrameID", "ExposureTime")  # chunks enabled for EventType.CHUNK_DATA
+DEVICE_INFO_FEATURES = ("DeviceVendorName", "DeviceModelName", "DeviceSerialNumber", "DeviceVersion")
+
+# Messages from the event callback and the acquisition loop are logged through
+# a queue; a listener started in main() writes them to stdout on its own thread.
+log_queue = queue.Queue(-1)
+log = logging.getLogger("DeviceEvents")
+log.setLevel(logging.INFO)
+log.propagate = False
+log.addHandler(logging.handlers.QueueHandler(log_queue))
 
 
 class DeviceEventHandler(PySpin.DeviceEvent):
@@ -61,30 +87,42 @@ class DeviceEventHandler(PySpin.DeviceEvent):
         :type eventname: str
         :rtype: None
         """
-        super(DeviceEventHandler, self).__init__()
+        super().__init__()
         self.event_name = eventname
+        self._expected_event_id = None
         self.count = 0
 
     def OnDeviceEvent(self, eventname):
         """
         Callback function when a device event occurs.
-        Note eventname is a wrapped gcstring, not a Python string, but basic operations such as printing and comparing
-        with Python strings are supported.
+        Note eventname is a wrapped gcstring, not a Python string. The event is
+        matched by name only until the first specified event arrives; its ID is
+        then remembered and later events are matched on the integer ID, which
+        avoids comparing the gcstring on every event.
 
         :param eventname: gcstring representing the name of the occurred event.
         :type eventname: gcstring
         :rtype: None
         """
-        if eventname == self.event_name:
-            self.count += 1
+        event_id = self.GetDeviceEventId()
 
-            # Print information on specified device event
-            print "\tDevice event %s with ID %i number %i..." % (self.GetDeviceEventName(),
-                                                               self.GetDeviceEventId(),
-                                                               self.count)
-        else:
-            # Print no information on non-specified event
-            print "\tDevice event occurred; not %s; ignoring..." % self.event_name
+        # Learn the ID of the specified event from the first one received
+        if self._expected_event_id is None and eventname == self.event_name:
+            self._expected_event_id = event_id
+
+        # Return early on non-specified events; these only arrive when the
+        # handler has been registered generally
+        if event_id != self._expected_event_id:
+            if PRINT_EVENTS:
+                log.info("\tDevice event occurred; not %s; ignoring...", self.event_name)
+            return
+
+        self.count += 1
+
+        # Print information on specified device event
+        if PRINT_EVENTS:
+            log.info("\tDevice event %s with ID %i number %i...",
+                     self.GetDeviceEventName(), event_id, self.count)
 
 
 def configure_device_events(nodemap, cam):
@@ -101,7 +139,7 @@ def configure_device_events(nodemap, cam):
         device_event_handler is the event handler
     :rtype: (bool, DeviceEventHandler)
     """
-    print "\n*** CONFIGURING DEVICE EVENTS ***\n"
+    print("\n*** CONFIGURING DEVICE EVENTS ***\n")
 
     try:
         result = True
@@ -120,11 +158,38 @@ def configure_device_events(nodemap, cam):
         #  use-case might be to enable only the events of interest.
         node_event_selector = PySpin.CEnumerationPtr(nodemap.GetNode("EventSelector"))
         if not PySpin.IsAvailable(node_event_selector) or not PySpin.IsReadable(node_event_selector):
-            print "Unable to retrieve event selector entries. Aborting..."
-            return False
+            print("Unable to retrieve event selector entries. Aborting...")
+            return False, None
+
+        # Retrieve event selector entry values
+        #
+        # *** NOTES ***
+        # The integer value and display name of each readable entry are
+        # collected up front, so the loop below only has to set plain
+        # integers on the selector and notification nodes.
+        entries = []
+        for entry in node_event_selector.GetEntries():
+            node_entry = PySpin.CEnumEntryPtr(entry)
+            if not PySpin.IsAvailable(node_entry) or not PySpin.IsReadable(node_entry):
+
+                # Skip if node fails
+                result = False
+                continue
 
-        entries = node_event_selector.GetEntries()
-        print "Enabling event selector entries..."
+            entries.append((node_entry.GetValue(), node_entry.GetDisplayName()))
+
+        # Retrieve event notification node (an enumeration node)
+        #
+        # *** NOTES ***
+        # The notification node is the same for every event type, so it is
+        # looked up once here rather than for each entry on the selector node.
+        # Its availability can depend on the selected event, so it is still
+        # checked for each entry below, and its "On" entry value is retrieved
+        # the first time it is needed.
+        node_event_notification = PySpin.CEnumerationPtr(nodemap.GetNode("EventNotification"))
+        event_notification_on = None
+
+        print("Enabling event selector entries...")
 
         # Enable device events
         #
@@ -133,20 +198,11 @@ def configure_device_events(nodemap, cam):
         # notification nodes (both of type enumeration) must work in unison.
         # The desired event must first be selected on the event selector node
         # and then enabled on the event notification node.
-        for entry in entries:
+        for entry_value, entry_display_name in entries:
 
             # Select entry on selector node
-            node_entry = PySpin.CEnumEntryPtr(entry)
-            if not PySpin.IsAvailable(node_entry) or not PySpin.IsReadable(node_entry):
+            node_event_selector.SetIntValue(entry_value)
 
-                # Skip if node fails
-                result = False
-                continue
-
-            node_event_selector.SetIntValue(node_entry.GetValue())
-
-            # Retrieve event notification node (an enumeration node)
-            node_event_notification = PySpin.CEnumerationPtr(nodemap.GetNode("EventNotification"))
             if not PySpin.IsAvailable(node_event_notification) or not PySpin.IsWritable(node_event_notification):
 
                 # Skip if node fails
@@ -154,16 +210,21 @@ def configure_device_events(nodemap, cam):
                 continue
 
             # Retrieve entry node to enable device event
-            node_event_notification_on = PySpin.CEnumEntryPtr(node_event_notification.GetEntryByName("On"))
-            if not PySpin.IsAvailable(node_event_notification_on) or not PySpin.IsReadable(node_event_notification_on):
+            if event_notification_on is None:
+                node_event_notification_on = PySpin.CEnumEntryPtr(node_event_notification.GetEntryByName("On"))
+                if not PySpin.IsAvailable(node_event_notification_on) or \
+                        not PySpin.IsReadable(node_event_notification_on):
 
-                # Skip if node fails
-                result = False
-                continue
+                    # Skip if node fails
+                    result = False
+                    continue
+
+                event_notification_on = node_event_notification_on.GetValue()
 
-            node_event_notification.SetIntValue(node_event_notification_on.GetValue())
+            # Enable device event
+            node_event_notification.SetIntValue(event_notification_on)
 
-            print "\t%s: enabled..." % node_entry.GetDisplayName()
+            print("\t%s: enabled..." % entry_display_name)
 
         # Create device event
         #
@@ -191,7 +252,7 @@ def configure_device_events(nodemap, cam):
             # Device event handlers registered generally will be triggered by any device events.
             cam.RegisterEvent(device_event_handler)
 
-            print "Device event handler registered generally..."
+            print("Device event handler registered generally...")
 
         elif CHOSEN_EVENT == EventType.SPECIFIC:
 
@@ -199,15 +260,123 @@ def configure_device_events(nodemap, cam):
             # be triggered by the type of event is it registered to.
             cam.RegisterEvent(device_event_handler, "EventExposureEnd")
 
-            print "Device event handler registered specifically to EventExposureEnd events..."
+            print("Device event handler registered specifically to EventExposureEnd events...")
 
     except PySpin.SpinnakerException as ex:
-        print "Error: %s" % ex
+        print("Error: %s" % ex)
         result = False
 
     return result, device_event_handler
 
 
+def configure_chunk_data(nodemap):
+    """
+    This function configures the camera to embed exposure information in each
+    image as chunk data. This carries the same information as exposure end
+    events along with the image itself, so no event handler is needed.
+
+    :param nodemap: Device nodemap.
+    :type nodemap: INodeMap
+    :return: True if successful, False otherwise.
+    :rtype: bool
+    """
+    print("\n*** CONFIGURING CHUNK DATA ***\n")
+
+    try:
+        result = True
+
+        # Retrieve chunk nodes and chunk selector entries
+        #
+        # *** NOTES ***
+        # Every node and entry is checked before any of them is written, so
+        # that chunk mode is not activated when chunks cannot be selected.
+        node_chunk_mode_active = PySpin.CBooleanPtr(nodemap.GetNode("ChunkModeActive"))
+        if not PySpin.IsAvailable(node_chunk_mode_active) or not PySpin.IsWritable(node_chunk_mode_active):
+            print("Unable to activate chunk mode. Aborting...")
+            return False
+
+        node_chunk_selector = PySpin.CEnumerationPtr(nodemap.GetNode("ChunkSelector"))
+        if not PySpin.IsAvailable(node_chunk_selector) or not PySpin.IsWritable(node_chunk_selector):
+            print("Unable to retrieve chunk selector. Aborting...")
+            return False
+
+        chunk_entries = []
+        for chunk_name in CHUNK_SELECTOR_ENTRIES:
+            node_entry = PySpin.CEnumEntryPtr(node_chunk_selector.GetEntryByName(chunk_name))
+            if not PySpin.IsAvailable(node_entry) or not PySpin.IsReadable(node_entry):
+                print("Unable to retrieve chunk %s. Aborting..." % chunk_name)
+                return False
+
+            chunk_entries.append((chunk_name, node_entry.GetValue()))
+
+        node_chunk_enable = PySpin.CBooleanPtr(nodemap.GetNode("ChunkEnable"))
+
+        # Activate chunk mode
+        #
+        # *** NOTES ***
+        # Once chunk mode is active, the chunks enabled below are sent along
+        # with every image and can be read from the image's chunk data.
+        node_chunk_mode_active.SetValue(True)
+
+        print("Chunk mode activated...")
+
+        # Enable chunks
+        #
+        # *** NOTES ***
+        # Like device events, each chunk is selected on the selector node and
+        # then enabled on the enable node. Whether the enable node is writable
+        # depends on the selected chunk, so it is checked after selecting it.
+        for chunk_name, chunk_value in chunk_entries:
+            node_chunk_selector.SetIntValue(chunk_value)
+
+            if not PySpin.IsAvailable(node_chunk_enable) or not PySpin.IsWritable(node_chunk_enable):
+                print("Unable to enable chunk %s. Aborting..." % chunk_name)
+                result = False
+                break
+
+            node_chunk_enable.SetValue(True)
+
+            print("\t%s: enabled..." % chunk_name)
+
+    except PySpin.SpinnakerException as ex:
+        print("Error: %s" % ex)
+        result = False
+
+    # Deactivate chunk mode again if any chunk could not be enabled
+    if not result:
+        reset_chunk_data(nodemap)
+
+    return result
+
+
+def reset_chunk_data(nodemap):
+    """
+    This function resets the example by deactivating chunk mode.
+
+    :param nodemap: Device nodemap.
+    :type nodemap: INodeMap
+    :return: True if successful, False otherwise.
+    :rtype: bool
+    """
+    try:
+        result = True
+
+        node_chunk_mode_active = PySpin.CBooleanPtr(nodemap.GetNode("ChunkModeActive"))
+        if not PySpin.IsAvailable(node_chunk_mode_active) or not PySpin.IsWritable(node_chunk_mode_active):
+            print("Unable to deactivate chunk mode. Aborting...")
+            return False
+
+        node_chunk_mode_active.SetValue(False)
+
+        print("Chunk mode deactivated...\n")
+
+    except PySpin.SpinnakerException as ex:
+        print("Error: %s" % ex)
+        result = False
+
+    return result
+
+
 def reset_device_events(cam, device_event_handler):
     """
     This function resets the example by unregistering the device event.
@@ -229,10 +398,11 @@ def reset_device_events(cam, device_event_handler):
         # they are registered to.
         cam.UnregisterEvent(device_event_handler)
 
-        print "Device event handler unregistered...\n"
+        print("Device event handler unregistered after %i %s events...\n" % (device_event_handler.count,
+                                                                           device_event_handler.event_name))
 
     except PySpin.SpinnakerException as ex:
-        print "Error: %s" % ex
+        print("Error: %s" % ex)
         result = False
 
     return result
@@ -242,36 +412,110 @@ def print_device_info(nodemap):
     """
      This function prints the device information of the camera from the transport
      layer; please see NodeMapInfo example for more in-depth comments on printing
-     device information from the nodemap.
+     device information from the nodemap. Only the features listed in
+     DEVICE_INFO_FEATURES are read, rather than the whole DeviceInformation
+     category, as each read may require a round trip to the device.
 
      :param nodemap: Transport layer device nodemap.
      :type nodemap: INodeMap
      :return: True if successful, False otherwise.
      :rtype: bool
     """
-    print "\n*** DEVICE INFORMATION ***\n"
+    print("\n*** DEVICE INFORMATION ***\n")
 
     try:
         result = True
-        node_device_information = PySpin.CCategoryPtr(nodemap.GetNode("DeviceInformation"))
-
-        if PySpin.IsAvailable(node_device_information) and PySpin.IsReadable(node_device_information):
-            features = node_device_information.GetFeatures()
-            for feature in features:
-                node_feature = PySpin.CValuePtr(feature)
-                print "%s: %s" % (node_feature.GetName(),
-                                  node_feature.ToString() if PySpin.IsReadable(node_feature) else "Node not readable")
 
-        else:
-            print "Device control information not available."
+        for feature_name in DEVICE_INFO_FEATURES:
+            node_feature = PySpin.CValuePtr(nodemap.GetNode(feature_name))
+            if PySpin.IsAvailable(node_feature) and PySpin.IsReadable(node_feature):
+                print("%s: %s" % (feature_name, node_feature.ToString()))
+            else:
+                print("%s: Node not readable" % feature_name)
 
     except PySpin.SpinnakerException as ex:
-        print "Error: %s" % ex.message
+        print("Error: %s" % ex)
         return False
 
     return result
 
 
+def save_images(image_queue, errors):
+    """
+    This function converts and saves the images placed on the queue by
+    acquire_images() until it receives None. It runs on its own thread so
+    that conversion and saving do not hold up the retrieval of the next image.
+
+    :param image_queue: Queue of (image, filename) tuples to save.
+    :param errors: List to which any exceptions raised while saving are appended.
+    :type image_queue: queue.Queue
+    :type errors: list
+    :rtype: None
+    """
+    # Create destination image for conversions
+    #
+    # *** NOTES ***
+    # Converting into an existing image reuses its buffer instead of
+    # allocating a new image for every frame. The buffer is allocated by the
+    # first conversion and reused after that, since all images in an
+    # acquisition have the same size.
+    image_converted = PySpin.Image.Create()
+
+    while True:
+        item = image_queue.get()
+        if item is None:
+            break
+
+        image_result, filename = item
+        try:
+            # Convert to mono8
+            image_result.Convert(image_converted, PySpin.PixelFormat_Mono8, PySpin.HQ_LINEAR)
+
+            # Save image
+            image_converted.Save(filename)
+            log.info("Image saved at %s", filename)
+
+        except Exception as ex:
+
+            # Any error, including file system errors, is recorded and the
+            # thread carries on with the next image, so that the queue keeps
+            # draining and acquisition is never left waiting on it.
+            log.error("Error: %s", ex)
+            errors.append(ex)
+
+        finally:
+            # Release image
+            #
+            # *** NOTES ***
+            # Images handed to this thread are released here, once they have
+            # been saved, rather than by the acquisition loop.
+            image_result.Release()
+
+
+def queue_image(image_queue, item, save_thread):
+    """
+    Places an item on the queue of the saving thread, waiting while the queue
+    is full for as long as the thread is still running.
+
+    :param image_queue: Queue of the saving thread.
+    :param item: Item to queue.
+    :param save_thread: Thread that empties the queue.
+    :type image_queue: queue.Queue
+    :type item: tuple or None
+    :type save_thread: threading.Thread
+    :return: True if the item was queued, False if the saving thread has stopped.
+    :rtype: bool
+    """
+    while save_thread.is_alive():
+        try:
+            image_queue.put(item, timeout=SAVE_QUEUE_TIMEOUT)
+            return True
+        except queue.Full:
+            pass
+
+    return False
+
+
 def acquire_images(cam, nodemap, nodemap_tldevice):
     """
     This function acquires and saves 10 images from a device; please see
@@ -286,80 +530,119 @@ def acquire_images(cam, nodemap, nodemap_tldevice):
     :return: True if successful, False otherwise.
     :rtype: bool
     """
-    print "\n*** IMAGE ACQUISITION ***\n"
+    print("\n*** IMAGE ACQUISITION ***\n")
     try:
         result = True
 
         # Set acquisition mode to continuous
         node_acquisition_mode = PySpin.CEnumerationPtr(nodemap.GetNode("AcquisitionMode"))
         if not PySpin.IsAvailable(node_acquisition_mode) or not PySpin.IsWritable(node_acquisition_mode):
-            print "Unable to set acquisition mode to continuous (enum retrieval). Aborting...\n"
+            print("Unable to set acquisition mode to continuous (enum retrieval). Aborting...\n")
             return False
 
         # Retrieve entry node from enumeration node
         node_acquisition_mode_continuous = node_acquisition_mode.GetEntryByName("Continuous")
         if not PySpin.IsAvailable(node_acquisition_mode_continuous) \
                 or not PySpin.IsReadable(node_acquisition_mode_continuous):
-            print "Unable to set acquisition mode to continuous (entry retrieval). Aborting...\n"
+            print("Unable to set acquisition mode to continuous (entry retrieval). Aborting...\n")
             return False
 
         acquisition_mode_continuous = node_acquisition_mode_continuous.GetValue()
 
         node_acquisition_mode.SetIntValue(acquisition_mode_continuous)
 
-        print "Acquisition mode set to continuous..."
+        print("Acquisition mode set to continuous...")
 
         #  Begin acquiring images
         cam.BeginAcquisition()
 
-        print "Acquiring images..."
+        print("Acquiring images...")
 
         # Retrieve device serial number for filename
+        #
+        # *** NOTES ***
+        # The serial number does not change during acquisition, so the
+        # filename template is built once here and only the image index is
+        # substituted for each image.
+        filename_template = "DeviceEvents-%i.jpg"
+
         node_device_serial_number = PySpin.CStringPtr(nodemap_tldevice.GetNode("DeviceSerialNumber"))
         if PySpin.IsAvailable(node_device_serial_number) and PySpin.IsReadable(node_device_serial_number):
             device_serial_number = node_device_serial_number.GetValue()
-            print "Device serial number retrieved as %s..." % device_serial_number
-
-        # Retrieve, convert, and save images
-        for i in range(NUM_IMAGES):
-            try:
-                # Retrieve next received image and ensure image completion
-                image_result = cam.GetNextImage()
-
-                if image_result.IsIncomplete():
-                    print "Image incomplete with image status %s..." % image_result.GetImageStatus()
-
-                else:
+            print("Device serial number retrieved as %s..." % device_serial_number)
 
-                    # Print image information
-                    width = image_result.GetWidth()
-                    height = image_result.GetHeight()
-                    print "Grabbed Image %i, width = %i, height = %i" % (i, width, height)
+            if device_serial_number:
+                filename_template = "DeviceEvents-%s-%%i.jpg" % device_serial_number
 
-                    # Convert to mono8
-                    image_converted = image_result.Convert(PySpin.PixelFormat_Mono8, PySpin.HQ_LINEAR)
+        # Start saving thread
+        #
+        # *** NOTES ***
+        # Converting and saving an image takes considerably longer than
+        # retrieving it. Complete images are therefore handed to a separate
+        # thread through a bounded queue; once the queue is full, the
+        # acquisition loop waits for the saving thread to catch up.
+        image_queue = queue.Queue(maxsize=SAVE_QUEUE_SIZE)
+        save_errors = []
+        save_thread = threading.Thread(target=save_images, args=(image_queue, save_errors))
+        save_thread.start()
+
+        # Retrieve images and queue them to be converted and saved
+        try:
+            for i in range(NUM_IMAGES):
+                try:
+                    # Retrieve next received image and ensure image completion
+                    image_result = cam.GetNextImage()
+
+                    if image_result.IsIncomplete():
+                        log.info("Image incomplete with image status %s...", image_result.GetImageStatus())
+
+                        # Release image
+                        image_result.Release()
 
-                    if device_serial_number:
-                        filename = "DeviceEvents-%s-%i.jpg" % (device_serial_number, i)
                     else:
-                        filename = "DeviceEvents-%i.jpg" % i
 
-                    # Save image
-                    image_converted.Save(filename)
-                    print "Image saved at %s" % filename
-
-                # Release image
-                image_result.Release()
-                print ""
-
-            except PySpin.SpinnakerException as ex:
-                print "Error: %s" % ex
-                result = False
+                        # Print image information
+                        width = image_result.GetWidth()
+                        height = image_result.GetHeight()
+                        log.info("Grabbed Image %i, width = %i, height = %i", i, width, height)
+
+                        # Print exposure information embedded in the image
+                        if CHOSEN_EVENT == EventType.CHUNK_DATA:
+                            chunk_data = image_result.GetChunkData()
+                            log.info("\tFrame ID %i exposed for %f us at timestamp %i...",
+                                     chunk_data.GetFrameID(), chunk_data.GetExposureTime(),
+                                     chunk_data.GetTimestamp())
+
+                        filename = filename_template % i
+
+                        # Queue image; it is released by the saving thread
+                        if not queue_image(image_queue, (image_result, filename), save_thread):
+                            log.error("Saving thread stopped unexpectedly. Aborting...")
+                            image_result.Release()
+                            result = False
+                            break
+
+                except PySpin.SpinnakerException as ex:
+                    log.error("Error: %s", ex)
+                    result = False
+
+        finally:
+            # Wait for all queued images to be saved
+            #
+            # *** NOTES ***
+            # The saving thread is only waited for while it is running, so
+            # that a thread that has stopped cannot keep acquisition from
+            # being ended below.
+            if queue_image(image_queue, None, save_thread):
+                save_thread.join()
+
+        if save_errors:
+            result = False
 
         cam.EndAcquisition()
 
     except PySpin.SpinnakerException as ex:
-        print "Error: %s" % ex
+        print("Error: %s" % ex)
         result = False
 
     return result
@@ -389,22 +672,42 @@ def run_single_camera(cam):
         # Retrieve GenICam nodemap
         nodemap = cam.GetNodeMap()
 
-        # Configure device events
-        err, device_event_handler = configure_device_events(nodemap, cam)
-        if not err:
-            return err
+        if CHOSEN_EVENT == EventType.CHUNK_DATA:
+
+            # Configure chunk data; chunk mode is left inactive if this fails
+            if not configure_chunk_data(nodemap):
+                result = False
+
+            else:
+                # Acquire images
+                result &= acquire_images(cam, nodemap, nodemap_tldevice)
 
-        # Acquire images
-        result &= acquire_images(cam, nodemap, nodemap_tldevice)
+                # Reset chunk data
+                result &= reset_chunk_data(nodemap)
+
+        else:
+
+            # Configure device events
+            err, device_event_handler = configure_device_events(nodemap, cam)
+            if not err:
+                result = False
 
-        # Reset device events
-        result &= reset_device_events(cam, device_event_handler)
+            else:
+                # Acquire images
+                result &= acquire_images(cam, nodemap, nodemap_tldevice)
+
+                # Reset device events
+                result &= reset_device_events(cam, device_event_handler)
 
         # Deinitialize camera
+        #
+        # *** NOTES ***
+        # The camera is deinitialized whether or not configuration succeeded,
+        # rather than being left initialized by an early return.
         cam.DeInit()
 
     except PySpin.SpinnakerException as ex:
-        print "Error: %s" % ex.message
+        print("Error: %s" % ex)
         result = False
 
     return result
@@ -418,50 +721,59 @@ def main():
     :return: True if successful, False otherwise.
     :rtype: bool
     """
+    # Start writing logged messages to stdout
+    log_listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler(sys.stdout))
+    log_listener.start()
+
     # Retrieve singleton reference to system object
     system = PySpin.System.GetInstance()
 
     # Retrieve list of cameras from the system
     cam_list = system.GetCameras()
 
-    num_cameras = cam_list.GetSize()
-
-    print "Number of cameras detected: %d" % num_cameras
+    # Run example on each camera
+    #
+    # *** NOTES ***
+    # The camera list is cleared and the system released in the finally
+    # clause, so that camera handles are not left open if the example fails
+    # part way through.
+    cam = None
+    try:
+        result = True
 
-    # Finish if there are no cameras
-    if num_cameras == 0:
+        num_cameras = cam_list.GetSize()
 
-        # Clear camera list before releasing system
-        cam_list.Clear()
+        print("Number of cameras detected: %d" % num_cameras)
 
-        # Release system
-        system.ReleaseInstance()
+        # Finish if there are no cameras
+        if num_cameras == 0:
+            print("Not enough cameras!")
+            result = False
 
-        print "Not enough cameras!"
-        raw_input("Done! Press Enter to exit...")
-        return False
+        for i in range(num_cameras):
+            cam = cam_list.GetByIndex(i)
 
-    # Run example on each camera
-    for i in range(num_cameras):
-        cam = cam_list.GetByIndex(i)
+            print("Running example for camera %d..." % i)
 
-        print "Running example for camera %d..." % i
+            result &= run_single_camera(cam)
+            print("Camera %d example complete..." % i)
 
-        result = run_single_camera(cam)
-        print "Camera %d example complete..." % i
+    finally:
+        # Release reference to camera
+        # NOTE: Unlike the C++ examples, we cannot rely on pointer objects being automatically
+        # cleaned up when going out of scope.
+        del cam
 
-    # Release reference to camera
-    # NOTE: Unlike the C++ examples, we cannot rely on pointer objects being automatically
-    # cleaned up when going out of scope.
-    del cam
+        # Clear camera list before releasing system
+        cam_list.Clear()
 
-    # Clear camera list before releasing system
-    cam_list.Clear()
+        # Release instance
+        system.ReleaseInstance()
 
-    # Release instance
-    system.ReleaseInstance()
+        # Flush any remaining logged messages
+        log_listener.stop()
 
-    raw_input("Done! Press Enter to exit...")
+    input("Done! Press Enter to exit...")
     return result
 
 if __name__ == "__main__":
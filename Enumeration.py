@@ -68,10 +68,10 @@ def query_interface(interface):
         if PySpin.IsAvailable(node_interface_display_name) and PySpin.IsReadable(node_interface_display_name):
             interface_display_name = node_interface_display_name.GetValue()
 
-            print interface_display_name
+            print(interface_display_name)
 
         else:
-            print "Interface display name not readable"
+            print("Interface display name not readable")
 
         # Update list of cameras on the interface
         #
@@ -100,9 +100,18 @@ def query_interface(interface):
 
         # Return if no cameras detected
         if num_cams == 0:
-            print "\tNo devices detected.\n"
+            print("\tNo devices detected.\n")
             return result
 
+        # Bind node helpers locally for the camera loop below
+        #
+        # *** NOTES ***
+        # Local names are resolved faster than module attributes, which
+        # matters when an interface has many cameras attached.
+        IsAvailable = PySpin.IsAvailable
+        IsReadable = PySpin.IsReadable
+        CStringPtr = PySpin.CStringPtr
+
         # Print device vendor and model name for each camera on the interface
         for i in range(num_cams):
 
@@ -126,17 +135,17 @@ def query_interface(interface):
             # to its value's data type. Second, nodes should be checked for
             # availability and readability/writability prior to making an
             # attempt to read from or write to the node.
-            node_device_vendor_name = PySpin.CStringPtr(nodemap_tldevice.GetNode("DeviceVendorName"))
+            node_device_vendor_name = CStringPtr(nodemap_tldevice.GetNode("DeviceVendorName"))
 
-            if PySpin.IsAvailable(node_device_vendor_name) and PySpin.IsReadable(node_device_vendor_name):
+            if IsAvailable(node_device_vendor_name) and IsReadable(node_device_vendor_name):
                 device_vendor_name = node_device_vendor_name.ToString()
 
-            node_device_model_name = PySpin.CStringPtr(nodemap_tldevice.GetNode("DeviceModelName"))
+            node_device_model_name = CStringPtr(nodemap_tldevice.GetNode("DeviceModelName"))
 
-            if PySpin.IsAvailable(node_device_model_name) and PySpin.IsReadable(node_device_model_name):
+            if IsAvailable(node_device_model_name) and IsReadable(node_device_model_name):
                 device_model_name = node_device_model_name.ToString()
 
-            print "\tDevice %i %s %s \n" % (i, device_vendor_name, device_model_name)
+            print("\tDevice %i %s %s \n" % (i, device_vendor_name, device_model_name))
 
         # Clear camera list before losing scope
         #
@@ -148,7 +157,7 @@ def query_interface(interface):
         cam_list.Clear()
 
     except PySpin.SpinnakerException as ex:
-        print "Error: %s" % ex
+        print("Error: %s" % ex)
         result = False
 
     return result
@@ -186,11 +195,6 @@ def main():
     # releasing the system and while the interface list is still in scope.
     interface_list = system.GetInterfaces()
 
-    # Get number of interfaces
-    num_interfaces = interface_list.GetSize()
-
-    print "Number of interfaces detected: %i" % num_interfaces
-
     # Retrieve list of cameras from the system
     #
     # *** NOTES ***
@@ -203,65 +207,70 @@ def main():
     # releasing the system and while the camera list is still in scope.
     cam_list = system.GetCameras()
 
-    num_cams = cam_list.GetSize()
-
-    print "Number of cameras detected: %i" % num_cams
-
-    # Finish if there are no cameras
-    if num_cams == 0 or num_interfaces == 0:
+    # Query interfaces
+    #
+    # *** NOTES ***
+    # The lists are cleared and the system released in the finally clause,
+    # so that they are released even if querying an interface fails.
+    interface = None
+    try:
+        # Get number of interfaces
+        num_interfaces = interface_list.GetSize()
 
-        # Clear camera list before releasing system
-        cam_list.Clear()
+        print("Number of interfaces detected: %i" % num_interfaces)
 
-        # Clear interface list before releasing system
-        interface_list.Clear()
+        num_cams = cam_list.GetSize()
 
-        # Release system
-        system.ReleaseInstance()
+        print("Number of cameras detected: %i" % num_cams)
 
-        print "Not enough cameras!"
-        raw_input("Done! Press Enter to exit...")
+        # Finish if there are no cameras
+        if num_cams == 0 or num_interfaces == 0:
+            print("Not enough cameras!")
+            result = False
 
-    print "\n*** QUERYING INTERFACES ***\n"
+        else:
+            print("\n*** QUERYING INTERFACES ***\n")
 
-    for i in range(num_interfaces):
+            for i in range(num_interfaces):
 
-        # Select interface
-        #
-        # *** LATER ***
-        # Interfaces have to be manually deleted before the system gets released.
-        # Unlike C++, the interface will not be destroyed when it goes out of the scope of this for loop;
-        # instead, it gets garbage-collected at the end of main().
-        interface = interface_list[i]
+                # Select interface
+                #
+                # *** LATER ***
+                # Interfaces have to be manually deleted before the system gets released.
+                # Unlike C++, the interface will not be destroyed when it goes out of the scope of this for loop;
+                # instead, it gets garbage-collected at the end of main().
+                interface = interface_list[i]
 
-        # Query interface
-        result &= query_interface(interface)
+                # Query interface
+                result &= query_interface(interface)
 
-    # Release interface
-    del interface
+    finally:
+        # Release interface
+        del interface
 
-    # Clear camera list before releasing system
-    #
-    # *** NOTES ***
-    # Camera lists must be cleared manually prior to a system release call.
-    cam_list.Clear()
+        # Clear camera list before releasing system
+        #
+        # *** NOTES ***
+        # Camera lists must be cleared manually prior to a system release call.
+        cam_list.Clear()
 
-    # Clear interface list before releasing system
-    #
-    # *** NOTES ***
-    # Interface lists must be cleared manually prior to a system release call.
-    interface_list.Clear()
+        # Clear interface list before releasing system
+        #
+        # *** NOTES ***
+        # Interface lists must be cleared manually prior to a system release call.
+        interface_list.Clear()
 
-    # Release system
-    #
-    # *** NOTES ***
-    # The system should be released, but if it is not, it will do so itself.
-    # It is often at the release of the system (whether manual or automatic)
-    # that unreleased resources and still-registered events will throw an
-    # exception.
-    system.ReleaseInstance()
+        # Release system
+        #
+        # *** NOTES ***
+        # The system should be released, but if it is not, it will do so itself.
+        # It is often at the release of the system (whether manual or automatic)
+        # that unreleased resources and still-registered events will throw an
+        # exception.
+        system.ReleaseInstance()
 
-    raw_input("Done! Press Enter to exit...")
+    input("Done! Press Enter to exit...")
+    return result
 
 if __name__ == "__main__":
     main()
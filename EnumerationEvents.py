@@ -27,8 +27,49 @@
 #   while the parent classes - ArrivalEvent, RemovalEvent, and InterfaceEvent -
 #   allow the child classes to interface with Spinnaker.
 
+import os
+import sys
+import threading
+import time
+
 import PySpin
 
+DEBOUNCE_DELAY = 0.01  # seconds to wait for further system events before printing the camera count
+DEBOUNCE_MAX_DELAY = 0.1  # maximum number of seconds a burst of system events may delay the camera count
+REGISTER_INTERFACE_EVENTS = False  # also register an event handler to each interface
+
+
+def write_message(message):
+    """
+    Writes a message from an event handler to standard output. The message is
+    written straight to the file descriptor of sys.stdout, bypassing its text
+    layer, so that a burst of events does not hold up the thread delivering
+    them. Where sys.stdout has no file descriptor (e.g. IDLE or Jupyter), the
+    message is written to sys.stdout instead; where there is no sys.stdout at
+    all (pythonw), it is dropped.
+
+    :param message: Message to write.
+    :type message: str
+    :rtype: None
+    """
+    if sys.stdout is None:
+        return
+
+    # Write out anything already printed first, so that the output stays in order
+    sys.stdout.flush()
+
+    try:
+        fd = sys.stdout.fileno()
+    except (AttributeError, OSError, ValueError):
+        sys.stdout.write(message)
+        return
+
+    # os.write() may write less than it is given, so write until all data
+    # has been written
+    view = memoryview(message.encode())
+    while view:
+        view = view[os.write(fd, view):]
+
 
 class InterfaceEventHandler(PySpin.InterfaceEvent):
     """
@@ -36,18 +77,28 @@ class InterfaceEventHandler(PySpin.InterfaceEvent):
     on an interface. Take special note of the signatures of the OnDeviceArrival()
     and OnDeviceRemoval() methods. Also, enumeration events must inherit from
     InterfaceEvent whether they are to be registered to the system or an interface.
+
+    Arrival and removal callbacks are only given the serial number of the camera,
+    not the interface that raised them, so one handler is still needed per
+    interface. The handler only keeps the interface number, however, so that it
+    holds no reference to the interface itself.
     """
-    def __init__(self, iface, iface_num):
+    def __init__(self, iface_num):
         """
-        Constructor. Note that this sets the interface instance.
+        Constructor. Note that this sets the interface number.
 
-        :param iface: Interface instance.
         :param iface_num: Interface number.
         """
-        super(InterfaceEventHandler, self).__init__()
-        self.interface = iface
+        super().__init__()
         self.interface_num = iface_num
 
+        # Messages are formatted with the interface number once; each event
+        # then only substitutes the serial number.
+        self._arrival_template = ("Interface event handler:\n"
+                                  "\tDevice %%i has arrived on interface %i.\n" % iface_num)
+        self._removal_template = ("Interface event handler:\n"
+                                  "\tDevice %%i was removed from interface %i.\n" % iface_num)
+
     def OnDeviceArrival(self, serial_number):
         """
         This method defines the arrival event on an interface. It prints out
@@ -59,8 +110,7 @@ class InterfaceEventHandler(PySpin.InterfaceEvent):
         :type serial_number: gcstring
         :return: None
         """
-        print "Interface event handler:"
-        print "\tDevice %i has arrived on interface %i." % (serial_number, self.interface_num)
+        write_message(self._arrival_template % serial_number)
         
     def OnDeviceRemoval(self, serial_number):
         """
@@ -73,8 +123,7 @@ class InterfaceEventHandler(PySpin.InterfaceEvent):
         :type serial_number: gcstring
         :return: None
         """
-        print "Interface event handler:"
-        print "\tDevice %i was removed from interface %i." % (serial_number, self.interface_num)
+        write_message(self._removal_template % serial_number)
     
     
 class SystemEventHandler(PySpin.InterfaceEvent):
@@ -94,41 +143,189 @@ class SystemEventHandler(PySpin.InterfaceEvent):
         :type system: SystemPtr
         :rtype: None
         """
-        super(SystemEventHandler, self).__init__()
+        super().__init__()
         self.system = system
+        self._cam_list = None
+        self._dirty = True
+        self._lock = threading.Lock()
+        self._pending = None
+        self._first_event_ts = None
+        self._closed = False
+
+        # Wording of the camera count, indexed by whether there is exactly one camera
+        self._count_words = (("are", "devices"), ("is", "device"))
+
+    def _get_count(self):
+        """
+        This method returns the number of cameras on the system. The camera
+        list is only retrieved again if a device has arrived or been removed
+        since the last retrieval.
+
+        :return: Number of cameras on the system.
+        :rtype: int
+        """
+        if self._dirty:
+
+            # Clear previous camera list before retrieving a new one
+            if self._cam_list is not None:
+                self._cam_list.Clear()
+
+            self._cam_list = self.system.GetCameras()
+            self._dirty = False
+
+        return self._cam_list.GetSize()
+
+    def _schedule(self):
+        """
+        This method schedules the camera count to be printed. Plugging in a hub
+        or dock produces a burst of events in quick succession; each event
+        restarts a DEBOUNCE_DELAY timer so that the whole burst results in a
+        single enumeration of the system. A burst is never allowed to delay the
+        count by more than DEBOUNCE_MAX_DELAY.
+
+        :rtype: None
+        """
+        with self._lock:
+            if self._closed:
+                return
+
+            self._dirty = True
+
+            if self._pending is not None:
+                self._pending.cancel()
+                self._pending = None
+
+            now = time.monotonic()
+            if self._first_event_ts is None:
+                self._first_event_ts = now
+
+            overdue = now - self._first_event_ts > DEBOUNCE_MAX_DELAY
+            if not overdue:
+                self._pending = threading.Timer(DEBOUNCE_DELAY, self._flush)
+                self._pending.start()
+
+        if overdue:
+            self._flush()
+
+    def _flush(self):
+        """
+        This method retrieves the number of cameras currently connected and
+        prints it out once a burst of events has settled.
+
+        :rtype: None
+        """
+        with self._lock:
+
+            # A timer that had already fired when clear_camera_list() cancelled
+            # it must not retrieve a new camera list afterwards
+            if self._closed:
+                return
+
+            self._pending = None
+            self._first_event_ts = None
+            count = self._get_count()
+
+        verb, noun = self._count_words[count == 1]
+        write_message("System event handler:\n\tThere %s %i %s on the system.\n" % (verb, count, noun))
+
+    def clear_camera_list(self):
+        """
+        This method cancels any pending camera count and clears the cached
+        camera list. It must be called before the system is released; no
+        camera count is printed after it has been called.
+
+        :rtype: None
+        """
+        with self._lock:
+            self._closed = True
+
+            pending = self._pending
+            if pending is not None:
+                pending.cancel()
+                self._pending = None
+
+            self._first_event_ts = None
+
+            if self._cam_list is not None:
+                self._cam_list.Clear()
+                self._cam_list = None
+
+            self._dirty = True
+
+        # Wait for a timer that has already fired to finish; this is done
+        # without holding the lock, which the timer needs in order to return
+        if pending is not None:
+            pending.join()
 
     def OnDeviceArrival(self, serial_number):
         """
-        This method defines the arrival event on the system. It retrieves the
-        number of cameras currently connected and prints it out.
+        This method defines the arrival event on the system. It schedules the
+        number of cameras currently connected to be printed out.
 
         :param serial_number: gcstring representing the serial number of the arriving camera.
         :type serial_number: gcstring
         :return: None
         """
-        cam_list = self.system.GetCameras()
-        count = cam_list.GetSize()
-        print "System event handler:"
-        print "\tThere %s %i %s on the system." % ("is" if count == 1 else "are",
-                                                   count,
-                                                   "device" if count == 1 else "devices")
+        self._schedule()
 
     def OnDeviceRemoval(self, serial_number):
         """
         This method defines the removal event on the system. It does the same
-        as the system arrival event - it retrieves the number of cameras
-        currently connected and prints it out.
+        as the system arrival event - it schedules the number of cameras
+        currently connected to be printed out.
 
         :param serial_number: gcstring representing the serial number of the removed camera.
         :type serial_number: gcstring
         :return: None
         """
-        cam_list = self.system.GetCameras()
-        count = cam_list.GetSize()
-        print "System event handler:"
-        print "\tThere %s %i %s on the system." % ("is" if count == 1 else "are",
-                                                   count,
-                                                   "device" if count == 1 else "devices")
+        self._schedule()
+
+
+def configure_interface_events(ifaces):
+    """
+    This function creates an interface event for each interface and registers
+    it to that interface.
+
+    Registration happens in this function, rather than in main(), so that the
+    loop's references to the last interface and interface event are released
+    when it returns instead of having to be deleted manually.
+
+    :param ifaces: Interfaces to register interface events to.
+    :type ifaces: list
+    :return: (interface, interface event) pair for every registration.
+    :rtype: list
+    """
+    interface_registrations = []
+
+    for i, iface in enumerate(ifaces):
+
+        # Create interface event
+        iface_event_handler = InterfaceEventHandler(i)
+
+        # Register interface event
+        iface.RegisterEvent(iface_event_handler)
+        interface_registrations.append((iface, iface_event_handler))
+
+        print("Event handler registered to interface %i ..." % i)
+
+    return interface_registrations
+
+
+def reset_interface_events(interface_registrations):
+    """
+    This function unregisters each interface event from its interface and
+    then drops the references to both.
+
+    :param interface_registrations: Pairs returned by configure_interface_events().
+    :type interface_registrations: list
+    :rtype: None
+    """
+    for iface, iface_event_handler in interface_registrations:
+        iface.UnregisterEvent(iface_event_handler)
+
+    interface_registrations.clear()
+
+    print("Event handler unregistered from interfaces...")
 
 
 def main():
@@ -146,16 +343,43 @@ def main():
     
     num_cams = cam_list.GetSize()
     
-    print "Number of cameras detected: %i" % num_cams
+    print("Number of cameras detected: %i" % num_cams)
 
     # Retrieve list of interfaces from the system
     interface_list = system.GetInterfaces()
 
     num_ifaces = interface_list.GetSize()
 
-    print "Number of interfaces detected: %i" % num_ifaces
+    print("Number of interfaces detected: %i" % num_ifaces)
+
+    # Finish if there are no interfaces or cameras
+    #
+    # *** NOTES ***
+    # With nothing on the system, there is nothing to register events to.
+    if num_ifaces == 0 and num_cams == 0:
+
+        # Clear camera list before releasing system
+        cam_list.Clear()
+
+        # Clear interface list before releasing system
+        interface_list.Clear()
+
+        # Release system
+        system.ReleaseInstance()
+
+        print("No interfaces or cameras detected!")
+        input("Done! Press Enter to exit...")
+        return
+
+    # Retrieve each interface once
+    #
+    # *** NOTES ***
+    # The interfaces are kept in a Python list for the rest of the example;
+    # the interface list itself is only kept so that it can be cleared before
+    # the system is released.
+    ifaces = [interface_list[i] for i in range(num_ifaces)]
 
-    print "*** CONFIGURING ENUMERATION EVENTS *** \n"
+    print("*** CONFIGURING ENUMERATION EVENTS *** \n")
 
     # Create interface event for the system
     #
@@ -183,47 +407,35 @@ def main():
     # *** NOTES ***
     # The process of event creation and registration on interfaces is similar
     # to the process of event creation and registration on the system. The
-    # class for interfaces has been constructed to accept an interface and an
-    # interface number (this is just to separate the interfaces).
+    # class for interfaces has been constructed to accept an interface
+    # number (this is just to separate the interfaces).
+    #
+    # Every arrival or removal is reported both to the system event and to
+    # the event of the interface concerned. When only the number of cameras
+    # on the system is of interest, the interface events are unnecessary and
+    # are only registered if REGISTER_INTERFACE_EVENTS is set.
     #
     # *** LATER ***
     # Arrival, removal, and interface events must all be unregistered manually.
     # This must be done prior to releasing the system and while they are still
     # in scope.
-    interface_events = []
-
-    for i in range(num_ifaces):
-
-        # Select interface
-        iface = interface_list[i]
-
-        # Create interface event
-        iface_event_handler = InterfaceEventHandler(iface, i)
-        interface_events.append(iface_event_handler)
-
-        # Register interface event
-        iface.RegisterEvent(interface_events[i])
-
-        print "Event handler registered to interface %i ..." % i
-
-    # Delete references to interface
-    del iface
-    del iface_event_handler
+    interface_registrations = []
+    if REGISTER_INTERFACE_EVENTS:
+        interface_registrations = configure_interface_events(ifaces)
 
     # Wait for user to plug in and/or remove camera devices
-    raw_input("\nReady! Remove/Plug in cameras to test or press Enter to exit...\n")
+    input("\nReady! Remove/Plug in cameras to test or press Enter to exit...\n")
 
     # Unregister interface event from each interface
     #
     # *** NOTES ***
     # It is important to unregister all arrival, removal, and interface events
     # from all interfaces that they may be registered to.
-    for i in range(num_ifaces):
-        interface_list[i].UnregisterEvent(interface_events[i])
+    if interface_registrations:
+        reset_interface_events(interface_registrations)
 
-    # Delete all interface events, which each have a reference to an interface
-    del interface_events
-    print "Event handler unregistered from interfaces..."
+    # Delete references to interfaces
+    del ifaces
 
     # Unregister system event from system object
     #
@@ -232,9 +444,12 @@ def main():
     # registered to the system.
     system.UnregisterInterfaceEvent(system_event_handler)
 
+    # Clear camera list cached by the system event
+    system_event_handler.clear_camera_list()
+
     # Delete system event, which has a system reference
     del system_event_handler
-    print "Event handler unregistered from system..."
+    print("Event handler unregistered from system...")
 
     # Clear camera list before releasing system
     cam_list.Clear()
@@ -245,7 +460,7 @@ def main():
     # Release system
     system.ReleaseInstance()
 
-    raw_input("Done! Press Enter to exit...")
+    input("Done! Press Enter to exit...")
 
 if __name__ == "__main__":
     main()
@@ -58,10 +58,10 @@ def query_interface(interface):
 
             interface_display_name = node_interface_display_name.GetValue()
 
-            print interface_display_name
+            print(interface_display_name)
 
         else:
-            print "Interface display name not readable"
+            print("Interface display name not readable")
 
         # Update list of cameras on the interface
         #
@@ -90,18 +90,19 @@ def query_interface(interface):
 
         # Return if no cameras detected
         if num_cams == 0:
-            print "\tNo devices detected.\n"
+            print("\tNo devices detected.\n")
             return True
 
-        # Print device vendor and model name for each camera on the interface
-        for i in range(num_cams):
+        # Select cameras
+        #
+        # *** NOTES ***
+        # Each camera is retrieved from a camera list with an index. If
+        # the index is out of range, an exception is thrown. Each camera is
+        # retrieved once and kept in a Python list for the loop below.
+        cams = [cam_list[i] for i in range(num_cams)]
 
-            # Select camera
-            #
-            # *** NOTES ***
-            # Each camera is retrieved from a camera list with an index. If
-            # the index is out of range, an exception is thrown.
-            cam = cam_list[i]
+        # Print device vendor and model name for each camera on the interface
+        for i, cam in enumerate(cams):
 
             # Print device vendor name and device model name
             #
@@ -120,13 +121,20 @@ def query_interface(interface):
             # Readability/writability should be checked prior to interacting with
             # nodes. Readability and writability are ensured by checking the
             # access mode or by using the methods
-            if cam.TLDevice.DeviceVendorName.GetAccessMode() == PySpin.RO:
-                device_vendor_name = cam.TLDevice.DeviceVendorName.ToString()
+            #
+            # Each attribute access on a QuickSpin property crosses into the
+            # SDK, so the nodes are retrieved once and reused.
+            tl_device = cam.TLDevice
+            node_device_vendor_name = tl_device.DeviceVendorName
+            node_device_model_name = tl_device.DeviceModelName
+
+            if node_device_vendor_name.GetAccessMode() == PySpin.RO:
+                device_vendor_name = node_device_vendor_name.ToString()
 
-            if cam.TLDevice.DeviceModelName.GetAccessMode() == PySpin.RO:
-                device_model_name = cam.TLDevice.DeviceModelName.GetValue()
+            if node_device_model_name.GetAccessMode() == PySpin.RO:
+                device_model_name = node_device_model_name.GetValue()
 
-            print "\tDevice %i %s %s \n" % (i, device_vendor_name, device_model_name)
+            print("\tDevice %i %s %s \n" % (i, device_vendor_name, device_model_name))
 
         # Clear camera list before losing scope
         #
@@ -137,7 +145,7 @@ def query_interface(interface):
         cam_list.Clear()
 
     except PySpin.SpinnakerException as ex:
-        print "Error: %s" % ex
+        print("Error: %s" % ex)
         result = False
 
     return result
@@ -178,7 +186,7 @@ def main():
     # Get number of interfaces
     num_interfaces = interface_list.GetSize()
 
-    print "Number of interfaces detected: %i" % num_interfaces
+    print("Number of interfaces detected: %i" % num_interfaces)
 
     # Retrieve list of cameras from the system
     #
@@ -194,7 +202,7 @@ def main():
 
     num_cams = cam_list.GetSize()
 
-    print "Number of cameras detected: %i" % num_cams
+    print("Number of cameras detected: %i" % num_cams)
 
     # Finish if there are no cameras
     if num_cams == 0 or num_interfaces == 0:
@@ -208,26 +216,32 @@ def main():
         # Release system
         system.ReleaseInstance()
 
-        print "Not enough cameras!"
-        raw_input("Done! Press Enter to exit...")
+        print("Not enough cameras!")
+        input("Done! Press Enter to exit...")
+        return False
 
-    print "\n*** QUERYING INTERFACES ***\n"
+    print("\n*** QUERYING INTERFACES ***\n")
 
-    for i in range(num_interfaces):
+    # Select interfaces
+    #
+    # *** NOTES ***
+    # Each interface is retrieved from the interface list once and kept in a
+    # Python list, rather than indexing the interface list again later.
+    #
+    # *** LATER ***
+    # Interfaces have to be manually deleted before the system gets released.
+    # Unlike C++, the interfaces will not be destroyed when they go out of the scope of this for loop;
+    # instead, they get garbage-collected at the end of main().
+    interfaces = [interface_list[i] for i in range(num_interfaces)]
 
-        # Select interface
-        #
-        # *** LATER ***
-        # Interfaces have to be manually deleted before the system gets released.
-        # Unlike C++, the interface will not be destroyed when it goes out of the scope of this for loop;
-        # instead, it gets garbage-collected at the end of main().
-        interface = interface_list[i]
+    for interface in interfaces:
 
         # Query interface
         result &= query_interface(interface)
 
-    # Release interface
+    # Release interfaces
     del interface
+    del interfaces
 
     # Clear camera list before releasing system
     #
@@ -250,7 +264,8 @@ def main():
     # exception.
     system.ReleaseInstance()
 
-    raw_input("Done! Press Enter to exit...")
+    input("Done! Press Enter to exit...")
+    return result
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -30,9 +30,112 @@
 #  demonstrate node access and to get started with the API; please see full
 #  Spinnaker examples for further or specific knowledge on a topic.
 
+import logging
+import logging.handlers
+import queue
+import sys
+import threading
+
 import PySpin
 
+try:
+    from PIL import Image as PILImage
+except ImportError:
+    PILImage = None
+
 NUM_IMAGES = 5  # number of images to save
+SAVE_QUEUE_SIZE = 4  # number of grabbed images that may wait to be saved
+STREAM_BUFFER_COUNT = 20  # number of buffers the SDK may fill before images are dropped
+MAX_WAIT_DURATION = 60  # maximum amount of time (in seconds) to wait for NUM_IMAGES images to be queued
+SAVE_TO_AVI = False  # append images to a single MJPG AVI file rather than saving them as JPEG files
+CHUNK_SELECTOR_ENTRIES = (PySpin.ChunkSelector_FrameID, PySpin.ChunkSelector_ExposureTime,
+                          PySpin.ChunkSelector_Timestamp)  # chunks sent along with every image
+
+# Messages from the image event handler and the saving thread are logged
+# through a queue; a listener started in main() writes them to stdout on its
+# own thread.
+log_queue = queue.Queue(-1)
+log = logging.getLogger("Exposure_QuickSpin")
+log.setLevel(logging.INFO)
+log.propagate = False
+log.addHandler(logging.handlers.QueueHandler(log_queue))
+
+
+class ImageEventHandler(PySpin.ImageEvent):
+    """
+    This class queues complete images to be saved as the SDK delivers them,
+    until NUM_IMAGES images have been queued. Images passed to OnImageEvent()
+    are released by the SDK once it returns, so each is copied before it is
+    queued.
+    """
+
+    def __init__(self, image_queue, filename_template, chunk_data_active):
+        """
+        Constructor. Sets image counter to 0.
+
+        :param image_queue: Queue of (image, filename) tuples to save.
+        :param filename_template: Filename with a %d placeholder for the image number.
+        :param chunk_data_active: Whether images carry chunk data to print.
+        :type image_queue: queue.Queue
+        :type filename_template: str
+        :type chunk_data_active: bool
+        :rtype: None
+        """
+        super().__init__()
+
+        self._image_queue = image_queue
+        self._filename_template = filename_template
+        self._chunk_data_active = chunk_data_active
+        self._image_count = 0
+        self._done = threading.Event()
+
+    def OnImageEvent(self, image):
+        """
+        This method defines an image event. In it, a copy of the image that
+        triggered the event is queued to be saved before incrementing the count.
+
+        :param image: Image from event.
+        :type image: ImagePtr
+        :rtype: None
+        """
+        if self._done.is_set():
+            return
+
+        if image.IsIncomplete():
+            log.info("Image incomplete with image status %d...", image.GetImageStatus())
+            return
+
+        # Print image information
+        width = image.GetWidth()
+        height = image.GetHeight()
+        log.info("Grabbed Image %d, width = %d, height = %d", self._image_count, width, height)
+
+        # Print exposure information sent along with the image
+        if self._chunk_data_active:
+            chunk_data = image.GetChunkData()
+            log.info("\tFrame ID %d exposed for %f us at timestamp %d",
+                     chunk_data.GetFrameID(), chunk_data.GetExposureTime(), chunk_data.GetTimestamp())
+
+        # Queue a copy of the image to be saved
+        image_copy = PySpin.Image.Create(width, height, image.GetXOffset(), image.GetYOffset(),
+                                         image.GetPixelFormat(), image.GetNDArray())
+        self._image_queue.put((image_copy, self._filename_template % self._image_count))
+
+        # Increment image counter
+        self._image_count += 1
+        if self._image_count == NUM_IMAGES:
+            self._done.set()
+
+    def wait(self, timeout):
+        """
+        Blocks until NUM_IMAGES images have been queued, or the timeout expires.
+
+        :param timeout: Maximum amount of time to wait, in seconds.
+        :type timeout: float
+        :return: True if all images have been queued, False if the timeout expired.
+        :rtype: bool
+        """
+        return self._done.wait(timeout)
 
 
 def configure_exposure(cam):
@@ -47,7 +150,7 @@ def configure_exposure(cam):
      :rtype: bool
     """
 
-    print "*** CONFIGURING EXPOSURE ***\n"
+    print("*** CONFIGURING EXPOSURE ***\n")
 
     try:
         result = True
@@ -70,12 +173,13 @@ def configure_exposure(cam):
         # example turns automatic exposure off to set it manually and back
         # on to return the camera to its default state.
 
-        if cam.ExposureAuto.GetAccessMode() != PySpin.RW:
-            print "Unable to disable automatic exposure. Aborting..."
+        exposure_auto = cam.ExposureAuto
+        if exposure_auto.GetAccessMode() != PySpin.RW:
+            print("Unable to disable automatic exposure. Aborting...")
             return False
 
-        cam.ExposureAuto.SetValue(PySpin.ExposureAuto_Off)
-        print "Automatic exposure disabled..."
+        exposure_auto.SetValue(PySpin.ExposureAuto_Off)
+        print("Automatic exposure disabled...")
 
         # Set exposure time manually; exposure time recorded in microseconds
         #
@@ -85,21 +189,31 @@ def configure_exposure(cam):
         # writability are ensured by checking the access mode.
         #
         # Further, it is ensured that the desired exposure time does not exceed
-        # the maximum. Exposure time is counted in microseconds - this can be
-        # found out either by retrieving the unit with the GetUnit() method or
-        # by checking SpinView.
-
-        if cam.ExposureTime.GetAccessMode() != PySpin.RW:
-            print "Unable to set exposure time. Aborting..."
+        # the maximum. Rather than retrieving the maximum from the camera
+        # beforehand, the desired exposure time is set directly; only if the
+        # camera rejects it is the maximum retrieved and set instead.
+        # Exposure time is counted in microseconds - this can be found out
+        # either by retrieving the unit with the GetUnit() method or by
+        # checking SpinView.
+
+        exposure_time = cam.ExposureTime
+        if exposure_time.GetAccessMode() != PySpin.RW:
+            print("Unable to set exposure time. Aborting...")
             return False
 
         # Ensure desired exposure time does not exceed the maximum
         exposure_time_to_set = 2000000.0
-        exposure_time_to_set = min(cam.ExposureTime.GetMax(), exposure_time_to_set)
-        cam.ExposureTime.SetValue(exposure_time_to_set)
+        try:
+            exposure_time.SetValue(exposure_time_to_set)
+
+        except PySpin.SpinnakerException:
+            exposure_time_to_set = exposure_time.GetMax()
+            exposure_time.SetValue(exposure_time_to_set)
+
+        print("Exposure time set to %s us..." % exposure_time_to_set)
 
     except PySpin.SpinnakerException as ex:
-        print "Error: %s" % ex
+        print("Error: %s" % ex)
         result = False
 
     return result
@@ -124,15 +238,15 @@ def reset_exposure(cam):
         # default state.
 
         if cam.ExposureAuto.GetAccessMode() != PySpin.RW:
-            print "Unable to enable automatic exposure (node retrieval). Non-fatal error..."
+            print("Unable to enable automatic exposure (node retrieval). Non-fatal error...")
             return False
 
         cam.ExposureAuto.SetValue(PySpin.ExposureAuto_Continuous)
 
-        print "Automatic exposure enabled..."
+        print("Automatic exposure enabled...")
 
     except PySpin.SpinnakerException as ex:
-        print "Error: %s" % ex
+        print("Error: %s" % ex)
         result = False
 
     return result
@@ -150,7 +264,7 @@ def print_device_info(cam):
     :rtype: bool
     """
 
-    print "*** DEVICE INFORMATION ***\n"
+    print("*** DEVICE INFORMATION ***\n")
 
     try:
         result = True
@@ -162,93 +276,392 @@ def print_device_info(cam):
             features = node_device_information.GetFeatures()
             for feature in features:
                 node_feature = PySpin.CValuePtr(feature)
-                print "%s: %s" % (node_feature.GetName(),
-                                  node_feature.ToString() if PySpin.IsReadable(node_feature) else "Node not readable")
+                print("%s: %s" % (node_feature.GetName(),
+                                  node_feature.ToString() if PySpin.IsReadable(node_feature) else "Node not readable"))
 
         else:
-            print "Device control information not available."
+            print("Device control information not available.")
 
     except PySpin.SpinnakerException as ex:
-        print "Error: %s" % ex.message
+        print("Error: %s" % ex)
         return False
 
     return result
 
 
-def acquire_images(cam):
+def configure_chunk_data(cam):
+    """
+    This function configures the camera to send the frame ID, exposure time
+    and timestamp of each image along with the image as chunk data, so that
+    they can be read from the image instead of from the camera's nodes.
+
+    :param cam: Camera to configure chunk data for.
+    :type cam: CameraPtr
+    :return: True if successful, False otherwise.
+    :rtype: bool
+    """
+    try:
+        result = True
+
+        # Check chunk nodes
+        #
+        # *** NOTES ***
+        # Both nodes are checked before either is written, so that chunk mode
+        # is never left active when chunks cannot be selected; the caller
+        # only resets chunk data when this function succeeds.
+        chunk_selector = cam.ChunkSelector
+        chunk_enable = cam.ChunkEnable
+        if cam.ChunkModeActive.GetAccessMode() != PySpin.RW:
+            print("Unable to activate chunk mode. Non-fatal error...")
+            return False
+
+        if chunk_selector.GetAccessMode() != PySpin.RW:
+            print("Unable to select chunks. Non-fatal error...")
+            return False
+
+        # Activate chunk mode
+        cam.ChunkModeActive.SetValue(True)
+        print("Chunk mode activated...")
+
+        # Enable chunks
+        #
+        # *** NOTES ***
+        # Each chunk is selected on the chunk selector and then enabled.
+        for chunk in CHUNK_SELECTOR_ENTRIES:
+            chunk_selector.SetValue(chunk)
+
+            if chunk_enable.GetAccessMode() != PySpin.RW:
+
+                # Skip if node fails
+                result = False
+                continue
+
+            chunk_enable.SetValue(True)
+
+    except PySpin.SpinnakerException as ex:
+        print("Error: %s" % ex)
+        result = False
+
+    # Deactivate chunk mode again if any chunk could not be enabled
+    if not result:
+        reset_chunk_data(cam)
+
+    return result
+
+
+def reset_chunk_data(cam):
+    """
+    This function returns the camera to a normal state by deactivating chunk mode.
+
+    :param cam: Camera to reset chunk data on.
+    :type cam: CameraPtr
+    :return: True if successful, False otherwise.
+    :rtype: bool
+    """
+    try:
+        result = True
+
+        if cam.ChunkModeActive.GetAccessMode() != PySpin.RW:
+            print("Unable to deactivate chunk mode. Non-fatal error...")
+            return False
+
+        cam.ChunkModeActive.SetValue(False)
+        print("Chunk mode deactivated...")
+
+    except PySpin.SpinnakerException as ex:
+        print("Error: %s" % ex)
+        result = False
+
+    return result
+
+
+def configure_stream_buffers(cam):
+    """
+    This function raises the number of stream buffers and has them handled
+    oldest first, so that images are queued rather than dropped when the
+    application briefly falls behind the camera.
+
+    :param cam: Camera to configure stream buffers for.
+    :type cam: CameraPtr
+    :return: True if successful, False otherwise.
+    :rtype: bool
+    """
+    try:
+        result = True
+
+        # Set stream buffer count manually
+        #
+        # *** NOTES ***
+        # Stream buffer nodes belong to the transport layer stream, which
+        # QuickSpin makes available through the camera's TLStream property.
+        if cam.TLStream.StreamBufferCountMode.GetAccessMode() != PySpin.RW \
+                or cam.TLStream.StreamBufferCountManual.GetAccessMode() != PySpin.RW:
+            print("Unable to set stream buffer count. Non-fatal error...")
+            return False
+
+        cam.TLStream.StreamBufferCountMode.SetValue(PySpin.StreamBufferCountMode_Manual)
+
+        buffer_count = min(cam.TLStream.StreamBufferCountManual.GetMax(), STREAM_BUFFER_COUNT)
+        cam.TLStream.StreamBufferCountManual.SetValue(buffer_count)
+        print("Stream buffer count set to %d..." % buffer_count)
+
+        # Handle stream buffers oldest first
+        if cam.TLStream.StreamBufferHandlingMode.GetAccessMode() != PySpin.RW:
+            print("Unable to set stream buffer handling mode. Non-fatal error...")
+            return False
+
+        cam.TLStream.StreamBufferHandlingMode.SetValue(PySpin.StreamBufferHandlingMode_OldestFirst)
+        print("Stream buffer handling mode set to oldest first...")
+
+    except PySpin.SpinnakerException as ex:
+        print("Error: %s" % ex)
+        result = False
+
+    return result
+
+
+def save_images(image_queue, errors):
+    """
+    This function converts and saves the images placed on the queue by
+    acquire_images() until it receives None. It runs on its own thread so
+    that conversion and saving do not hold up the retrieval of the next image.
+
+    :param image_queue: Queue of (image, filename) tuples to save.
+    :param errors: List to which any exceptions raised while saving are appended.
+    :type image_queue: queue.Queue
+    :type errors: list
+    :rtype: None
+    """
+    # Create destination image for conversions
+    #
+    # *** NOTES ***
+    # Converting into an existing image reuses its buffer instead of
+    # allocating a new image for every image converted. The buffer is
+    # allocated by the first conversion and reused after that, since all
+    # images in an acquisition have the same size.
+    image_mono8 = PySpin.Image.Create()
+
+    while True:
+        item = image_queue.get()
+        if item is None:
+            break
+
+        image_result, filename = item
+        try:
+            # Convert image to Mono8, unless it already is
+            #
+            # *** NOTES ***
+            # The camera's pixel format is left as it is; images from a camera
+            # that already delivers Mono8 are saved without a conversion.
+            if image_result.GetPixelFormat() == PySpin.PixelFormat_Mono8:
+                image_converted = image_result
+            else:
+                image_result.Convert(image_mono8, PySpin.PixelFormat_Mono8, PySpin.HQ_LINEAR)
+                image_converted = image_mono8
+
+            # Save image
+            #
+            # *** NOTES ***
+            # When Pillow is installed, the image is encoded by its JPEG encoder,
+            # which is usually backed by libjpeg-turbo and faster than the SDK's.
+            # Otherwise the image is saved by the SDK.
+            #
+            # Any error saving an image, including file system errors, is
+            # recorded and the thread carries on with the next image, so that
+            # the image event handler is never left waiting on a full queue.
+            if PILImage is not None:
+                PILImage.fromarray(image_converted.GetNDArray()).save(filename)
+            else:
+                image_converted.Save(filename)
+
+            log.info("Image saved at %s", filename)
+
+        except Exception as ex:
+            log.error("Error: %s", ex)
+            errors.append(ex)
+
+
+def record_images(image_queue, errors, avi_filename, frame_rate):
+    """
+    This function appends the images placed on the queue by acquire_images()
+    to a single MJPG AVI file until it receives None. It is run instead of
+    save_images() when SAVE_TO_AVI is set; please see the SaveToAvi example
+    for more in-depth comments on the AVI recorder.
+
+    :param image_queue: Queue of (image, filename) tuples to record; the filenames are ignored.
+    :param errors: List to which any exceptions raised while recording are appended.
+    :param avi_filename: Name of the AVI file, without extension.
+    :param frame_rate: Frame rate of the AVI file.
+    :type image_queue: queue.Queue
+    :type errors: list
+    :type avi_filename: str
+    :type frame_rate: float
+    :rtype: None
+    """
+    avi_recorder = PySpin.AVIRecorder()
+
+    option = PySpin.MJPGOption()
+    option.frameRate = frame_rate
+    option.quality = 75
+
+    # Create destination image for conversions
+    #
+    # *** NOTES ***
+    # Converting into an existing image reuses its buffer instead of
+    # allocating a new image for every image converted. The buffer is
+    # allocated by the first conversion and reused after that, since all
+    # images in an acquisition have the same size.
+    image_mono8 = PySpin.Image.Create()
+
+    try:
+        avi_recorder.AVIOpen(avi_filename, option)
+        is_open = True
+
+    except Exception as ex:
+        log.error("Error: %s", ex)
+        errors.append(ex)
+        is_open = False
+
+    while True:
+        item = image_queue.get()
+        if item is None:
+            break
+
+        image_result, _ = item
+        try:
+            if is_open:
+                # Convert image to Mono8, unless it already is
+                if image_result.GetPixelFormat() == PySpin.PixelFormat_Mono8:
+                    image_converted = image_result
+                else:
+                    image_result.Convert(image_mono8, PySpin.PixelFormat_Mono8, PySpin.HQ_LINEAR)
+                    image_converted = image_mono8
+
+                avi_recorder.AVIAppend(image_converted)
+
+        except Exception as ex:
+            log.error("Error: %s", ex)
+            errors.append(ex)
+
+    if is_open:
+        try:
+            avi_recorder.AVIClose()
+            log.info("Video saved at %s.avi", avi_filename)
+
+        except Exception as ex:
+            log.error("Error: %s", ex)
+            errors.append(ex)
+
+
+def acquire_images(cam, chunk_data_active):
     """
     This function acquires and saves 10 images from a device; please see
     Acquisition example for more in-depth comments on the acquisition of images.
 
     :param cam: Camera to acquire images from.
+    :param chunk_data_active: Whether images carry chunk data to print.
     :type cam: CameraPtr
+    :type chunk_data_active: bool
     :return: True if successful, False otherwise.
     :rtype: bool
     """
-    print "*** IMAGE ACQUISITION ***"
+    print("*** IMAGE ACQUISITION ***")
 
     try:
         result = True
 
         # Set acquisition mode to continuous
         if cam.AcquisitionMode.GetAccessMode() != PySpin.RW:
-            print "Unable to set acquisition mode to continuous. Aborting..."
+            print("Unable to set acquisition mode to continuous. Aborting...")
             return False
 
         cam.AcquisitionMode.SetValue(PySpin.AcquisitionMode_Continuous)
-        print "Acquisition mode set to continuous..."
+        print("Acquisition mode set to continuous...")
+
+        # Retrieve frame rate for the AVI file, so that it plays in real-time
+        if SAVE_TO_AVI:
+            if cam.AcquisitionFrameRate.GetAccessMode() not in (PySpin.RO, PySpin.RW):
+                print("Unable to retrieve frame rate. Aborting...")
+                return False
 
-        # Begin acquiring images
-        cam.BeginAcquisition()
+            frame_rate = cam.AcquisitionFrameRate.GetValue()
 
-        print "Acquiring images..."
+        # Configure stream buffers
+        result &= configure_stream_buffers(cam)
 
         # Get device serial number for filename
         device_serial_number = ""
-        if cam.TLDevice.DeviceSerialNumber is not None and cam.TLDevice.DeviceSerialNumber.GetAccessMode() == PySpin.RO:
-            device_serial_number = cam.TLDevice.DeviceSerialNumber.GetValue()
+        node_device_serial_number = cam.TLDevice.DeviceSerialNumber
+        if node_device_serial_number is not None and node_device_serial_number.GetAccessMode() == PySpin.RO:
+            device_serial_number = node_device_serial_number.GetValue()
 
-            print "Device serial number retrieved as %s..." % device_serial_number
+            print("Device serial number retrieved as %s..." % device_serial_number)
 
-        # Retrieve, convert, and save images
-        for i in range(NUM_IMAGES):
+        # Start saving thread
+        #
+        # *** NOTES ***
+        # Converting and saving an image takes considerably longer than
+        # retrieving it. Complete images are therefore handed to a separate
+        # thread through a bounded queue; once the queue is full, the
+        # image event handler waits for the saving thread to catch up.
+        #
+        # With SAVE_TO_AVI set, the thread appends the images to one AVI
+        # file instead, which avoids creating a file per image.
+        image_queue = queue.Queue(maxsize=SAVE_QUEUE_SIZE)
+        save_errors = []
+        if SAVE_TO_AVI:
+            avi_filename = "ExposureQS-%s" % device_serial_number
+            save_thread = threading.Thread(target=record_images,
+                                           args=(image_queue, save_errors, avi_filename, frame_rate))
+        else:
+            save_thread = threading.Thread(target=save_images, args=(image_queue, save_errors))
+        save_thread.start()
+
+        try:
+            # Register image event handler
+            #
+            # *** NOTES ***
+            # Images are delivered to the handler by the SDK as they arrive,
+            # rather than being polled for with GetNextImage(). Please see
+            # ImageEvents example for more in-depth comments on image events.
+            image_event_handler = ImageEventHandler(image_queue, "ExposureQS-%s-%%d.jpg" % device_serial_number,
+                                                    chunk_data_active)
+            cam.RegisterEvent(image_event_handler)
 
             try:
-                # Retrieve next received image and ensure image completion
-                image_result = cam.GetNextImage()
+                # Begin acquiring images
+                cam.BeginAcquisition()
 
-                if image_result.IsIncomplete():
-                    print "Image incomplete with image status %d..." % image_result.GetImageStatus()
+                print("Acquiring images...")
 
-                else:
-                    # Print image information
-                    width = image_result.GetWidth()
-                    height = image_result.GetHeight()
-                    print "Grabbed Image %d, width = %d, height = %d" % (i, width, height)
-
-                    # Convert image to Mono8
-                    image_converted = image_result.Convert(PySpin.PixelFormat_Mono8)
+                # Wait for the handler to queue NUM_IMAGES images
+                #
+                # *** NOTES ***
+                # The wait is limited to MAX_WAIT_DURATION, so that a camera
+                # that stops sending images cannot hang the example.
+                if not image_event_handler.wait(MAX_WAIT_DURATION):
+                    print("Timed out after %i s waiting for %i images. Aborting..." % (MAX_WAIT_DURATION,
+                                                                                      NUM_IMAGES))
+                    result = False
 
-                    # Create a unique filename
-                    filename = "ExposureQS-%s-%d.jpg" % (device_serial_number, i)
+                # End acquisition
+                cam.EndAcquisition()
 
-                    # Save image
-                    image_converted.Save(filename)
+            finally:
+                # Unregister image event handler
+                cam.UnregisterEvent(image_event_handler)
+                del image_event_handler
 
-                    print "Image saved at %s" % filename
+        finally:
+            # Wait for all queued images to be saved
+            image_queue.put(None)
+            save_thread.join()
 
-                # Release image
-                image_result.Release()
-
-            except PySpin.SpinnakerException as ex:
-                print "Error: %s" % ex
-                result = False
-
-        # End acquisition
-        cam.EndAcquisition()
+        if save_errors:
+            result = False
 
     except PySpin.SpinnakerException as ex:
-        print "Error: %s" % ex
+        print("Error: %s" % ex)
         result = False
 
     return result
@@ -275,8 +688,15 @@ def run_single_camera(cam):
         if not configure_exposure(cam):
             return False
 
+        # Configure chunk data; images are acquired without it if this fails
+        chunk_data_active = configure_chunk_data(cam)
+
         # Acquire images
-        result &= acquire_images(cam)
+        result &= acquire_images(cam, chunk_data_active)
+
+        # Reset chunk data
+        if chunk_data_active:
+            result &= reset_chunk_data(cam)
 
         # Reset exposure
         result &= reset_exposure(cam)
@@ -287,7 +707,7 @@ def run_single_camera(cam):
         return result
 
     except PySpin.SpinnakerException as ex:
-        print "Error: %s" % ex
+        print("Error: %s" % ex)
         return False
 
 
@@ -299,6 +719,10 @@ def main():
     :return: True if successful, False otherwise.
     :rtype: bool
     """
+    # Start writing logged messages to stdout
+    log_listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler(sys.stdout))
+    log_listener.start()
+
     # Retrieve singleton reference to system object
     system = PySpin.System.GetInstance()
 
@@ -307,7 +731,7 @@ def main():
 
     num_cameras = cam_list.GetSize()
 
-    print "Number of cameras detected: %d" % num_cameras
+    print("Number of cameras detected: %d" % num_cameras)
 
     # Finish if there are no cameras
     if num_cameras == 0:
@@ -317,17 +741,18 @@ def main():
         # Release system
         system.ReleaseInstance()
 
-        print "Not enough cameras!"
-        raw_input("Done! Press Enter to exit...")
+        print("Not enough cameras!")
+        log_listener.stop()
+        input("Done! Press Enter to exit...")
         return False
 
     # Release example on each camera
     for i in range(num_cameras):
-        print "Running example for camera %d..." % i
+        print("Running example for camera %d..." % i)
 
         result = run_single_camera(cam_list.GetByIndex(i))
 
-        print "Camera %d example complete..." % i
+        print("Camera %d example complete..." % i)
 
     # Clear camera list before releasing system
     cam_list.Clear()
@@ -335,7 +760,10 @@ def main():
     # Release system
     system.ReleaseInstance()
 
-    raw_input("Done! Press Enter to exit...")
+    # Flush any remaining logged messages
+    log_listener.stop()
+
+    input("Done! Press Enter to exit...")
     return result
 
 if __name__ == "__main__":
@@ -22,156 +22,571 @@
 # This example demonstrates how to visualize the image histogram using Python, and display an image represented as
 # a numpy array.
 
+import collections
+import concurrent.futures
+import logging
+import logging.handlers
+import multiprocessing
+import os
+import queue
+import sys
+import threading
+
 import PySpin
 import matplotlib.pyplot as plt
+import numpy as np
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+try:
+    from PIL import Image as PILImage
+except ImportError:
+    PILImage = None
 
 NUM_IMAGES = 10  # number of images to grab
+SAVE_QUEUE_SIZE = 4  # number of grabbed images that may wait to be saved
+PROCESS_QUEUE_SIZE = 2  # number of grabbed images that may wait for their statistics to be calculated
+STREAM_BUFFER_COUNT = 20  # number of buffers the SDK may fill before images are dropped
+IMAGE_POOL_SIZE = PROCESS_QUEUE_SIZE + SAVE_QUEUE_SIZE + 2  # queued images, plus one being saved and one being filled
+DISPLAY_QUEUE_SIZE = 2  # number of images that may wait to be displayed before images are skipped
+DISPLAY_TIMEOUT = 5  # seconds to wait for the display process to finish before it is terminated
+HISTOGRAM_BLOCKS = 16  # number of row blocks counted in parallel when numba is available
+HISTOGRAM_STRIP_PIXELS = 32768  # number of pixels counted at a time when numba is not available
+ACQUISITION_NICE = -10  # niceness increment of the acquisition loop, where permitted
+
+# Messages from the acquisition loop and the processing and saving threads are
+# logged through a queue; a listener started in main() writes them to stdout on
+# its own thread.
+log_queue = queue.Queue(-1)
+log = logging.getLogger("ImageChannelStatistics")
+log.setLevel(logging.INFO)
+log.propagate = False
+log.addHandler(logging.handlers.QueueHandler(log_queue))
+
+
+if numba is not None:
+    @numba.njit(parallel=True, nogil=True, cache=True)
+    def mono8_histogram(image_data):
+        # Each block of rows is counted into its own histogram by its own
+        # thread; the block histograms are summed afterwards.
+        height, width = image_data.shape
+        num_blocks = min(height, HISTOGRAM_BLOCKS)
+        block_histograms = np.zeros((num_blocks, 256), np.int64)
+
+        for block in numba.prange(num_blocks):
+            for row in range(block * height // num_blocks, (block + 1) * height // num_blocks):
+                for column in range(width):
+                    block_histograms[block, image_data[row, column]] += 1
+
+        return block_histograms.sum(axis=0)
+
+else:
+    def mono8_histogram(image_data):
+        """
+        This function counts the pixels of each value in a Mono8 image. When
+        numba is installed, a compiled version that counts blocks of rows in
+        parallel is used instead.
+
+        The image is counted in strips of rows. np.bincount() converts its
+        input to a platform integer array first, which for a whole image is
+        eight times the size of the image; for a strip, it stays in cache.
+
+        :param image_data: Mono8 image data.
+        :type image_data: numpy.ndarray
+        :return: Number of pixels per pixel value.
+        :rtype: numpy.ndarray
+        """
+        height, width = image_data.shape
+        rows_per_strip = max(1, HISTOGRAM_STRIP_PIXELS // width)
+
+        histogram = np.zeros(256, np.int64)
+        for row in range(0, height, rows_per_strip):
+            histogram += np.bincount(image_data[row:row + rows_per_strip].ravel(), minlength=256)
+
+        return histogram
+
+
+def calculate_histogram_statistics(histogram):
+    """
+    This function derives the pixel value statistics from a Mono8 histogram,
+    which may cover a single image or the sum of several.
+
+    :param histogram: Number of pixels per pixel value.
+    :type histogram: numpy.ndarray
+    :return: tuple (pixel_value_min, pixel_value_max, pixel_value_mean)
+    :rtype: (int, int, float)
+    """
+    pixel_values = np.flatnonzero(histogram)
+    pixel_value_mean = np.dot(np.arange(histogram.size), histogram) / float(histogram.sum())
 
+    return int(pixel_values[0]), int(pixel_values[-1]), pixel_value_mean
 
-def acquire_and_display_images(cam, nodemap, nodemap_tldevice):
+
+def calculate_mono8_statistics(image_data):
     """
-    This function acquires and displays the channel statistics of N images from a device.
+    This function calculates the histogram and pixel value statistics of a Mono8
+    image from its numpy array. The image is only read once, to build the
+    histogram; the statistics are then derived from the 256 histogram bins.
+
+    :param image_data: Mono8 image data.
+    :type image_data: numpy.ndarray
+    :return: tuple (histogram, pixel_value_min, pixel_value_max, pixel_value_mean)
+    :rtype: (numpy.ndarray, int, int, float)
+    """
+    histogram = mono8_histogram(image_data)
 
-    :param cam: Camera to acquire images from.
-    :param nodemap: Device nodemap.
-    :param nodemap_tldevice: Transport layer device nodemap.
+    return (histogram,) + calculate_histogram_statistics(histogram)
+
+
+def configure_stream_buffers(cam):
+    """
+    This function raises the number of stream buffers and has them handled
+    oldest first, so that images are queued rather than dropped when the
+    application briefly falls behind the camera.
+
+    :param cam: Camera to configure stream buffers for.
     :type cam: CameraPtr
-    :type nodemap: INodeMap
-    :type nodemap_tldevice: INodeMap
     :return: True if successful, False otherwise.
     :rtype: bool
     """
-
-    print "*** IMAGE ACQUISITION ***\n"
     try:
         result = True
 
-        node_acquisition_mode = PySpin.CEnumerationPtr(nodemap.GetNode("AcquisitionMode"))
-        if not PySpin.IsAvailable(node_acquisition_mode) or not PySpin.IsWritable(node_acquisition_mode):
-            print "Unable to set acquisition mode to continuous (enum retrieval). Aborting..."
+        # Set stream buffer count manually
+        #
+        # *** NOTES ***
+        # Stream buffer nodes belong to the transport layer stream, which
+        # QuickSpin makes available through the camera's TLStream property.
+        if cam.TLStream.StreamBufferCountMode.GetAccessMode() != PySpin.RW \
+                or cam.TLStream.StreamBufferCountManual.GetAccessMode() != PySpin.RW:
+            print("Unable to set stream buffer count. Non-fatal error...")
             return False
 
-        # Retrieve entry node from enumeration node
-        node_acquisition_mode_continuous = node_acquisition_mode.GetEntryByName("Continuous")
-        if not PySpin.IsAvailable(node_acquisition_mode_continuous) or not PySpin.IsReadable(
-                node_acquisition_mode_continuous):
-            print "Unable to set acquisition mode to continuous (entry retrieval). Aborting..."
+        cam.TLStream.StreamBufferCountMode.SetValue(PySpin.StreamBufferCountMode_Manual)
+
+        buffer_count = min(cam.TLStream.StreamBufferCountManual.GetMax(), STREAM_BUFFER_COUNT)
+        cam.TLStream.StreamBufferCountManual.SetValue(buffer_count)
+        print("Stream buffer count set to %d..." % buffer_count)
+
+        # Handle stream buffers oldest first
+        if cam.TLStream.StreamBufferHandlingMode.GetAccessMode() != PySpin.RW:
+            print("Unable to set stream buffer handling mode. Non-fatal error...")
             return False
 
-        # Retrieve integer value from entry node
-        acquisition_mode_continuous = node_acquisition_mode_continuous.GetValue()
+        cam.TLStream.StreamBufferHandlingMode.SetValue(PySpin.StreamBufferHandlingMode_OldestFirst)
+        print("Stream buffer handling mode set to oldest first...")
 
-        # Set integer value from entry node as new value of enumeration node
-        node_acquisition_mode.SetIntValue(acquisition_mode_continuous)
+    except PySpin.SpinnakerException as ex:
+        print("Error: %s" % ex)
+        result = False
 
-        print "Acquisition mode set to continuous..."
+    return result
 
-        node_pixel_format = PySpin.CEnumerationPtr(nodemap.GetNode("PixelFormat"))
-        if not PySpin.IsAvailable(node_pixel_format) or not PySpin.IsWritable(node_pixel_format):
-            print "Unable to set Pixel Format. Aborting..."
-            return False
+
+def save_images(image_queue, errors):
+    """
+    This function saves the images placed on the queue by acquire_and_display_images()
+    as PNG files until it receives None. It runs on its own thread so that saving
+    does not hold up the retrieval of the next image.
+
+    :param image_queue: Queue of (filename, image data) tuples to save.
+    :param errors: List to which any exceptions raised while saving are appended.
+    :type image_queue: queue.Queue
+    :type errors: list
+    :rtype: None
+    """
+    while True:
+        item = image_queue.get()
+        if item is None:
+            break
+
+        filename, image_data = item
+
+        # Save the image data directly, without rendering a figure
+        #
+        # *** NOTES ***
+        # When Pillow is installed, the image data is saved as an 8-bit
+        # greyscale PNG. Otherwise matplotlib saves it through the grey
+        # colormap, which makes it an RGBA image that is slower to encode.
+        #
+        # An error saving one image is recorded and the thread carries on
+        # with the next, so that the queue keeps draining and acquisition
+        # is never left waiting on a thread that has stopped.
+        try:
+            if PILImage is not None:
+                PILImage.fromarray(image_data).save(filename)
+            else:
+                plt.imsave(filename, image_data, cmap='gray', vmin=0, vmax=255)
+            log.info("\tSave to %s", filename)
+
+        except Exception as ex:
+            log.error("Error: %s", ex)
+            errors.append(ex)
+
+
+def display_images(display_queue):
+    """
+    This function displays the histograms and images placed on the queue by
+    acquire_and_display_images() until it receives None. It runs in its own
+    process, so that drawing the figure never holds up acquisition; when it
+    falls behind, only the newest image on the queue is displayed.
+
+    :param display_queue: Queue of (title, histogram, image data) tuples to display.
+    :type display_queue: multiprocessing.Queue
+    :rtype: None
+    """
+    # Using matplotlib, two subplots are created where the top subplot is the histogram and the
+    # bottom subplot is the image.
+    #
+    # The histogram line and the image are created for the first image; for every
+    # later image only their data is replaced, rather than clearing and
+    # redrawing both subplots.
+    #
+    # Refer to https://matplotlib.org/2.0.2/api/pyplot_api.html#module-matplotlib.pyplot
+    plt.ion()
+    fig = plt.figure(1)
+    histogram_line = None
+    image_artist = None
+
+    while True:
+        item = display_queue.get()
+
+        # Skip to the newest image on the queue
+        while item is not None:
+            try:
+                item = display_queue.get_nowait()
+            except queue.Empty:
+                break
+
+        if item is None:
+            break
+
+        title, histogram, image_data = item
+
+        if image_artist is None:
+
+            # Plot the histogram in the first subplot in a 2 row by 1 column grid
+            axes_histogram = fig.add_subplot(211)
+            histogram_line, = axes_histogram.plot(histogram, label='Grey')
+            axes_histogram.legend()
+
+            # Plot the image in the second subplot in a 2 row by 1 column grid
+            axes_image = fig.add_subplot(212)
+            image_artist = axes_image.imshow(image_data, cmap='gray', vmin=0, vmax=255)
 
         else:
-            # Retrieve entry node from enumeration node
-            node_pixel_format_mono8 = PySpin.CEnumEntryPtr(node_pixel_format.GetEntryByName("Mono8"))
-            if not PySpin.IsAvailable(node_pixel_format_mono8) or not PySpin.IsReadable(node_pixel_format_mono8):
-                print "Unable to set Pixel Format to MONO8. Aborting..."
-                return False
+            histogram_line.set_ydata(histogram)
+            image_artist.set_data(image_data)
 
-            # Retrieve integer value from entry node
-            pixel_format_mono8 = node_pixel_format_mono8.GetValue()
+        axes_histogram.set_ylim(0, max(histogram) * 1.05)
+        axes_histogram.set_title(title)
 
-            # Set integer value from entry node as new value of enumeration node
-            node_pixel_format.SetIntValue(pixel_format_mono8)
+        # Show the image
+        fig.canvas.draw_idle()
+        fig.canvas.flush_events()
 
-            print "Pixel Format set to MONO8 ..."
+    plt.close()
 
-        cam.BeginAcquisition()
 
-        print "Acquiring images..."
+def process_image(image_number, image_data, device_serial_number, histogram_total, display_queue, image_queue):
+    """
+    This function calculates and logs the statistics of an image, adds its
+    histogram to the total, and queues it to be displayed and saved. It is run
+    on a worker thread by acquire_and_display_images(), so that the next image
+    can be retrieved in the meantime.
+
+    :param image_number: Number of the image, used in its title and filename.
+    :param image_data: Mono8 image data.
+    :param device_serial_number: Serial number of the camera, used in the title and filename.
+    :param histogram_total: Sum of the histograms of the images processed so far.
+    :param display_queue: Queue of (title, histogram, image data) tuples to display.
+    :param image_queue: Queue of (filename, image data) tuples to save.
+    :type image_number: int
+    :type image_data: numpy.ndarray
+    :type device_serial_number: str
+    :type histogram_total: numpy.ndarray
+    :type display_queue: multiprocessing.Queue
+    :type image_queue: queue.Queue
+    :rtype: None
+    """
+    # Calculate statistics
+    #
+    # *** NOTES ***
+    # The pixel format is set to Mono8 before acquisition, so the statistics are
+    # calculated from the numpy array that is displayed anyway, rather than
+    # having the SDK make a second pass over the image.
+    histogram, pixel_value_min, pixel_value_max, pixel_value_mean = calculate_mono8_statistics(image_data)
+    histogram_total += histogram
+
+    # Display Statistics
+    log.info("SN%s image %d:\n"
+             "\tNumber pixel values : %d\n"
+             "\tRange:                Min = %d, Max = %d\n"
+             "\tPixel Value:          Min = %d, Max = %d, Mean = %.2f",
+             device_serial_number, image_number, histogram.size, 0, histogram.size - 1,
+             pixel_value_min, pixel_value_max, pixel_value_mean)
+
+    # Queue the histogram and a copy of the image data to be displayed,
+    # unless the display is still busy with earlier images. The copy
+    # is needed as the queue sends the data in the background, after
+    # the array may have been reused.
+    if not display_queue.full():
+        try:
+            display_queue.put_nowait(("SN%s Histogram (%d)" % (device_serial_number, image_number),
+                                      histogram, image_data.copy()))
+        except queue.Full:
+            pass
+
+    # Create a unique filename
+    if device_serial_number:
+        filename = "ImageChannelStatistics-%s-%d.png" % (device_serial_number, image_number)
+    else:  # if serial number is empty
+        filename = "ImageChannelStatistics-%d.png" % image_number
+
+    # Queue the image data to be saved
+    image_queue.put((filename, image_data))
+
+
+def raise_thread_priority():
+    """
+    This function pins the calling thread to a single CPU and raises its
+    scheduling priority, so that it is less likely to be descheduled while
+    images wait in the stream buffers. Threads started earlier, such as the
+    processing and saving threads, keep running on the other CPUs.
 
-        device_serial_number = ""
-        node_device_serial_number = PySpin.CStringPtr(nodemap_tldevice.GetNode("DeviceSerialNumber"))
-        if PySpin.IsAvailable(node_device_serial_number) and PySpin.IsReadable(node_device_serial_number):
-            device_serial_number = node_device_serial_number.GetValue()
-            print "Device serial number retrieved as %s..." % device_serial_number
+    Both settings are only applied where the platform supports them (Linux)
+    and, for the priority, where the user is permitted to raise it.
 
-        plt.ion()
-        for i in range(NUM_IMAGES):
-            try:
-                image_result = cam.GetNextImage()
+    :return: tuple (previous CPUs or None, niceness increment applied)
+    :rtype: (set, int)
+    """
+    try:
+        cpus = os.sched_getaffinity(0)
+        os.sched_setaffinity(0, {max(cpus)})
+    except (AttributeError, OSError):
+        cpus = None
 
-                if image_result.IsIncomplete():
-                    print "Image incomplete with image status %d ..." % image_result.GetImageStatus()
-                else:
-                    fig = plt.figure(1)
+    try:
+        os.nice(ACQUISITION_NICE)
+        nice_increment = ACQUISITION_NICE
+    except (AttributeError, OSError):
+        nice_increment = 0
+
+    return cpus, nice_increment
+
+
+def restore_thread_priority(cpus, nice_increment):
+    """
+    This function undoes raise_thread_priority() for the calling thread.
+
+    :param cpus: CPUs the thread ran on before, or None if it was not pinned.
+    :param nice_increment: Niceness increment applied.
+    :type cpus: set
+    :type nice_increment: int
+    :rtype: None
+    """
+    if cpus is not None:
+        os.sched_setaffinity(0, cpus)
+
+    if nice_increment:
+        os.nice(-nice_increment)
+
+
+def acquire_and_display_images(cam):
+    """
+    This function acquires and displays the channel statistics of N images from a device.
+
+    :param cam: Camera to acquire images from.
+    :type cam: CameraPtr
+    :return: True if successful, False otherwise.
+    :rtype: bool
+    """
+
+    print("*** IMAGE ACQUISITION ***\n")
+    try:
+        result = True
 
+        # Set acquisition mode to continuous
+        #
+        # *** NOTES ***
+        # QuickSpin checks the node and sets the enumeration entry in a single
+        # call; please see Exposure_QuickSpin example for more in-depth
+        # comments on setting enumeration nodes.
+        if cam.AcquisitionMode.GetAccessMode() != PySpin.RW:
+            print("Unable to set acquisition mode to continuous. Aborting...")
+            return False
+
+        cam.AcquisitionMode.SetValue(PySpin.AcquisitionMode_Continuous)
+        print("Acquisition mode set to continuous...")
+
+        # Set pixel format to Mono8
+        if cam.PixelFormat.GetAccessMode() != PySpin.RW:
+            print("Unable to set Pixel Format to MONO8. Aborting...")
+            return False
+
+        cam.PixelFormat.SetValue(PySpin.PixelFormat_Mono8)
+        print("Pixel Format set to MONO8 ...")
+
+        # Configure stream buffers
+        result &= configure_stream_buffers(cam)
+
+        cam.BeginAcquisition()
+
+        print("Acquiring images...")
+
+        device_serial_number = ""
+        node_device_serial_number = cam.TLDevice.DeviceSerialNumber
+        if node_device_serial_number is not None and node_device_serial_number.GetAccessMode() == PySpin.RO:
+            device_serial_number = node_device_serial_number.GetValue()
+            print("Device serial number retrieved as %s..." % device_serial_number)
+
+        # Start saving thread
+        #
+        # *** NOTES ***
+        # Each image is saved as a PNG straight from its numpy array on a
+        # separate thread, so that encoding and writing the file overlap with
+        # the retrieval of the next image. The figure is not rendered to save it.
+        image_queue = queue.Queue(maxsize=SAVE_QUEUE_SIZE)
+        save_errors = []
+        save_thread = threading.Thread(target=save_images, args=(image_queue, save_errors))
+        save_thread.start()
+
+        # Start display process
+        #
+        # *** NOTES ***
+        # Drawing the figure takes longer than acquiring an image, so the
+        # histogram and image are displayed by a separate process. Images are
+        # only queued for display while there is room on the queue; the
+        # acquisition loop never waits for the display.
+        display_queue = multiprocessing.Queue(maxsize=DISPLAY_QUEUE_SIZE)
+        display_process = multiprocessing.Process(target=display_images, args=(display_queue,))
+        display_process.start()
+
+        # Start processing thread
+        #
+        # *** NOTES ***
+        # Images are handled in three stages: they are retrieved here, their
+        # statistics are calculated on a processing thread, and they are saved
+        # on the saving thread. Each image passes through the stages in turn
+        # while the stages work on different images at the same time. There
+        # is a single processing thread, so that images are processed in order
+        # and the histogram total is only updated by one thread.
+        process_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        processing = collections.deque()
+
+        # Start the processing thread now
+        #
+        # *** NOTES ***
+        # The executor only starts its thread when the first task is submitted.
+        # A no-op is run here so that the thread, and any threads it starts,
+        # are created before the acquisition loop is pinned to a single CPU
+        # below; otherwise they would inherit its CPU and raised priority.
+        process_executor.submit(lambda: None).result()
+
+        # Mono8 image data is copied into a pool of numpy arrays that is
+        # allocated for the first image and reused round robin afterwards.
+        image_pool = None
+
+        # The histograms of all images are summed for the aggregate statistics
+        histogram_total = np.zeros(256, np.int64)
+
+        # Bind the image retrieval method once, rather than looking it up for every image
+        get_next_image = cam.GetNextImage
+
+        # Pin the acquisition loop to its own CPU at a raised priority
+        previous_cpus, nice_increment = raise_thread_priority()
+
+        try:
+            for i in range(NUM_IMAGES):
                 try:
-                    image_stats = image_result.CalculateChannelStatistics(PySpin.GREY)
-                    # Getting the image data as a numpy array
-                    image_data = image_result.GetNDArray()
-
-                    # Display Statistics
-                    print "SN%s image %d:" % (device_serial_number, i)
-                    print "\tNumber pixel values : %d" % image_stats.num_pixel_values
-                    print "\tRange:                Min = %d, Max = %d" % (image_stats.range_min,
-                                                                          image_stats.range_max)
-                    print "\tPixel Value:          Min = %d, Max = %d, Mean = %.2f" % (image_stats.pixel_value_min,
-                                                                                       image_stats.pixel_value_max,
-                                                                                       image_stats.pixel_value_mean)
-
-                    # Using matplotlib, two subplots are created where the top subplot is the histogram and the 
-                    # bottom subplot is the image.
-                    # 
-                    # Refer to https://matplotlib.org/2.0.2/api/pyplot_api.html#module-matplotlib.pyplot
-                                                                                       
-                    # Plot the histogram in the first subplot in a 2 row by 1 column grid
-                    plt.subplot(211)
-                    plt.cla()
-                    plt.plot(image_stats.histogram, label='Grey')
-                    plt.title("SN%s Histogram (%d)" % (device_serial_number, i))
-                    plt.legend()
-
-                    # Plot the image in the second subplot in a 2 row by 1 column grid
-                    plt.subplot(212)
-                    plt.cla()
-                    plt.imshow(image_data, cmap='gray')
-
-                    # Show the image
-                    plt.show()
-                    plt.pause(0.01)
-
-                    # Create a unique filename
-                    if device_serial_number:
-                        filename = "ImageChannelStatistics-%s-%d.png" % (device_serial_number, i)
-                    else:  # if serial number is empty
-                        filename = "ImageChannelStatistics-%d.png" % i
-
-                    fig.savefig(filename)
-                    print "\tSave to %s" % filename
-                    print
+                    image_result = get_next_image()
+
+                    if image_result.IsIncomplete():
+                        log.info("Image incomplete with image status %d ...", image_result.GetImageStatus())
+
+                    else:
+                        # Getting the image data as a numpy array
+                        #
+                        # *** NOTES ***
+                        # The image data is copied straight from the image buffer into
+                        # the next array of the pool, instead of into a newly allocated
+                        # array for every image. The pool is larger than the process and
+                        # save queues together, so an array is never overwritten before it
+                        # has been processed and saved.
+                        if image_pool is None:
+                            image_shape = (image_result.GetHeight(), image_result.GetWidth())
+                            image_pool = [np.empty(image_shape, np.uint8) for _ in range(IMAGE_POOL_SIZE)]
+
+                        image_data = image_pool[i % IMAGE_POOL_SIZE]
+                        np.copyto(image_data, np.frombuffer(image_result.GetData(), dtype=np.uint8,
+                                                            count=image_data.size).reshape(image_data.shape))
+
+                        # Queue the image data to be processed; once too many images are
+                        # waiting, wait for the oldest to be processed
+                        processing.append(process_executor.submit(process_image, i, image_data,
+                                                                  device_serial_number, histogram_total,
+                                                                  display_queue, image_queue))
+                        if len(processing) > PROCESS_QUEUE_SIZE:
+                            processing.popleft().result()
+
+                    #  Release image
+                    #
+                    #  *** NOTES ***
+                    #  Images retrieved directly from the camera (i.e. non-converted
+                    #  images) need to be released in order to keep from filling the
+                    #  buffer.
+                    image_result.Release()
 
                 except PySpin.SpinnakerException:
                     raise
 
-                #  Release image
-                #
-                #  *** NOTES ***
-                #  Images retrieved directly from the camera (i.e. non-converted
-                #  images) need to be released in order to keep from filling the
-                #  buffer.
-                image_result.Release()
+            # Wait for the remaining images to be processed, raising any error
+            while processing:
+                processing.popleft().result()
+
+        finally:
+            restore_thread_priority(previous_cpus, nice_increment)
+
+            # Wait for all queued images to be processed, saved and displayed
+            process_executor.shutdown()
+
+            image_queue.put(None)
+            save_thread.join()
+
+            # The display process is only given a limited time to finish, so
+            # that a display that has stopped responding cannot hold up the
+            # end of acquisition.
+            try:
+                display_queue.put(None, timeout=DISPLAY_TIMEOUT)
+            except queue.Full:
+                pass
 
-            except PySpin.SpinnakerException:
-                raise
+            display_process.join(DISPLAY_TIMEOUT)
+            if display_process.is_alive():
+                print("Display process not responding; terminating it...")
+                display_process.terminate()
+                display_process.join()
 
         cam.EndAcquisition()
-        print "End Acquisition"
+        print("End Acquisition")
 
-        plt.close()
+        if save_errors:
+            print("Unable to save %d image(s)..." % len(save_errors))
+            result = False
+
+        # Display aggregate statistics of all complete images
+        if histogram_total.any():
+            pixel_value_min, pixel_value_max, pixel_value_mean = calculate_histogram_statistics(histogram_total)
+            print("SN%s all images:" % device_serial_number)
+            print("\tPixel Value:          Min = %d, Max = %d, Mean = %.2f" % (pixel_value_min,
+                                                                               pixel_value_max,
+                                                                               pixel_value_mean))
 
     except PySpin.SpinnakerException as ex:
-        print "Error: %s" % ex
+        print("Error: %s" % ex)
         return False
 
     return result
@@ -190,22 +605,17 @@ def run_single_camera(cam):
     try:
         result = True
 
-        nodemap_tldevice = cam.GetTLDeviceNodeMap()
-
         #Initialize camera
         cam.Init()
 
-        # Retrieve GenICam nodemap
-        nodemap = cam.GetNodeMap()
-
         # Acquire images
-        result &= acquire_and_display_images(cam, nodemap, nodemap_tldevice)
+        result &= acquire_and_display_images(cam)
 
         # Deinitialize camera
         cam.DeInit()
 
     except PySpin.SpinnakerException as ex:
-        print "Error: %s" % ex
+        print("Error: %s" % ex)
         result = False
 
     return result
@@ -220,6 +630,10 @@ def main():
     :rtype: None
     """
 
+    # Start writing logged messages to stdout
+    log_listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler(sys.stdout))
+    log_listener.start()
+
     # Retrieve singleton reference to system object
     system = PySpin.System.GetInstance()
 
@@ -228,7 +642,7 @@ def main():
 
     num_cameras = cam_list.GetSize()
 
-    print "Number of cameras detected: %d" % num_cameras
+    print("Number of cameras detected: %d" % num_cameras)
 
     # Finish if there are no cameras
     if num_cameras == 0:
@@ -239,18 +653,19 @@ def main():
         # Release system
         system.ReleaseInstance()
 
-        print "Not enough cameras!"
-        raw_input("Done! Press Enter to exit...")
+        print("Not enough cameras!")
+        log_listener.stop()
+        input("Done! Press Enter to exit...")
         return False
 
     # Run example on each camera
     for i in range(num_cameras):
         cam = cam_list.GetByIndex(i)
 
-        print "Running example for camera %d..." % i
+        print("Running example for camera %d..." % i)
 
         result = run_single_camera(cam)
-        print "Camera %d example complete..." % i
+        print("Camera %d example complete..." % i)
 
     # Release reference to camera
     # NOTE: Unlike the C++ examples, we cannot rely on pointer objects being automatically
@@ -264,7 +679,10 @@ def main():
     # Release instance
     system.ReleaseInstance()
 
-    raw_input("Done! Press Enter to exit...")
+    # Flush any remaining logged messages
+    log_listener.stop()
+
+    input("Done! Press Enter to exit...")
     return result
 
 
@@ -30,10 +30,38 @@
 #  	allows the child class to appropriately interface with Spinnaker.
 
 
+import json
+import queue
+import sys
+import threading
+
 import PySpin
-from time import sleep
 
-SLEEP_DURATION = 200  # amount of time for main thread to sleep for (in milliseconds) until _NUM_IMAGES have been saved
+try:
+    import cv2
+except ImportError:
+    cv2 = None
+
+SAVE_QUEUE_SIZE = 16  # number of images that may wait to be converted and saved
+STREAM_BUFFER_COUNT = 16  # number of buffers the SDK may fill before images are dropped
+MAX_WAIT_DURATION = 60  # maximum amount of time for main thread to wait (in seconds) until _NUM_IMAGES have been saved
+SAVE_RAW_STREAM = False  # append Mono8 image data to a single raw file rather than saving images as JPEG files
+
+# Serial numbers of the cameras whose device information has been printed;
+# cameras may be run on several threads at once, hence the lock.
+device_info_printed = set()
+device_info_lock = threading.Lock()
+
+# OpenCV conversion codes from Bayer pixel formats to greyscale. OpenCV names
+# Bayer patterns after the second row of the sensor, so for example an RGGB
+# (BayerRG) sensor is converted with COLOR_BayerBG2GRAY.
+if cv2 is not None:
+    CV2_BAYER_TO_GRAY = {
+        PySpin.PixelFormat_BayerRG8: cv2.COLOR_BayerBG2GRAY,
+        PySpin.PixelFormat_BayerGR8: cv2.COLOR_BayerGB2GRAY,
+        PySpin.PixelFormat_BayerGB8: cv2.COLOR_BayerGR2GRAY,
+        PySpin.PixelFormat_BayerBG8: cv2.COLOR_BayerRG2GRAY,
+    }
 
 
 class ImageEventHandler(PySpin.ImageEvent):
@@ -50,34 +78,72 @@ class ImageEventHandler(PySpin.ImageEvent):
 
     def __init__(self, cam):
         """
-        Constructor. Retrieves serial number of given camera and sets image counter to 0.
+        Constructor. Retrieves serial number of given camera, sets image counter to 0
+        and starts the thread that converts and saves the images.
 
         :param cam: Camera instance, used to get serial number for unique image filenames.
         :type cam: CameraPtr
         :rtype: None
         """
-        super(ImageEventHandler, self).__init__()
+        super().__init__()
 
         nodemap = cam.GetTLDeviceNodeMap()
 
         # Retrieve device serial number
+        self._device_serial_number = ""
         node_device_serial_number = PySpin.CStringPtr(nodemap.GetNode("DeviceSerialNumber"))
 
         if PySpin.IsAvailable(node_device_serial_number) and PySpin.IsReadable(node_device_serial_number):
             self._device_serial_number = node_device_serial_number.GetValue()
 
+        # Create filename formatter, taking the image count
+        #
+        # *** NOTES ***
+        # The serial number does not change, so it is formatted into the
+        # filename template once here rather than on every image event.
+        if self._device_serial_number:
+            self._make_name = ("ImageEvents-%s-%%i.jpg" % self._device_serial_number).__mod__
+
+        else:  # if serial number is empty
+            self._make_name = "ImageEvents-%i.jpg".__mod__
+
         # Initialize image counter to 0
         self._image_count = 0
 
+        # Set once _NUM_IMAGES images have been saved
+        self._done = threading.Event()
+
+        # Exceptions raised while saving images
+        self._errors = []
+
+        # Start saving thread
+        #
+        # *** NOTES ***
+        # OnImageEvent() is called on a thread of the SDK, which cannot handle
+        # the next image until it returns. Converting and saving an image is
+        # therefore left to a separate thread, fed through a bounded queue.
+        #
+        # With SAVE_RAW_STREAM set, the thread appends the image data to a
+        # single raw file instead, which avoids creating and encoding a file
+        # per image.
+        self._image_queue = queue.Queue(maxsize=SAVE_QUEUE_SIZE)
+        self._save_thread = threading.Thread(target=self._record_images if SAVE_RAW_STREAM else self._save_images,
+                                             daemon=True)
+        self._save_thread.start()
+
         # Release reference to camera
         del cam
 
     def OnImageEvent(self, image):
         """
-        This method defines an image event. In it, the image that triggered the
-        event is converted and saved before incrementing the count. Please see
-        Acquisition example for more in-depth comments on the acquisition
-        of images.
+        This method defines an image event. In it, a copy of the image that
+        triggered the event is queued to be converted and saved before
+        incrementing the count. Please see Acquisition example for more
+        in-depth comments on the acquisition of images.
+
+        This method is called on a thread of the SDK for every image, so it is
+        kept to the minimum: even the image information is printed by the
+        saving thread.
 
         :param image: Image from event.
         :type image: ImagePtr
@@ -85,44 +151,184 @@ class ImageEventHandler(PySpin.ImageEvent):
         """
         # Save max of _NUM_IMAGES Images
         if self._image_count < self._NUM_IMAGES:
-            print "Image event occurred..."
 
             # Check if image is incomplete
             if image.IsIncomplete():
-                print "Image incomplete with image status %i..." % image.GetImageStatus()
+                print("Image incomplete with image status %i..." % image.GetImageStatus())
 
             else:
-                # Print image info
-                print "Grabbed image %i, width = %i, height = %i" % (self._image_count,
-                                                                     image.GetWidth(),
-                                                                     image.GetHeight())
+                # Create unique filename
+                filename = self._make_name(self._image_count)
+
+                # Queue a copy of the image to be saved
+                #
+                # *** NOTES ***
+                # The image is released by the SDK once this method returns, so
+                # it is copied before being handed to the saving thread.
+                image_copy = PySpin.Image.Create(image.GetWidth(), image.GetHeight(), image.GetXOffset(),
+                                                 image.GetYOffset(), image.GetPixelFormat(), image.GetNDArray())
+                self._image_queue.put((self._image_count, filename, image_copy))
 
-                # Convert to mono8
-                image_converted = image.Convert(PySpin.PixelFormat_Mono8, PySpin.HQ_LINEAR)
+                # Increment image counter
+                self._image_count += 1
 
-                # Create unique filename and save image
-                if self._device_serial_number:
-                    filename = "ImageEvents-%s-%i.jpg" % (self._device_serial_number, self._image_count)
+                # Let the saving thread finish once all images have been queued
+                if self._image_count >= self._NUM_IMAGES:
+                    self._image_queue.put(None)
 
-                else:  # if serial number is empty
-                    filename = "ImageEvents-%i.jpg" % self._image_count
+    def _save_images(self):
+        """
+        This method converts and saves the images queued by OnImageEvent()
+        until it receives None, and then signals that all images have been saved.
 
-                image_converted.Save(filename)
+        :rtype: None
+        """
+        # Create destination image for conversions
+        #
+        # *** NOTES ***
+        # Converting into an existing image reuses its buffer instead of
+        # allocating a new image for every image converted. The buffer is
+        # allocated by the first conversion and reused after that, since all
+        # images in an acquisition have the same size.
+        image_converted = PySpin.Image.Create()
+
+        while True:
+            item = self._image_queue.get()
+            if item is None:
+                break
+
+            image_number, filename, image = item
+
+            # Print image info
+            print("Grabbed image %i, width = %i, height = %i" % (image_number, image.GetWidth(), image.GetHeight()))
+
+            try:
+                # Convert to mono8 and save image
+                #
+                # *** NOTES ***
+                # When OpenCV is installed, Mono8 and 8-bit Bayer images are
+                # converted and encoded by OpenCV straight from the image data,
+                # which is usually faster than the SDK's converter and encoder.
+                # Other pixel formats are always converted and saved by the SDK.
+                pixel_format = image.GetPixelFormat()
+                if cv2 is not None and (pixel_format == PySpin.PixelFormat_Mono8 or
+                                        pixel_format in CV2_BAYER_TO_GRAY):
+                    image_data = image.GetNDArray()
+                    if pixel_format != PySpin.PixelFormat_Mono8:
+                        image_data = cv2.cvtColor(image_data, CV2_BAYER_TO_GRAY[pixel_format])
+
+                    if not cv2.imwrite(filename, image_data):
+                        raise OSError("unable to save image at %s" % filename)
+
+                else:
+                    image.Convert(image_converted, PySpin.PixelFormat_Mono8, PySpin.HQ_LINEAR)
+                    image_converted.Save(filename)
+
+                print("Image saved at %s\n" % filename)
+
+            except Exception as ex:
+
+                # Any error, including OpenCV and file system errors, is
+                # recorded and the thread carries on with the next image, so
+                # that OnImageEvent() is never left waiting on a full queue
+                print("Error: %s" % ex)
+                self._errors.append(ex)
+
+        # Wake the main thread once all images have been saved
+        self._done.set()
+
+    def _record_images(self):
+        """
+        This method converts the images queued by OnImageEvent() to Mono8 and
+        appends their data to a single raw file until it receives None. The
+        size, pixel format and number of the images are then written to a JSON
+        file alongside it, and it signals that all images have been saved.
 
-                print "Image saved at %s\n" % filename
+        :rtype: None
+        """
+        if self._device_serial_number:
+            raw_filename = "ImageEvents-%s" % self._device_serial_number
+        else:  # if serial number is empty
+            raw_filename = "ImageEvents"
 
-                # Increment image counter
-                self._image_count += 1
+        # Create destination image for conversions; see _save_images()
+        image_converted = PySpin.Image.Create()
+
+        num_images = 0
+        width = height = 0
+
+        # Open raw file
+        #
+        # *** NOTES ***
+        # Should the file not open, the queued images are still taken off the
+        # queue below, so that OnImageEvent() is never left waiting on it.
+        try:
+            raw_file = open(raw_filename + ".raw", "wb")
+        except OSError as ex:
+            print("Error: %s" % ex)
+            self._errors.append(ex)
+            raw_file = None
+
+        while True:
+            item = self._image_queue.get()
+            if item is None:
+                break
+
+            if raw_file is None:
+                continue
+
+            _, _, image = item
+            try:
+                # Convert to mono8, unless it already is
+                if image.GetPixelFormat() != PySpin.PixelFormat_Mono8:
+                    image.Convert(image_converted, PySpin.PixelFormat_Mono8, PySpin.HQ_LINEAR)
+                    image = image_converted
+
+                # Append image data
+                image.GetNDArray().tofile(raw_file)
+
+                width, height = image.GetWidth(), image.GetHeight()
+                num_images += 1
+
+            except Exception as ex:
+                print("Error: %s" % ex)
+                self._errors.append(ex)
+
+        if raw_file is not None:
+            try:
+                raw_file.close()
+
+                with open(raw_filename + ".json", "w") as info_file:
+                    json.dump({"width": width, "height": height, "pixel_format": "Mono8", "num_images": num_images},
+                              info_file)
+
+                print("%i images saved at %s.raw\n" % (num_images, raw_filename))
+
+            except OSError as ex:
+                print("Error: %s" % ex)
+                self._errors.append(ex)
+
+        # Wake the main thread once all images have been saved
+        self._done.set()
 
     def get_image_count(self):
         """
         Getter for image count.
 
-        :return: Number of images saved.
+        :return: Number of images queued to be saved.
         :rtype: int
         """
         return self._image_count
 
+    def get_errors(self):
+        """
+        Getter for errors.
+
+        :return: Exceptions raised while saving images.
+        :rtype: list
+        """
+        return self._errors
+
     def get_max_images(self):
         """
         Getter for maximum images.
@@ -132,6 +338,17 @@ class ImageEventHandler(PySpin.ImageEvent):
         """
         return self._NUM_IMAGES
 
+    def wait(self, timeout):
+        """
+        Blocks until _NUM_IMAGES images have been saved, or the timeout expires.
+
+        :param timeout: Maximum amount of time to wait, in seconds.
+        :type timeout: float
+        :return: True if all images have been saved, False if the timeout expired.
+        :rtype: bool
+        """
+        return self._done.wait(timeout)
+
 
 def configure_image_events(cam):
     """
@@ -170,7 +387,7 @@ def configure_image_events(cam):
         cam.RegisterEvent(image_event_handler)
 
     except PySpin.SpinnakerException as ex:
-        print "Error: %s" % ex
+        print("Error: %s" % ex)
         result = False
 
     return result, image_event_handler
@@ -193,15 +410,22 @@ def wait_for_images(image_event_handler):
         #  Wait for images
         #
         #  *** NOTES ***
-        #  In order to passively capture images using image events and
-        #  automatic polling, the main thread sleeps in increments of SLEEP_DURATION ms
-        #  until _MAX_IMAGES images have been acquired and saved.
-        while image_event_handler.get_image_count() < image_event_handler.get_max_images():
-            print "\t//\n\t// Sleeping for %i ms. Grabbing images..." % SLEEP_DURATION
-            sleep(SLEEP_DURATION / 1000.0)
+        #  In order to passively capture images using image events, the main
+        #  thread blocks until the image event handler signals that _NUM_IMAGES
+        #  images have been acquired and saved. The handler runs on a thread of
+        #  the SDK, so the main thread is woken as soon as the last image is
+        #  saved, rather than on its next poll. The wait is bounded by
+        #  MAX_WAIT_DURATION, so that a camera that stops sending images
+        #  cannot hang the example.
+        print("\t//\n\t// Waiting for images. Grabbing images...")
+        if not image_event_handler.wait(MAX_WAIT_DURATION):
+            print("Timed out after %i s with %i of %i images. Aborting..." % (MAX_WAIT_DURATION,
+                                                                            image_event_handler.get_image_count(),
+                                                                            image_event_handler.get_max_images()))
+            result = False
 
     except PySpin.SpinnakerException as ex:
-        print "Error: %s" % ex
+        print("Error: %s" % ex)
         result = False
 
     return result
@@ -230,10 +454,10 @@ def reset_image_events(cam, image_event_handler):
         #  an instance of the camera (it gets deleted in the constructor already).
         cam.UnregisterEvent(image_event_handler)
 
-        print "Image events unregistered..."
+        print("Image events unregistered...")
 
     except PySpin.SpinnakerException as ex:
-        print "Error: %s" % ex
+        print("Error: %s" % ex)
         result = False
 
     return result
@@ -243,84 +467,194 @@ def print_device_info(nodemap):
     """
     This function prints the device information of the camera from the transport
     layer; please see NodeMapInfo example for more in-depth comments on printing
-    device information from the nodemap.
+    device information from the nodemap. The information of each camera is only
+    printed the first time the function is called for it.
 
     :param nodemap: Transport layer device nodemap from camera.
     :type nodemap: INodeMap
     :return: True if successful, False otherwise.
     :rtype: bool
     """
-    print "*** DEVICE INFORMATION ***"
-
     try:
         result = True
+
+        # Skip cameras whose device information has already been printed
+        node_device_serial_number = PySpin.CStringPtr(nodemap.GetNode("DeviceSerialNumber"))
+        if PySpin.IsAvailable(node_device_serial_number) and PySpin.IsReadable(node_device_serial_number):
+            device_serial_number = node_device_serial_number.GetValue()
+
+            with device_info_lock:
+                if device_serial_number in device_info_printed:
+                    return result
+
+                device_info_printed.add(device_serial_number)
+
+        print("*** DEVICE INFORMATION ***")
+
         node_device_information = PySpin.CCategoryPtr(nodemap.GetNode("DeviceInformation"))
 
         if PySpin.IsAvailable(node_device_information) and PySpin.IsReadable(node_device_information):
             features = node_device_information.GetFeatures()
+
+            # Collect all lines and write them at once
+            lines = []
             for feature in features:
                 node_feature = PySpin.CValuePtr(feature)
-                print "%s: %s" % (node_feature.GetName(),
-                                  node_feature.ToString() if PySpin.IsReadable(node_feature) else "Node not readable")
+                lines.append("%s: %s" % (node_feature.GetName(),
+                                         node_feature.ToString() if PySpin.IsReadable(node_feature)
+                                         else "Node not readable"))
+
+            sys.stdout.write("\n".join(lines) + "\n")
 
         else:
-            print "Device control information not available."
+            print("Device control information not available.")
 
     except PySpin.SpinnakerException as ex:
-        print "Error: %s" % ex.message
+        print("Error: %s" % ex)
         result = False
 
     return result
 
 
-def acquire_images(cam, nodemap, image_event_handler):
+def configure_stream_buffers(cam):
     """
-    This function passively waits for images by calling wait_for_images(). Notice that
-    this function is much shorter than the acquire_images() function of other examples.
-    This is because most of the code has been moved to the image event's OnImageEvent()
-    method.
+    This function raises the number of stream buffers and has them handled
+    oldest first, so that images are queued rather than dropped when the
+    image event handler briefly falls behind the camera.
 
-    :param cam: Camera instance to grab images from.
-    :param nodemap: Device nodemap.
-    :param image_event_handler: Image event handler.
+    :param cam: Camera to configure stream buffers for.
     :type cam: CameraPtr
-    :type nodemap: INodeMap
-    :type image_event_handler: ImageEventHandler
     :return: True if successful, False otherwise.
     :rtype: bool
     """
-    print "*** IMAGE ACQUISITION ***\n"
     try:
         result = True
 
-        # Set acquisition mode to continuous
+        # Retrieve transport layer stream nodemap
+        nodemap_tlstream = cam.GetTLStreamNodeMap()
+
+        # Set stream buffer count manually
+        node_buffer_count_mode = PySpin.CEnumerationPtr(nodemap_tlstream.GetNode("StreamBufferCountMode"))
+        if not PySpin.IsAvailable(node_buffer_count_mode) or not PySpin.IsWritable(node_buffer_count_mode):
+            print("Unable to set stream buffer count mode (enum retrieval). Non-fatal error...")
+            return False
+
+        node_buffer_count_mode_manual = node_buffer_count_mode.GetEntryByName("Manual")
+        if not PySpin.IsAvailable(node_buffer_count_mode_manual) or not PySpin.IsReadable(node_buffer_count_mode_manual):
+            print("Unable to set stream buffer count mode (entry retrieval). Non-fatal error...")
+            return False
+
+        node_buffer_count_mode.SetIntValue(node_buffer_count_mode_manual.GetValue())
+
+        node_buffer_count = PySpin.CIntegerPtr(nodemap_tlstream.GetNode("StreamBufferCountManual"))
+        if not PySpin.IsAvailable(node_buffer_count) or not PySpin.IsWritable(node_buffer_count):
+            print("Unable to set stream buffer count. Non-fatal error...")
+            return False
+
+        buffer_count = min(node_buffer_count.GetMax(), STREAM_BUFFER_COUNT)
+        node_buffer_count.SetValue(buffer_count)
+        print("Stream buffer count set to %i..." % buffer_count)
+
+        # Handle stream buffers oldest first
+        #
+        # *** NOTES ***
+        # Every image is saved, so buffers are handed to the image event
+        # handler in the order they were filled rather than newest only.
+        node_buffer_handling_mode = PySpin.CEnumerationPtr(nodemap_tlstream.GetNode("StreamBufferHandlingMode"))
+        if not PySpin.IsAvailable(node_buffer_handling_mode) or not PySpin.IsWritable(node_buffer_handling_mode):
+            print("Unable to set stream buffer handling mode (enum retrieval). Non-fatal error...")
+            return False
+
+        node_buffer_handling_mode_oldest_first = node_buffer_handling_mode.GetEntryByName("OldestFirst")
+        if not PySpin.IsAvailable(node_buffer_handling_mode_oldest_first) or not PySpin.IsReadable(
+                node_buffer_handling_mode_oldest_first):
+            print("Unable to set stream buffer handling mode (entry retrieval). Non-fatal error...")
+            return False
+
+        node_buffer_handling_mode.SetIntValue(node_buffer_handling_mode_oldest_first.GetValue())
+        print("Stream buffer handling mode set to oldest first...")
+
+    except PySpin.SpinnakerException as ex:
+        print("Error: %s" % ex)
+        result = False
+
+    return result
+
+
+def set_acquisition_mode_continuous(nodemap):
+    """
+    This function sets the acquisition mode of the camera to continuous. It is
+    called once after the camera is initialized rather than on every acquisition.
+
+    :param nodemap: Device nodemap.
+    :type nodemap: INodeMap
+    :return: True if successful, False otherwise.
+    :rtype: bool
+    """
+    try:
         node_acquisition_mode = PySpin.CEnumerationPtr(nodemap.GetNode("AcquisitionMode"))
         if not PySpin.IsAvailable(node_acquisition_mode) or not PySpin.IsWritable(node_acquisition_mode):
-            print "Unable to set acquisition mode to continuous (enum retrieval). Aborting..."
+            print("Unable to set acquisition mode to continuous (enum retrieval). Aborting...")
             return False
 
+        # *** NOTES ***
+        # Entry values come from each camera's own description file, and
+        # cameras may be run on several threads at once, so the "Continuous"
+        # entry is retrieved from every camera rather than shared between them.
         node_acquisition_mode_continuous = node_acquisition_mode.GetEntryByName("Continuous")
         if not PySpin.IsAvailable(node_acquisition_mode_continuous) or not PySpin.IsReadable(node_acquisition_mode_continuous):
-            print "Unable to set acquisition mode to continuous (entry retrieval). Aborting..."
+            print("Unable to set acquisition mode to continuous (entry retrieval). Aborting...")
             return False
 
-        acquisition_mode_continuous = node_acquisition_mode_continuous.GetValue()
-        node_acquisition_mode.SetIntValue(acquisition_mode_continuous)
+        node_acquisition_mode.SetIntValue(node_acquisition_mode_continuous.GetValue())
+
+        print("Acquisition mode set to continuous...")
+
+    except PySpin.SpinnakerException as ex:
+        print("Error: %s" % ex)
+        return False
+
+    return True
+
+
+def acquire_images(cam, image_event_handler):
+    """
+    This function passively waits for images by calling wait_for_images(). Notice that
+    this function is much shorter than the acquire_images() function of other examples.
+    This is because most of the code has been moved to the image event's OnImageEvent()
+    method.
+
+    :param cam: Camera instance to grab images from.
+    :param image_event_handler: Image event handler.
+    :type cam: CameraPtr
+    :type image_event_handler: ImageEventHandler
+    :return: True if successful, False otherwise.
+    :rtype: bool
+    """
+    print("*** IMAGE ACQUISITION ***\n")
+    try:
+        result = True
 
-        print "Acquisition mode set to continuous..."
+        # Configure stream buffers
+        result &= configure_stream_buffers(cam)
 
         # Begin acquiring images
         cam.BeginAcquisition()
 
-        print "Acquiring images..."
+        print("Acquiring images...")
 
         # Retrieve images using image event handler
-        wait_for_images(image_event_handler)
+        result &= wait_for_images(image_event_handler)
+
+        # Fail if any image could not be saved
+        if image_event_handler.get_errors():
+            print("Unable to save %i image(s)..." % len(image_event_handler.get_errors()))
+            result = False
 
         cam.EndAcquisition()
 
     except PySpin.SpinnakerException as ex:
-        print "Error: %s" % ex
+        print("Error: %s" % ex)
         result = False
 
     return result
@@ -350,13 +684,18 @@ def run_single_camera(cam):
         # Retrieve GenICam nodemap
         nodemap = cam.GetNodeMap()
 
+        # Set acquisition mode to continuous
+        if not set_acquisition_mode_continuous(nodemap):
+            cam.DeInit()
+            return False
+
         # Configure image events
         err, image_event_handler = configure_image_events(cam)
         if not err:
             return err
 
         # Acquire images using the image event handler
-        result &= acquire_images(cam, nodemap, image_event_handler)
+        result &= acquire_images(cam, image_event_handler)
 
         # Reset image events
         result &= reset_image_events(cam, image_event_handler)
@@ -365,12 +704,32 @@ def run_single_camera(cam):
         cam.DeInit()
 
     except PySpin.SpinnakerException as ex:
-        print "Error: %s" % ex
+        print("Error: %s" % ex)
         result = False
 
     return result
 
 
+def run_camera_thread(cam, index, results):
+    """
+    This function runs the example on a single camera and stores the result. It
+    is the target of the thread started for each camera by main().
+
+    :param cam: Camera to run example on.
+    :param index: Index of the camera in the camera list.
+    :param results: List in which the result is stored at the camera's index.
+    :type cam: CameraPtr
+    :type index: int
+    :type results: list
+    :rtype: None
+    """
+    print("Running example for camera %i..." % index)
+
+    results[index] = run_single_camera(cam)
+
+    print("Camera %i example complete..." % index)
+
+
 def main():
     """
     Example entry point; please see Enumeration example for additional 
@@ -389,7 +748,7 @@ def main():
     
     num_cams = cam_list.GetSize()
 
-    print "Number of cameras detected: %i" % num_cams
+    print("Number of cameras detected: %i" % num_cams)
 
     # Finish if there are no cameras
     if num_cams == 0:
@@ -399,23 +758,39 @@ def main():
         # Release system
         system.ReleaseInstance()
 
-        print "Not enough cameras!"
-        raw_input("Done! Press Enter to exit...")
+        print("Not enough cameras!")
+        input("Done! Press Enter to exit...")
+        return False
+
+    # Run example on all cameras at once
+    #
+    # *** NOTES ***
+    # Each camera is run on its own thread, so that cameras acquire images at
+    # the same time rather than one after another. Images are saved with the
+    # serial number of their camera in the filename, so cameras do not
+    # overwrite each other's images. Each thread stores its result at the
+    # index of its camera.
+    results = [False] * num_cams
+    threads = [threading.Thread(target=run_camera_thread, args=(cam_list.GetByIndex(i), i, results))
+               for i in range(num_cams)]
+
+    for thread in threads:
+        thread.start()
 
-    # Run example on each camera
-    for i in range(num_cams):
-        print "Running example for camera %i..." % i
+    for thread in threads:
+        thread.join()
 
-        result &= run_single_camera(cam_list.GetByIndex(i))
+    result &= all(results)
 
-        print "Camera %i example complete..." % i
+    # Release references to cameras held by the threads
+    del threads
 
     # Clear camera list before releasing system
     cam_list.Clear()
 
     # Release system
     system.ReleaseInstance()
-    raw_input("Done! Press Enter to exit...")
+    input("Done! Press Enter to exit...")
 
     return result
 
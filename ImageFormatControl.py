@@ -31,131 +31,233 @@
 # more complicated examples related to camera configuration: ChunkData,
 # LookupTable, Sequencer, or Trigger.
 
+import atexit
+import json
+import mmap
+import queue
+import sys
+import threading
+import time
+
 import PySpin
 
+try:
+    import cv2
+except ImportError:
+    cv2 = None
+
 NUM_IMAGES = 10  # number of images to grab
+SAVE_QUEUE_SIZE = 4  # number of images that may wait to be converted and saved
+SAVE_QUEUE_TIMEOUT = 1.0  # number of seconds between checks that the saving thread is still running
+JPEG_QUALITY = 90  # quality of the JPEG files when saved by OpenCV
+SAVE_RAW_STREAM = False  # write mono 8 image data to a single memory-mapped raw file rather than saving JPEG files
+CAMERA_LIST_LIFETIME = 5.0  # number of seconds for which get_cameras() reuses the list of cameras
+
+# OpenCV conversion codes from Bayer pixel formats to greyscale. OpenCV names
+# Bayer patterns after the second row of the sensor, so for example an RGGB
+# (BayerRG) sensor is converted with COLOR_BayerBG2GRAY.
+if cv2 is not None:
+    CV2_BAYER_TO_GRAY = {
+        PySpin.PixelFormat_BayerRG8: cv2.COLOR_BayerBG2GRAY,
+        PySpin.PixelFormat_BayerGR8: cv2.COLOR_BayerGB2GRAY,
+        PySpin.PixelFormat_BayerGB8: cv2.COLOR_BayerGR2GRAY,
+        PySpin.PixelFormat_BayerBG8: cv2.COLOR_BayerRG2GRAY,
+    }
+
+# System and list of cameras retrieved by get_cameras(); both are released by
+# release_system() when the interpreter exits.
+system = None
+cam_list = None
+cam_list_time = 0.0
+
+# Nodes retrieved by get_node(), keyed by nodemap, node name and pointer type.
+# Nodes are only valid while their camera is initialized, so the cache is
+# cleared around Init() and DeInit().
+node_cache = {}
+
+# Integer values of enumeration entries set by set_enumeration_value(), keyed
+# by camera model, enumeration node name and entry symbolic name.
+enumeration_entry_values = {}
+
+
+def get_node(nodemap, name, ptr_type):
+    """
+    Retrieves a node from the nodemap cast to the given pointer type. The node
+    is only looked up in the nodemap the first time it is requested.
 
+    :param nodemap: Nodemap to retrieve the node from.
+    :param name: Name of the node.
+    :param ptr_type: Pointer type to cast the node to, e.g. PySpin.CIntegerPtr.
+    :type nodemap: INodeMap
+    :type name: str
+    :type ptr_type: type
+    :return: Node cast to ptr_type.
+    """
+    key = (id(nodemap), name, ptr_type)
+    node = node_cache.get(key)
+    if node is None:
+        node = node_cache[key] = ptr_type(nodemap.GetNode(name))
+    return node
 
-def configure_custom_image_settings(nodemap):
+
+# Integer node settings applied by configure_custom_image_settings(), in order,
+# as (node name, "min" or "max") pairs. Offsets are set before width and height
+# so that the full sensor is available.
+IMAGE_SETTINGS = (("OffsetX", "min"),
+                  ("OffsetY", "min"),
+                  ("Width", "max"),
+                  ("Height", "max"))
+
+
+def set_enumeration_value(nodemap, name, symbolic):
     """
-    Configures a number of settings on the camera including offsets  X and Y, width,
-    height, and pixel format. These settings must be applied before BeginAcquisition()
-    is called; otherwise, they will be read only. Also, it is important to note that
-    settings are applied immediately. This means if you plan to reduce the width and
-    move the x offset accordingly, you need to apply such changes in the appropriate order.
+    Sets an enumeration node to the entry with the given symbolic name.
 
     :param nodemap: GenICam nodemap.
+    :param name: Name of the enumeration node.
+    :param symbolic: Symbolic name of the entry to set.
     :type nodemap: INodeMap
+    :type name: str
+    :type symbolic: str
     :return: True if successful, False otherwise.
     :rtype: bool
     """
-    print "\n*** CONFIGURING CUSTOM IMAGE SETTINGS *** \n"
+    # *** NOTES ***
+    # Enumeration nodes are slightly more complicated to set than other
+    # nodes. This is because setting an enumeration node requires working
+    # with two nodes instead of the usual one.
+    #
+    # As such, there are a number of steps to setting an enumeration node:
+    # retrieve the enumeration node from the nodemap, retrieve the desired
+    # entry node from the enumeration node, retrieve the integer value from
+    # the entry node, and set the new value of the enumeration node with
+    # the integer value from the entry node.
+    #
+    # Retrieve the enumeration node from the nodemap
+    node_enumeration = get_node(nodemap, name, PySpin.CEnumerationPtr)
+    if not PySpin.IsAvailable(node_enumeration) or not PySpin.IsWritable(node_enumeration):
+        print(f"{name} not available...")
+        return False
 
-    try:
-        result = True
+    # Retrieve the integer value of the desired entry
+    #
+    # *** NOTES ***
+    # The integer values of the entries come from the camera's description
+    # file, so they are the same for every camera of the same model. Each
+    # entry is only retrieved from the first camera of a model it is set on;
+    # if the model cannot be read, the entry is retrieved every time.
+    node_device_model_name = get_node(nodemap, "DeviceModelName", PySpin.CStringPtr)
+    if PySpin.IsAvailable(node_device_model_name) and PySpin.IsReadable(node_device_model_name):
+        key = (node_device_model_name.GetValue(), name, symbolic)
+        entry_value = enumeration_entry_values.get(key)
+    else:
+        key = entry_value = None
+
+    if entry_value is None:
+
+        # Retrieve the desired entry node from the enumeration node
+        node_entry = PySpin.CEnumEntryPtr(node_enumeration.GetEntryByName(symbolic))
+        if not PySpin.IsAvailable(node_entry) or not PySpin.IsReadable(node_entry):
+            print(f"{name} {symbolic} not available...")
+            return False
 
-        # Apply mono 8 pixel format
-        #
-        # *** NOTES ***
-        # Enumeration nodes are slightly more complicated to set than other
-        # nodes. This is because setting an enumeration node requires working
-        # with two nodes instead of the usual one.
-        #
-        # As such, there are a number of steps to setting an enumeration node:
-        # retrieve the enumeration node from the nodemap, retrieve the desired
-        # entry node from the enumeration node, retrieve the integer value from
-        # the entry node, and set the new value of the enumeration node with
-        # the integer value from the entry node.
-        #
-        # Retrieve the enumeration node from the nodemap
-        node_pixel_format = PySpin.CEnumerationPtr(nodemap.GetNode("PixelFormat"))
-        if PySpin.IsAvailable(node_pixel_format) and PySpin.IsWritable(node_pixel_format):
+        # Retrieve the integer value from the entry node
+        entry_value = node_entry.GetValue()
+        if key is not None:
+            enumeration_entry_values[key] = entry_value
 
-            # Retrieve the desired entry node from the enumeration node
-            node_pixel_format_mono8 = PySpin.CEnumEntryPtr(node_pixel_format.GetEntryByName("Mono8"))
-            if PySpin.IsAvailable(node_pixel_format_mono8) and PySpin.IsReadable(node_pixel_format_mono8):
+    # Set integer as new value for enumeration node
+    #
+    # *** NOTES ***
+    # A cached entry may still not be available on this camera, for example
+    # because of its current settings, in which case setting it fails.
+    try:
+        node_enumeration.SetIntValue(entry_value)
+    except PySpin.SpinnakerException:
+        print(f"{name} {symbolic} not available...")
+        return False
 
-                # Retrieve the integer value from the entry node
-                pixel_format_mono8 = node_pixel_format_mono8.GetValue()
+    print(f"{name} set to {node_enumeration.GetCurrentEntry().GetSymbolic()}...")
+    return True
 
-                # Set integer as new value for enumeration node
-                node_pixel_format.SetIntValue(pixel_format_mono8)
 
-                print "Pixel format set to %s..." % node_pixel_format.GetCurrentEntry().GetSymbolic()
+def get_writable_nodes(nodemap, nodes):
+    """
+    Retrieves the given nodes and checks that every one of them is available
+    and writable, before any of them is written to.
 
-            else:
-                print "Pixel format mono 8 not available..."
+    :param nodemap: GenICam nodemap.
+    :param nodes: Sequence of (node name, pointer type) pairs.
+    :type nodemap: INodeMap
+    :type nodes: sequence
+    :return: Dictionary of the nodes keyed by name, or None if any node is not available and writable.
+    :rtype: dict
+    """
+    writable_nodes = {}
+    for name, ptr_type in nodes:
+        node = get_node(nodemap, name, ptr_type)
+        if not PySpin.IsAvailable(node) or not PySpin.IsWritable(node):
+            print(f"{name} not available...")
+            return None
 
-        else:
-            print "Pixel format not available..."
+        writable_nodes[name] = node
 
-        # Apply minimum to offset X
-        #
-        # *** NOTES ***
-        # Numeric nodes have both a minimum and maximum. A minimum is retrieved
-        # with the method GetMin(). Sometimes it can be important to check
-        # minimums to ensure that your desired value is within range.
-        node_offset_x = PySpin.CIntegerPtr(nodemap.GetNode("OffsetX"))
-        if PySpin.IsAvailable(node_offset_x) and PySpin.IsWritable(node_offset_x):
-
-            node_offset_x.SetValue(node_offset_x.GetMin())
-            print "Offset X set to %i..." % node_offset_x.GetMin()
-            
-        else:
-            print "Offset X not available..."
+    return writable_nodes
 
-        # Apply minimum to offset Y
-        #
-        # *** NOTES ***
-        # It is often desirable to check the increment as well. The increment
-        # is a number of which a desired value must be a multiple of. Certain
-        # nodes, such as those corresponding to offsets X and Y, have an
-        # increment of 1, which basically means that any value within range
-        # is appropriate. The increment is retrieved with the method GetInc().
-        node_offset_y = PySpin.CIntegerPtr(nodemap.GetNode("OffsetY"))
-        if PySpin.IsAvailable(node_offset_y) and PySpin.IsWritable(node_offset_y):
 
-            node_offset_y.SetValue(node_offset_y.GetMin())
-            print "Offset Y set to %i..." % node_offset_y.GetMin()
+def configure_custom_image_settings(nodemap):
+    """
+    Configures a number of settings on the camera including offsets  X and Y, width,
+    height, and pixel format. These settings must be applied before BeginAcquisition()
+    is called; otherwise, they will be read only. Also, it is important to note that
+    settings are applied immediately. This means if you plan to reduce the width and
+    move the x offset accordingly, you need to apply such changes in the appropriate order.
+
+    :param nodemap: GenICam nodemap.
+    :type nodemap: INodeMap
+    :return: True if successful, False otherwise.
+    :rtype: bool
+    """
+    print("\n*** CONFIGURING CUSTOM IMAGE SETTINGS *** \n")
 
-        else:
-            print "Offset Y not available..."
+    try:
+        result = True
 
-        # Set maximum width
+        # Check that all nodes can be written to
         #
         # *** NOTES ***
-        # Other nodes, such as those corresponding to image width and height,
-        # might have an increment other than 1. In these cases, it can be
-        # important to check that the desired value is a multiple of the
-        # increment. However, as these values are being set to the maximum,
-        # there is no reason to check against the increment.
-        node_width = PySpin.CIntegerPtr(nodemap.GetNode("Width"))
-        if PySpin.IsAvailable(node_width) and PySpin.IsWritable(node_width):
-
-            width_to_set = node_width.GetMax()
-            node_width.SetValue(width_to_set)
-            print "Width set to %i..." % node_width.GetValue()
-            
-        else:
-            print "Width not available..."
+        # All nodes are checked before any of them is changed, so that the
+        # camera is not left partially configured when one of them is not
+        # available.
+        nodes = get_writable_nodes(nodemap, (("PixelFormat", PySpin.CEnumerationPtr),) +
+                                   tuple((name, PySpin.CIntegerPtr) for name, _ in IMAGE_SETTINGS))
+        if nodes is None:
+            print("Unable to configure custom image settings. Aborting...")
+            return False
+
+        # Apply mono 8 pixel format
+        result &= set_enumeration_value(nodemap, "PixelFormat", "Mono8")
 
-        # Set maximum height
+        # Apply minimum to offsets and maximum to width and height
         #
         # *** NOTES ***
-        # A maximum is retrieved with the method GetMax(). A node's minimum and
-        # maximum should always be a multiple of its increment.
-        node_height = PySpin.CIntegerPtr(nodemap.GetNode("Height"))
-        if PySpin.IsAvailable(node_height) and PySpin.IsWritable(node_height):
-
-            height_to_set = node_height.GetMax()
-            node_height.SetValue(height_to_set)
-            print "Height set to %i..." % node_height.GetValue()
-
-        else:
-            print "Height not available..."
+        # Numeric nodes have both a minimum and maximum, retrieved with the
+        # methods GetMin() and GetMax(). Sometimes it can be important to check
+        # them to ensure that your desired value is within range.
+        #
+        # It is often desirable to check the increment as well. The increment
+        # is a number of which a desired value must be a multiple of, and is
+        # retrieved with the method GetInc(). Offsets X and Y have an increment
+        # of 1, while width and height might not. However, a node's minimum and
+        # maximum should always be a multiple of its increment, so there is no
+        # reason to check against the increment here.
+        for name, limit in IMAGE_SETTINGS:
+            node = nodes[name]
+            node.SetValue(node.GetMin() if limit == "min" else node.GetMax())
+            print(f"{name} set to {node.GetValue()}...")
 
     except PySpin.SpinnakerException as ex:
-        print "Error: %s" % ex
+        print(f"Error: {ex}")
         return False
 
     return result
@@ -173,29 +275,281 @@ def print_device_info(nodemap):
     :rtype: bool
     """
 
-    print "*** DEVICE INFORMATION ***\n"
+    print("*** DEVICE INFORMATION ***\n")
 
     try:
         result = True
         node_device_information = PySpin.CCategoryPtr(nodemap.GetNode("DeviceInformation"))
 
         if PySpin.IsAvailable(node_device_information) and PySpin.IsReadable(node_device_information):
-            features = node_device_information.GetFeatures()
-            for feature in features:
+
+            # Read all features before printing any of them
+            #
+            # *** NOTES ***
+            # Reading a feature may need a round trip to the camera, so the
+            # features are all read in one pass and only formatted once that is
+            # done. They are then written in a single call rather than with a
+            # print() per feature. A feature that is not implemented is not readable either,
+            # and is not queried any further.
+            device_information = []
+            for feature in node_device_information.GetFeatures():
                 node_feature = PySpin.CValuePtr(feature)
-                print "%s: %s" % (node_feature.GetName(),
-                                  node_feature.ToString() if PySpin.IsReadable(node_feature) else "Node not readable")
+                if PySpin.IsImplemented(node_feature) and PySpin.IsReadable(node_feature):
+                    value = node_feature.ToString()
+                else:
+                    value = "Node not readable"
+                device_information.append((node_feature.GetName(), value))
+
+            sys.stdout.write("".join(f"{name}: {value}\n" for name, value in device_information))
 
         else:
-            print "Device control information not available."
+            print("Device control information not available.")
 
     except PySpin.SpinnakerException as ex:
-        print "Error: %s" % ex
+        print(f"Error: {ex}")
         return False
 
     return result
 
 
+def save_images(image_queue, errors):
+    """
+    This function converts and saves the images placed on the queue by
+    acquire_images() until it receives None. It runs on its own thread so
+    that conversion and saving do not hold up the retrieval of the next image.
+
+    :param image_queue: Queue of (image number, image, filename) tuples to save.
+    :param errors: List to which any exceptions raised while saving are appended.
+    :type image_queue: queue.Queue
+    :type errors: list
+    :rtype: None
+    """
+    # Create destination image for conversions
+    #
+    # *** NOTES ***
+    # Converting into an existing image reuses its buffer instead of
+    # allocating a new image for every image converted. The buffer is
+    # allocated by the first conversion and reused after that, since all
+    # images in an acquisition have the same size.
+    image_mono8 = PySpin.Image.Create()
+    pixel_format_mono8 = PySpin.PixelFormat_Mono8
+    color_processing = PySpin.NEAREST_NEIGHBOR
+
+    while True:
+        item = image_queue.get()
+        if item is None:
+            break
+
+        image_number, image, filename = item
+        try:
+            # Convert image to mono 8 and save it
+            #
+            #  *** NOTES ***
+            #  The standard practice of the examples is to use device
+            #  serial numbers to keep images of one device from
+            #  overwriting those of another.
+            #
+            #  When OpenCV is installed, the image data is converted and
+            #  encoded by OpenCV in one go, without creating an intermediate
+            #  SDK image; see get_mono8_data().
+            if cv2 is not None:
+                if not cv2.imwrite(filename, get_mono8_data(image, image_mono8),
+                                   [cv2.IMWRITE_JPEG_QUALITY, JPEG_QUALITY]):
+                    error = OSError(f"Unable to save image at {filename}")
+                    print(f"Error: {error}")
+                    errors.append(error)
+                    continue
+
+            else:
+                #  Convert image to mono 8
+                #
+                #  *** NOTES ***
+                #  Images can be converted between pixel formats by using
+                #  the appropriate enumeration value. Unlike the original
+                #  image, the converted one does not need to be released as
+                #  it does not affect the camera buffer.
+                #
+                #  When converting images, color processing algorithm is an
+                #  optional parameter. Nearest neighbor is the cheapest one,
+                #  which is good enough for a mono 8 result.
+                #
+                #  The pixel format is set to mono 8 by
+                #  configure_custom_image_settings(), in which case the
+                #  image is saved as it is.
+                if image.GetPixelFormat() == pixel_format_mono8:
+                    image_converted = image
+                else:
+                    image.Convert(image_mono8, pixel_format_mono8, color_processing)
+                    image_converted = image_mono8
+
+                image_converted.Save(filename)
+
+            #  Print image information; height and width recorded in pixels
+            #
+            #  *** NOTES ***
+            #  Images have quite a bit of available metadata including
+            #  things such as CRC, image status, and offset values, to
+            #  name a few.
+            #
+            #  All information on an image is written at once, rather than
+            #  with a print() per line.
+            sys.stdout.write(f"Grabbed Image {image_number}, width = {image.GetWidth()}, "
+                             f"height = {image.GetHeight()}, saved at {filename}\n\n")
+
+        except Exception as ex:
+
+            #  Any error, including file system errors, is recorded and the
+            #  thread carries on with the next image, so that the queue keeps
+            #  draining and acquisition is never left waiting on it.
+            print(f"Error: {ex}")
+            errors.append(ex)
+
+        finally:
+            #  Release image
+            #
+            #  *** NOTES ***
+            #  Images handed to this thread are released here, once they have
+            #  been saved, rather than by the acquisition loop.
+            image.Release()
+
+
+def get_mono8_data(image, image_mono8):
+    """
+    This function returns the data of an image as a mono 8 NumPy array. Mono 8
+    images are not converted at all; their data is returned as a view of the
+    image buffer. When OpenCV is installed, 8-bit Bayer images are converted by
+    OpenCV, and any other image is converted by the SDK into image_mono8.
+
+    :param image: Image to get the data of.
+    :param image_mono8: Destination image for conversions by the SDK.
+    :type image: ImagePtr
+    :type image_mono8: ImagePtr
+    :return: Mono 8 image data.
+    :rtype: numpy.ndarray
+    """
+    pixel_format = image.GetPixelFormat()
+    if pixel_format == PySpin.PixelFormat_Mono8:
+        return image.GetNDArray()
+
+    if cv2 is not None and pixel_format in CV2_BAYER_TO_GRAY:
+        return cv2.cvtColor(image.GetNDArray(), CV2_BAYER_TO_GRAY[pixel_format])
+
+    image.Convert(image_mono8, PySpin.PixelFormat_Mono8, PySpin.NEAREST_NEIGHBOR)
+    return image_mono8.GetNDArray()
+
+
+def record_images(image_queue, errors, raw_filename):
+    """
+    This function converts the images placed on the queue by acquire_images()
+    to mono 8 and writes their data to a single memory-mapped raw file until it
+    receives None. It is run instead of save_images() when SAVE_RAW_STREAM is
+    set. The file holds NUM_IMAGES images, each at the offset given by its
+    image number; their size and pixel format are written to a JSON file
+    alongside it.
+
+    :param image_queue: Queue of (image number, image, filename) tuples to record; the filenames are ignored.
+    :param errors: List to which any exceptions raised while recording are appended.
+    :param raw_filename: Filename of the raw and JSON files, without extension.
+    :type image_queue: queue.Queue
+    :type errors: list
+    :type raw_filename: str
+    :rtype: None
+    """
+    # Create destination image for conversions; see save_images()
+    image_mono8 = PySpin.Image.Create()
+
+    raw_file = raw_map = None
+    width = height = image_size = 0
+
+    try:
+        while True:
+            item = image_queue.get()
+            if item is None:
+                break
+
+            image_number, image, _ = item
+            try:
+                # Retrieve image data as mono 8
+                image_data = get_mono8_data(image, image_mono8)
+
+                # Map the raw file once the image size is known
+                #
+                # *** NOTES ***
+                # Writing into a memory-mapped file is a single copy of the
+                # image data, with no encoding. Other processes can map the
+                # same file to read the images as they are written.
+                if raw_map is None:
+                    height, width = image_data.shape
+                    image_size = width * height
+                    raw_file = open(f"{raw_filename}.raw", "w+b")
+                    try:
+                        raw_file.truncate(NUM_IMAGES * image_size)
+                        raw_map = mmap.mmap(raw_file.fileno(), NUM_IMAGES * image_size)
+                    except (OSError, ValueError):
+                        raw_file.close()
+                        raw_file = None
+                        raise
+
+                # Copy image data to its place in the file
+                offset = (image_number % NUM_IMAGES) * image_size
+                raw_map[offset:offset + image_size] = image_data
+
+                sys.stdout.write(f"Grabbed Image {image_number}, width = {width}, height = {height}, "
+                                 f"saved at {raw_filename}.raw\n\n")
+
+            except (PySpin.SpinnakerException, OSError, ValueError) as ex:
+
+                # Opening, sizing and mapping the raw file raise OSError (for
+                # example when the disk is full) and mapping an empty file
+                # raises ValueError; like SDK errors, they are recorded and the
+                # thread carries on, so that the queue keeps draining.
+                print(f"Error: {ex}")
+                errors.append(ex)
+
+            finally:
+                # Release image; see save_images()
+                image.Release()
+
+    finally:
+        if raw_map is not None:
+            raw_map.close()
+        if raw_file is not None:
+            raw_file.close()
+
+    try:
+        with open(f"{raw_filename}.json", "w") as info_file:
+            json.dump({"width": width, "height": height, "pixel_format": "Mono8", "num_images": NUM_IMAGES},
+                      info_file)
+
+    except OSError as ex:
+        print(f"Error: {ex}")
+        errors.append(ex)
+
+
+def queue_image(image_queue, item, save_thread):
+    """
+    Places an item on the queue of the saving thread, waiting while the queue
+    is full for as long as the thread is still running.
+
+    :param image_queue: Queue of the saving thread.
+    :param item: Item to queue.
+    :param save_thread: Thread that empties the queue.
+    :type image_queue: queue.Queue
+    :type item: tuple or None
+    :type save_thread: threading.Thread
+    :return: True if the item was queued, False if the saving thread has stopped.
+    :rtype: bool
+    """
+    while save_thread.is_alive():
+        try:
+            image_queue.put(item, timeout=SAVE_QUEUE_TIMEOUT)
+            return True
+        except queue.Full:
+            pass
+
+    return False
+
+
 def acquire_images(cam, nodemap, nodemap_tldevice):
     """
     This function acquires and saves 10 images from a device.
@@ -210,7 +564,7 @@ def acquire_images(cam, nodemap, nodemap_tldevice):
     :rtype: bool
     """
 
-    print "*** IMAGE ACQUISITION ***\n"
+    print("*** IMAGE ACQUISITION ***\n")
     try:
         result = True
 
@@ -233,31 +587,11 @@ def acquire_images(cam, nodemap, nodemap_tldevice):
         #  Notice that both the enumeration and the entry nodes are checked for
         #  availability and readability/writability. Enumeration nodes are
         #  generally readable and writable whereas their entry nodes are only
-        #  ever readable.
-        #
-        #  Retrieve enumeration node from nodemap
-
-        # In order to access the node entries, they have to be casted to a pointer type (CEnumerationPtr here)
-        node_acquisition_mode = PySpin.CEnumerationPtr(nodemap.GetNode("AcquisitionMode"))
-        if not PySpin.IsAvailable(node_acquisition_mode) or not PySpin.IsWritable(node_acquisition_mode):
-            print "Unable to set acquisition mode to continuous (enum retrieval). Aborting..."
+        #  ever readable. Please see set_enumeration_value() for the details.
+        if not set_enumeration_value(nodemap, "AcquisitionMode", "Continuous"):
+            print("Unable to set acquisition mode to continuous. Aborting...")
             return False
 
-        # Retrieve entry node from enumeration node
-        node_acquisition_mode_continuous = node_acquisition_mode.GetEntryByName("Continuous")
-        if not PySpin.IsAvailable(node_acquisition_mode_continuous) or not PySpin.IsReadable(
-                node_acquisition_mode_continuous):
-            print "Unable to set acquisition mode to continuous (entry retrieval). Aborting..."
-            return False
-
-        # Retrieve integer value from entry node
-        acquisition_mode_continuous = node_acquisition_mode_continuous.GetValue()
-
-        # Set integer value from entry node as new value of enumeration node
-        node_acquisition_mode.SetIntValue(acquisition_mode_continuous)
-
-        print "Acquisition mode set to continuous..."
-
         #  Begin acquiring images
         #
         #  *** NOTES ***
@@ -271,7 +605,7 @@ def acquire_images(cam, nodemap, nodemap_tldevice):
         #  Image acquisition must be ended when no more images are needed.
         cam.BeginAcquisition()
 
-        print "Acquiring images..."
+        print("Acquiring images...")
 
         #  Retrieve device serial number for filename
         #
@@ -280,98 +614,127 @@ def acquire_images(cam, nodemap, nodemap_tldevice):
         #  overwriting one another. Grabbing image IDs could also accomplish
         #  this.
         device_serial_number = ""
-        node_device_serial_number = PySpin.CStringPtr(nodemap_tldevice.GetNode("DeviceSerialNumber"))
+        node_device_serial_number = get_node(nodemap_tldevice, "DeviceSerialNumber", PySpin.CStringPtr)
         if PySpin.IsAvailable(node_device_serial_number) and PySpin.IsReadable(node_device_serial_number):
             device_serial_number = node_device_serial_number.GetValue()
-            print "Device serial number retrieved as %s..." % device_serial_number
-
-        # Retrieve, convert, and save images
-        for i in range(NUM_IMAGES):
-            try:
-
-                #  Retrieve next received image
-                #
-                #  *** NOTES ***
-                #  Capturing an image houses images on the camera buffer. Trying
-                #  to capture an image that does not exist will hang the camera.
-                #
-                #  *** LATER ***
-                #  Once an image from the buffer is saved and/or no longer
-                #  needed, the image must be released in order to keep the
-                #  buffer from filling up.
-                image_result = cam.GetNextImage()
-
-                #  Ensure image completion
-                #
-                #  *** NOTES ***
-                #  Images can easily be checked for completion. This should be
-                #  done whenever a complete image is expected or required.
-                #  Further, check image status for a little more insight into
-                #  why an image is incomplete.
-                if image_result.IsIncomplete():
-                    print "Image incomplete with image status %d ..." % image_result.GetImageStatus()
+            print(f"Device serial number retrieved as {device_serial_number}...")
+
+        # Create filename prefix, to which the image number is appended, and
+        # filename of the raw file
+        if device_serial_number:
+            filename_prefix = f"ImageFormatControl-{device_serial_number}-"
+            raw_filename = f"ImageFormatControl-{device_serial_number}"
+        else:  # if serial number is empty
+            filename_prefix = "ImageFormatControl-"
+            raw_filename = "ImageFormatControl"
+
+        # Start saving thread
+        #
+        # *** NOTES ***
+        # Converting and saving an image usually takes longer than the camera
+        # takes to deliver the next one. Images are therefore handed to a
+        # separate thread through a bounded queue, so that retrieval, conversion
+        # and saving overlap; once the queue is full, the loop below waits for
+        # the saving thread to catch up.
+        #
+        # With SAVE_RAW_STREAM set, the thread writes the image data to a
+        # single memory-mapped raw file instead, which avoids encoding the
+        # images and creating a file per image.
+        image_queue = queue.Queue(maxsize=SAVE_QUEUE_SIZE)
+        save_errors = []
+        if SAVE_RAW_STREAM:
+            save_thread = threading.Thread(target=record_images, args=(image_queue, save_errors, raw_filename))
+        else:
+            save_thread = threading.Thread(target=save_images, args=(image_queue, save_errors))
+        save_thread.start()
 
-                else:
+        # Retrieve images and queue them to be converted and saved
+        try:
+            for i in range(NUM_IMAGES):
+                try:
 
-                    #  Print image information; height and width recorded in pixels
-                    #
-                    #  *** NOTES ***
-                    #  Images have quite a bit of available metadata including
-                    #  things such as CRC, image status, and offset values, to
-                    #  name a few.
-                    width = image_result.GetWidth()
-                    height = image_result.GetHeight()
-                    print "Grabbed Image %d, width = %d, height = %d" % (i, width, height)
-
-                    #  Convert image to mono 8
+                    #  Retrieve next received image
                     #
                     #  *** NOTES ***
-                    #  Images can be converted between pixel formats by using
-                    #  the appropriate enumeration value. Unlike the original
-                    #  image, the converted one does not need to be released as
-                    #  it does not affect the camera buffer.
+                    #  Capturing an image houses images on the camera buffer. Trying
+                    #  to capture an image that does not exist will hang the camera.
                     #
-                    #  When converting images, color processing algorithm is an
-                    #  optional parameter.
-                    image_converted = image_result.Convert(PySpin.PixelFormat_Mono8, PySpin.HQ_LINEAR)
+                    #  *** LATER ***
+                    #  Once an image from the buffer is saved and/or no longer
+                    #  needed, the image must be released in order to keep the
+                    #  buffer from filling up.
+                    image_result = cam.GetNextImage()
 
-                    # Create a unique filename
-                    if device_serial_number:
-                        filename = "ImageFormatControl-%s-%d.jpg" % (device_serial_number, i)
-                    else:  # if serial number is empty
-                        filename = "ImageFormatControl-%d.jpg" % i
-
-                    # Save image
-                    #
-                    #  *** NOTES ***
-                    #  The standard practice of the examples is to use device
-                    #  serial numbers to keep images of one device from
-                    #  overwriting those of another.
-                    image_converted.Save(filename)
-                    print "Image saved at %s" % filename
-
-                    #  Release image
+                    #  Ensure image completion
                     #
                     #  *** NOTES ***
-                    #  Images retrieved directly from the camera (i.e. non-converted
-                    #  images) need to be released in order to keep from filling the
-                    #  buffer.
-                    image_result.Release()
-                    print ""
+                    #  Images can easily be checked for completion. This should be
+                    #  done whenever a complete image is expected or required.
+                    #  Further, check image status for a little more insight into
+                    #  why an image is incomplete.
+                    if image_result.IsIncomplete():
+                        print(f"Image incomplete with image status {image_result.GetImageStatus()} ...")
+
+                        #  Release image
+                        #
+                        #  *** NOTES ***
+                        #  Images retrieved directly from the camera (i.e. non-converted
+                        #  images) need to be released in order to keep from filling the
+                        #  buffer.
+                        image_result.Release()
+
+                    else:
+
+                        # Create a unique filename
+                        filename = f"{filename_prefix}{i}.jpg"
+
+                        # Queue image; it is released by the saving thread
+                        #
+                        #  *** NOTES ***
+                        #  The image itself is handed over rather than a copy,
+                        #  so that its data is not copied for every image. The
+                        #  camera's buffer is held until the image is saved.
+                        if not queue_image(image_queue, (i, image_result, filename), save_thread):
+                            print("Saving thread stopped unexpectedly. Aborting...")
+                            image_result.Release()
+                            result = False
+                            break
+
+                except PySpin.SpinnakerException as ex:
+                    print(f"Error: {ex}")
+                    result = False
+                    break
+
+        finally:
+            # Wait for all queued images to be saved
+            #
+            # *** NOTES ***
+            # The saving thread is only waited for while it is running, so
+            # that a thread that has stopped cannot keep acquisition from
+            # being ended below.
+            if queue_image(image_queue, None, save_thread):
+                save_thread.join()
+            else:
+                # Release any images left on the queue by a saving thread
+                # that has stopped
+                while not image_queue.empty():
+                    item = image_queue.get_nowait()
+                    if item is not None:
+                        item[1].Release()
 
-            except PySpin.SpinnakerException as ex:
-                print "Error: %s" % ex
-                return False
+        if save_errors:
+            result = False
 
         # End acquisition
         #
         #  *** NOTES ***
         #  Ending acquisition appropriately helps ensure that devices clean up
         #  properly and do not need to be power-cycled to maintain integrity.
+        #  It is therefore also ended when retrieving an image fails.
         cam.EndAcquisition()
 
     except PySpin.SpinnakerException as ex:
-        print "Error: %s" % ex
+        print(f"Error: {ex}")
         return False
 
     return result
@@ -396,28 +759,97 @@ def run_single_camera(cam):
         result &= print_device_info(nodemap_tldevice)
 
         # Initialize camera
+        #
+        # *** NOTES ***
+        # Cached nodes belong to the previously initialized camera and must not
+        # be used with this one.
+        node_cache.clear()
         cam.Init()
 
-        # Retrieve GenICam nodemap
-        nodemap = cam.GetNodeMap()
-
-        # Configure custom image settings
-        if not configure_custom_image_settings(nodemap):
-            return False
+        try:
+            # Retrieve GenICam nodemap
+            nodemap = cam.GetNodeMap()
 
-        # Acquire images
-        result &= acquire_images(cam, nodemap, nodemap_tldevice)
+            # Configure custom image settings
+            if not configure_custom_image_settings(nodemap):
+                result = False
 
-        # Deinitialize camera
-        cam.DeInit()
+            else:
+                # Acquire images
+                result &= acquire_images(cam, nodemap, nodemap_tldevice)
+
+        finally:
+            # Deinitialize camera
+            #
+            # *** NOTES ***
+            # A camera left initialized when the example ends may not be found
+            # again until it is unplugged, so it is deinitialized whether or
+            # not the example succeeded.
+            cam.DeInit()
+            node_cache.clear()
 
     except PySpin.SpinnakerException as ex:
-        print "Error: %s" % ex
+        print(f"Error: {ex}")
         result = False
 
     return result
 
 
+def get_cameras():
+    """
+    Retrieves the list of cameras from the system. The system is only retrieved
+    once, and the list of cameras is reused for CAMERA_LIST_LIFETIME seconds
+    before the cameras are enumerated again.
+
+    :return: List of cameras.
+    :rtype: CameraList
+    """
+    global system, cam_list, cam_list_time
+
+    # Retrieve singleton reference to system object
+    #
+    # *** NOTES ***
+    # The system is released when the interpreter exits rather than after
+    # every run, as retrieving it again is slow.
+    if system is None:
+        system = PySpin.System.GetInstance()
+        atexit.register(release_system)
+
+    # Retrieve list of cameras from the system, unless it was retrieved recently
+    now = time.monotonic()
+    if cam_list is None or now - cam_list_time >= CAMERA_LIST_LIFETIME:
+        if cam_list is not None:
+            cam_list.Clear()
+
+        cam_list = system.GetCameras()
+        cam_list_time = now
+
+    return cam_list
+
+
+def release_system():
+    """
+    Clears the list of cameras and releases the system retrieved by
+    get_cameras(). All references to cameras must have been released.
+
+    :rtype: None
+    """
+    global system, cam_list
+
+    # Clear camera list before releasing system
+    if cam_list is not None:
+        cam_list.Clear()
+        cam_list = None
+
+    # Release instance
+    if system is not None:
+        try:
+            system.ReleaseInstance()
+        except PySpin.SpinnakerException as ex:
+            print(f"Error: {ex}")
+        system = None
+
+
 def main():
     """
     Example entry point; please see Enumeration example for more in-depth
@@ -426,51 +858,39 @@ def main():
     :return: True if successful, False otherwise.
     :rtype: bool
     """
-    # Retrieve singleton reference to system object
-    system = PySpin.System.GetInstance()
-
     # Retrieve list of cameras from the system
-    cam_list = system.GetCameras()
+    cam_list = get_cameras()
 
     num_cameras = cam_list.GetSize()
 
-    print "Number of cameras detected: %d" % num_cameras
+    print(f"Number of cameras detected: {num_cameras}")
 
     # Finish if there are no cameras
     if num_cameras == 0:
-
-        # Clear camera list before releasing system
-        cam_list.Clear()
-
-        # Release system
-        system.ReleaseInstance()
-
-        print "Not enough cameras!"
-        raw_input("Done! Press Enter to exit...")
+        print("Not enough cameras!")
+        input("Done! Press Enter to exit...")
         return False
 
     # Run example on each camera
+    #
+    # *** NOTES ***
+    # Each camera is only retrieved from the list when it is its turn, and
+    # the cameras after one that fails are neither retrieved nor initialized.
+    #
+    # The camera is passed straight to run_single_camera(), so no reference
+    # to it is left to be released once the example has run on it.
+    result = True
     for i in range(num_cameras):
-        cam = cam_list.GetByIndex(i)
+        print(f"Running example for camera {i}...")
 
-        print "Running example for camera %d..." % i
+        result &= run_single_camera(cam_list.GetByIndex(i))
+        print(f"Camera {i} example complete...")
 
-        result = run_single_camera(cam)
-        print "Camera %d example complete..." % i
-
-    # Release reference to camera
-    # NOTE: Unlike the C++ examples, we cannot rely on pointer objects being automatically
-    # cleaned up when going out of scope.
-    # The usage of del is preferred to assigning the variable to None.
-    del cam
-
-    # Clear camera list before releasing system
-    cam_list.Clear()
-
-    # Release instance
-    system.ReleaseInstance()
+        if not result:
+            print("Skipping remaining cameras...")
+            break
 
-    raw_input("Done! Press Enter to exit...")
+    input("Done! Press Enter to exit...")
     return result
 
 if __name__ == "__main__":
@@ -31,9 +31,156 @@
 # demonstrate node access and to get started with the API; please see full
 # Spinnaker examples for further or specific knowledge on a topic.
 
+import concurrent.futures
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import threading
+
 import PySpin
+import numpy as np
 
 NUM_IMAGES = 10  # number of images to grab
+SAVE_THREADS = max(1, (os.cpu_count() or 1) - 1)  # number of threads converting and saving images
+SAVE_RAW_FRAMES = False  # write all images to a single raw file rather than saving them as JPEG files
+IMAGE_WAIT_TIMEOUT = 5  # number of seconds to wait for the next image before giving up
+LOW_LATENCY = False  # retrieve only the newest image each time, dropping images the example falls behind on
+
+# CPUs the process may run on, among which camera threads are pinned by
+# pin_thread(); None where the platform does not support CPU affinity.
+process_cpus = os.sched_getaffinity(0) if hasattr(os, "sched_getaffinity") else None
+
+# Messages logged for every image are only formatted if their level is
+# enabled, and are passed through a queue to a listener started in main(),
+# which writes them to stdout on its own thread.
+log_queue = queue.Queue(-1)
+log = logging.getLogger("ImageFormatControl_QuickSpin")
+log.setLevel(logging.INFO)
+log.propagate = False
+log.addHandler(logging.handlers.QueueHandler(log_queue))
+
+# Settings applied by configure_custom_image_settings(), in order, as
+# (QuickSpin node name, value) pairs. Integer nodes are set to their minimum
+# or maximum, enumeration nodes to the given entry. Offsets are set before
+# width and height so that the full sensor is available.
+IMAGE_SETTINGS = (("PixelFormat", PySpin.PixelFormat_Mono8),
+                  ("OffsetX", "min"),
+                  ("OffsetY", "min"),
+                  ("Width", "max"),
+                  ("Height", "max"))
+STREAM_BUFFER_COUNT = 20  # number of buffers the SDK may fill before images are dropped
+
+
+class ImageEventHandler(PySpin.ImageEvent):
+    """
+    This class copies the images delivered by the SDK into a frame buffer, as
+    Mono8, until the frame buffer is full. The numbers of the images copied are
+    handed to the acquisition thread through a queue, and are retrieved with
+    iter_images(). Images passed to OnImageEvent() are released by the SDK once
+    it returns, which is why they are copied.
+    """
+
+    def __init__(self, frames):
+        """
+        Constructor. Sets image counter to 0 and creates the queue of copied
+        image numbers.
+
+        :param frames: Frame buffer of shape (number of images, height, width) to copy images into.
+        :type frames: numpy.ndarray
+        :rtype: None
+        """
+        super().__init__()
+
+        self._frames = frames
+        self._image_count = 0
+        self._image_queue = queue.Queue()
+        self.errors = []
+
+        # Create destination image for conversions
+        #
+        # *** NOTES ***
+        # Converting into an existing image reuses its buffer instead of
+        # allocating a new image for every image converted. The buffer is
+        # allocated by the first conversion and reused after that.
+        self._image_mono8 = PySpin.Image.Create()
+
+    def OnImageEvent(self, image, _mono8=PySpin.PixelFormat_Mono8, _hq_linear=PySpin.HQ_LINEAR,
+                     _spinnaker_exception=PySpin.SpinnakerException, _copyto=np.copyto):
+        """
+        This method copies the image that triggered the event into the frame
+        buffer and queues its image number. It is called on a thread of the
+        SDK for every image, so it does no more than that.
+
+        The keyword arguments are not passed by the SDK; they bind the module
+        attributes used for every image to locals once, when the method is
+        defined.
+
+        :param image: Image from event.
+        :type image: ImagePtr
+        :rtype: None
+        """
+        num_images = len(self._frames)
+        if self._image_count >= num_images:
+            return
+
+        i = self._image_count
+        try:
+            # Ensure image completion
+            if image.IsIncomplete():
+                log.info("Image incomplete with image status %d...", image.GetImageStatus())
+
+            else:
+                # Print image information
+                log.info("Grabbed Image %d, width = %d, height = %d", i, image.GetWidth(), image.GetHeight())
+
+                # Copy image data to frame buffer as Mono8
+                #
+                # *** NOTES ***
+                # The pixel format is set to Mono8 by
+                # configure_custom_image_settings(), in which case the image
+                # data is copied as it is.
+                if image.GetPixelFormat() == _mono8:
+                    _copyto(self._frames[i], image.GetNDArray())
+                else:
+                    image.Convert(self._image_mono8, _mono8, _hq_linear)
+                    _copyto(self._frames[i], self._image_mono8.GetNDArray())
+
+                self._image_queue.put(i)
+
+        except _spinnaker_exception as ex:
+            log.error("Error: %s", ex)
+            self.errors.append(ex)
+
+        # Increment image counter and signal the end of the images once the
+        # frame buffer is full
+        self._image_count += 1
+        if self._image_count == num_images:
+            self._image_queue.put(None)
+
+    def iter_images(self):
+        """
+        This method yields the numbers of the images copied into the frame
+        buffer, as they are copied, until the frame buffer is full. It stops
+        early if no image arrives for IMAGE_WAIT_TIMEOUT seconds.
+
+        :return: Generator of image numbers.
+        :rtype: generator
+        """
+        while True:
+            try:
+                i = self._image_queue.get(timeout=IMAGE_WAIT_TIMEOUT)
+            except queue.Empty:
+                log.error("Error: no image received for %d seconds", IMAGE_WAIT_TIMEOUT)
+                self.errors.append(TimeoutError())
+                return
+
+            if i is None:
+                return
+
+            yield i
 
 
 def configure_custom_image_settings(cam):
@@ -50,89 +197,62 @@ def configure_custom_image_settings(cam):
     :return: True if successful, False otherwise.
     :rtype: bool
     """
-    print "\n*** CONFIGURING CUSTOM IMAGE SETTINGS ***\n"
+    print("\n*** CONFIGURING CUSTOM IMAGE SETTINGS ***\n")
 
     try:
         result = True
 
-        # Apply mono 8 pixel format
+        # Apply settings in the order of IMAGE_SETTINGS
         #
         # *** NOTES ***
         # In QuickSpin, enumeration nodes are as easy to set as other node
         # types. This is because enum values representing each entry node
-        # are added to the API.
-        if cam.PixelFormat.GetAccessMode() == PySpin.RW:
-            cam.PixelFormat.SetValue(PySpin.PixelFormat_Mono8)
-            print "Pixel format set to %s..." % cam.PixelFormat.GetCurrentEntry().GetSymbolic()
-
-        else:
-            print "Pixel format not available..."
-            result = False
-            
-        # Apply minimum to offset X
+        # are added to the API, so the pixel format is set straight from
+        # PySpin.PixelFormat_Mono8.
         #
-        # *** NOTES ***
-        # Numeric nodes have both a minimum and maximum. A minimum is retrieved
-        # with the method GetMin(). Sometimes it can be important to check
-        # minimums to ensure that your desired value is within range.
-        if cam.OffsetX.GetAccessMode() == PySpin.RW:
-            cam.OffsetX.SetValue(cam.OffsetX.GetMin())
-            print "Offset X set to %d..." % cam.OffsetX.GetValue()
-
-        else:
-            print "Offset X not available..."
-            result = False
-
-        # Apply minimum to offset Y
+        # Numeric nodes have both a minimum and maximum, retrieved with the
+        # methods GetMin() and GetMax(). Sometimes it can be important to check
+        # them to ensure that your desired value is within range.
         #
-        # *** NOTES ***
         # It is often desirable to check the increment as well. The increment
-        # is a number of which a desired value must be a multiple. Certain
-        # nodes, such as those corresponding to offsets X and Y, have an
-        # increment of 1, which basically means that any value within range
-        # is appropriate. The increment is retrieved with the method GetInc().
-        if cam.OffsetY.GetAccessMode() == PySpin.RW:
-            cam.OffsetY.SetValue(cam.OffsetY.GetMin())
-            print "Offset Y set to %d..." % cam.OffsetY.GetValue()
-
-        else:
-            print "Offset Y not available..."
-            result = False
-
-        # Set maximum width
-        #
-        # *** NOTES ***
-        # Other nodes, such as those corresponding to image width and height,
-        # might have an increment other than 1. In these cases, it can be
-        # important to check that the desired value is a multiple of the
-        # increment.
+        # is a number of which a desired value must be a multiple, and is
+        # retrieved with the method GetInc(). Offsets X and Y have an increment
+        # of 1, which basically means that any value within range is
+        # appropriate, while width and height often do not. However, a node's
+        # minimum and maximum should always be a multiple of its increment, so
+        # there is no real reason to check against the increment here.
         #
-        # This is often the case for width and height nodes. However, because
-        # these nodes are being set to their maximums, there is no real reason
-        # to check against the increment.
-        if cam.Width.GetAccessMode() == PySpin.RW and cam.Width.GetInc() != 0 and cam.Width.GetMax != 0:
-            cam.Width.SetValue(cam.Width.GetMax())
-            print "Width set to %i..." % cam.Width.GetValue()
+        # Each QuickSpin node is retrieved from the camera once and kept in a
+        # local, rather than through the camera for every call on it.
+        for name, value in IMAGE_SETTINGS:
+            node = getattr(cam, name)
+            if node.GetAccessMode() != PySpin.RW:
+                print("%s not available..." % name)
+                result = False
+                continue
 
-        else:
-            print "Width not available..."
-            result = False
+            if isinstance(value, str):
+                # Set minimum or maximum of an integer node
+                if value == "min":
+                    value_to_set = node.GetMin()
+                else:
+                    value_to_set = node.GetMax() if node.GetInc() != 0 else 0
 
-        # Set maximum height
-        #
-        # *** NOTES ***
-        # A maximum is retrieved with the method GetMax(). A node's minimum and
-        # maximum should always be a multiple of its increment.
-        if cam.Height.GetAccessMode() == PySpin.RW and cam.Height.GetInc() != 0 and cam.Height.GetMax != 0:
-            cam.Height.SetValue(cam.Height.GetMax())
-            print "Height set to %i..." % cam.Height.GetValue()
+                if value_to_set == 0 and value == "max":
+                    print("%s not available..." % name)
+                    result = False
+                    continue
 
-        else:
-            print "Height not available..."
-            result = False
+                node.SetValue(value_to_set)
+                print("%s set to %d..." % (name, value_to_set))
+
+            else:
+                # Set entry of an enumeration node
+                node.SetValue(value)
+                print("%s set to %s..." % (name, node.GetCurrentEntry().GetSymbolic()))
 
     except PySpin.SpinnakerException as ex:
-        print "Error: %s" % ex
+        print("Error: %s" % ex)
         return False
 
     return result
@@ -150,7 +270,7 @@ def print_device_info(cam):
     :rtype: bool
     """
 
-    print "\n*** DEVICE INFORMATION ***\n"
+    print("\n*** DEVICE INFORMATION ***\n")
 
     try:
         result = True
@@ -159,111 +279,308 @@ def print_device_info(cam):
         node_device_information = PySpin.CCategoryPtr(nodemap.GetNode("DeviceInformation"))
 
         if PySpin.IsAvailable(node_device_information) and PySpin.IsReadable(node_device_information):
-            features = node_device_information.GetFeatures()
-            for feature in features:
-                node_feature = PySpin.CValuePtr(feature)
-                print "%s: %s" % (node_feature.GetName(),
-                                  node_feature.ToString() if PySpin.IsReadable(node_feature) else "Node not readable")
+            # Print all features in a single write
+            #
+            # *** NOTES ***
+            # Cameras are run on their own threads, so writing all device
+            # information at once also keeps it from being interleaved with
+            # the output of other cameras.
+            is_readable = PySpin.IsReadable
+            value_ptr = PySpin.CValuePtr
+            lines = []
+            for feature in node_device_information.GetFeatures():
+                node_feature = value_ptr(feature)
+                lines.append("%s: %s" % (node_feature.GetName(),
+                                         node_feature.ToString() if is_readable(node_feature) else "Node not readable"))
+
+            sys.stdout.write("\n".join(lines) + "\n")
 
         else:
-            print "Device control information not available."
+            print("Device control information not available.")
 
     except PySpin.SpinnakerException as ex:
-        print "Error: %s" % ex.message
+        print("Error: %s" % ex)
         return False
 
     return result
 
 
-def acquire_images(cam):
+def configure_stream_buffers(cam, low_latency):
+    """
+    This function raises the number of stream buffers and sets how they are
+    handled. By default, buffers are handled oldest first, so that images are
+    queued rather than dropped when the application briefly falls behind the
+    camera. For low latency, only the newest image is handed to the
+    application, and older images are dropped.
+
+    :param cam: Camera to configure stream buffers for.
+    :param low_latency: Whether to hand only the newest image to the application.
+    :type cam: CameraPtr
+    :type low_latency: bool
+    :return: True if successful, False otherwise.
+    :rtype: bool
+    """
+    try:
+        result = True
+
+        # Set stream buffer count manually
+        #
+        # *** NOTES ***
+        # Stream buffer nodes belong to the transport layer stream, which
+        # QuickSpin makes available through the camera's TLStream property.
+        if cam.TLStream.StreamBufferCountMode.GetAccessMode() != PySpin.RW \
+                or cam.TLStream.StreamBufferCountManual.GetAccessMode() != PySpin.RW:
+            print("Unable to set stream buffer count. Non-fatal error...")
+            return False
+
+        cam.TLStream.StreamBufferCountMode.SetValue(PySpin.StreamBufferCountMode_Manual)
+
+        buffer_count = min(cam.TLStream.StreamBufferCountManual.GetMax(), STREAM_BUFFER_COUNT)
+        cam.TLStream.StreamBufferCountManual.SetValue(buffer_count)
+        print("Stream buffer count set to %d..." % buffer_count)
+
+        # Set stream buffer handling mode
+        if cam.TLStream.StreamBufferHandlingMode.GetAccessMode() != PySpin.RW:
+            print("Unable to set stream buffer handling mode. Non-fatal error...")
+            return False
+
+        if low_latency:
+            cam.TLStream.StreamBufferHandlingMode.SetValue(PySpin.StreamBufferHandlingMode_NewestOnly)
+            print("Stream buffer handling mode set to newest only...")
+        else:
+            cam.TLStream.StreamBufferHandlingMode.SetValue(PySpin.StreamBufferHandlingMode_OldestFirst)
+            print("Stream buffer handling mode set to oldest first...")
+
+    except PySpin.SpinnakerException as ex:
+        print("Error: %s" % ex)
+        result = False
+
+    return result
+
+
+def save_image(image_data, filename):
+    """
+    This function saves the Mono8 data of an image retrieved by
+    acquire_images(). It runs on a thread of the saving pool so that encoding
+    and saving do not hold up the retrieval of the next image.
+
+    :param image_data: Mono8 image data to save.
+    :param filename: Filename to save the image at.
+    :type image_data: numpy.ndarray
+    :type filename: str
+    :return: True if successful, False otherwise.
+    :rtype: bool
+    """
+    try:
+        # Save image
+        height, width = image_data.shape
+        image = PySpin.Image.Create(width, height, 0, 0, PySpin.PixelFormat_Mono8, image_data)
+        image.Save(filename)
+
+        log.info("Image saved at %s", filename)
+
+    except Exception as ex:
+
+        # Any error, including file system errors, fails this image only, so
+        # that it is not raised again when the result is collected
+        log.error("Error: %s", ex)
+        return False
+
+    return True
+
+
+def write_raw_file(filename, data):
+    """
+    This function writes the data of an array to a raw file. The data is
+    written straight from the array to the file descriptor, without being
+    copied to a bytes object or going through a buffered file object.
+
+    :param filename: Filename to write the data at.
+    :param data: C-contiguous array to write.
+    :type filename: str
+    :type data: numpy.ndarray
+    :rtype: None
+    """
+    fd = os.open(filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        # os.write() may write less than it is given, so write until all data
+        # has been written
+        view = memoryview(data).cast("B")
+        while view:
+            view = view[os.write(fd, view):]
+
+    finally:
+        os.close(fd)
+
+
+def acquire_images(cam, low_latency=False, cpu_index=None):
     """
     This function acquires and saves 10 images from a device; please see
     Acquisition example for more in-depth comments on the acquisition of images.
 
     :param cam: Camera to acquire images from.
+    :param low_latency: Whether to retrieve only the newest image each time,
+                        dropping images the example falls behind on.
+    :param cpu_index: Index used to choose a CPU to pin the calling thread to
+                      once acquisition has begun, or None to leave it unpinned.
     :type cam: CameraPtr
+    :type low_latency: bool
+    :type cpu_index: int
     :return: True if successful, False otherwise.
     :rtype: bool
     """
-    print "\n*** IMAGE ACQUISITION ***\n"
+    print("\n*** IMAGE ACQUISITION ***\n")
 
     try:
         result = True
 
         # Set acquisition mode to continuous
         if cam.AcquisitionMode.GetAccessMode() != PySpin.RW:
-            print "Unable to set acquisition mode to continuous. Aborting..."
+            print("Unable to set acquisition mode to continuous. Aborting...")
             return False
 
         cam.AcquisitionMode.SetValue(PySpin.AcquisitionMode_Continuous)
-        print "Acquisition mode set to continuous..."
+        print("Acquisition mode set to continuous...")
 
-        # Begin acquiring images
-        cam.BeginAcquisition()
+        # Configure stream buffers
+        result &= configure_stream_buffers(cam, low_latency)
 
-        print "Acquiring images..."
+        # Allocate frame buffer
+        #
+        # *** NOTES ***
+        # The data of every image is copied into one array allocated up front,
+        # so that images need not be kept once they are delivered, without
+        # allocating memory for each of them.
+        frames = np.empty((NUM_IMAGES, cam.Height.GetValue(), cam.Width.GetValue()), dtype=np.uint8)
+        complete_frames = []
 
         # Get device serial number for filename
         device_serial_number = ""
         if cam.TLDevice.DeviceSerialNumber is not None and cam.TLDevice.DeviceSerialNumber.GetAccessMode() == PySpin.RO:
             device_serial_number = cam.TLDevice.DeviceSerialNumber.GetValue()
 
-            print "Device serial number retrieved as %s..." % device_serial_number
+            print("Device serial number retrieved as %s..." % device_serial_number)
 
-        # Retrieve, convert, and save images
-        for i in range(NUM_IMAGES):
+        # Register image event handler
+        #
+        # *** NOTES ***
+        # Images are delivered to the handler by the SDK as they arrive,
+        # rather than being polled for with GetNextImage(), and are copied into
+        # the frame buffer on the SDK's thread. Please see ImageEvents example
+        # for more in-depth comments on image events.
+        image_event_handler = ImageEventHandler(frames)
+        cam.RegisterEvent(image_event_handler)
+
+        try:
+            # Begin acquiring images
+            cam.BeginAcquisition()
+
+            print("Acquiring images...")
+
+            # Pin thread to a CPU of its own
+            #
+            # *** NOTES ***
+            # The thread is only pinned once the image event handler is
+            # registered and acquisition has begun, so that the threads the
+            # SDK starts to deliver images, which copy every image, do not
+            # inherit the single CPU. The saving threads started below are
+            # unpinned again, so that they can run on any CPU.
+            if cpu_index is not None:
+                pin_thread(cpu_index)
 
             try:
-                # Retrieve next received image and ensure image completion
-                image_result = cam.GetNextImage()
-
-                if image_result.IsIncomplete():
-                    print "Image incomplete with image status %d..." % image_result.GetImageStatus()
+                # Start pool of saving threads
+                #
+                # *** NOTES ***
+                # Encoding and saving an image takes longer than retrieving it.
+                # Images are therefore handed to a pool of threads, one per
+                # spare core, which save them while the next images are
+                # retrieved.
+                #
+                # With SAVE_RAW_FRAMES set, no images are saved by the pool;
+                # the frame buffer is written to a single raw file once all
+                # images are retrieved.
+                save_futures = []
+
+                # Hand images over to be saved as the handler copies them
+                with concurrent.futures.ThreadPoolExecutor(max_workers=SAVE_THREADS,
+                                                           initializer=unpin_thread) as executor:
+                    for i in image_event_handler.iter_images():
+                        complete_frames.append(i)
+
+                        if not SAVE_RAW_FRAMES:
+                            # Create a unique filename
+                            if device_serial_number:
+                                filename = "ImageFormatControlQS-%s-%d.jpg" % (device_serial_number, i)
+                            else:
+                                filename = "ImageFormatControlQS-%d.jpg" % i
+
+                            # Hand image data over to be saved
+                            save_futures.append(executor.submit(save_image, frames[i], filename))
+
+                # Leaving the pool above waits for all images to be saved
+                result &= all(future.result() for future in save_futures)
+
+                if image_event_handler.errors:
+                    result = False
+
+            finally:
+                # End acquisition
+                #
+                # *** NOTES ***
+                # Acquisition is ended even if saving an image fails, so that
+                # the camera is not left streaming.
+                cam.EndAcquisition()
+
+        finally:
+            # Unregister image event handler
+            cam.UnregisterEvent(image_event_handler)
+            del image_event_handler
+
+        # Write complete images to a single raw file
+        #
+        # *** NOTES ***
+        # The raw file holds the Mono8 data of the complete images one after
+        # another, without any encoding; their size and number are written to
+        # a JSON file alongside it.
+        if SAVE_RAW_FRAMES:
+            if device_serial_number:
+                raw_filename = "ImageFormatControlQS-%s" % device_serial_number
+            else:
+                raw_filename = "ImageFormatControlQS"
 
+            try:
+                if len(complete_frames) == NUM_IMAGES:
+                    write_raw_file(raw_filename + ".raw", frames)
                 else:
-                    # Print image information
-                    width = image_result.GetWidth()
-                    height = image_result.GetHeight()
-                    print "Grabbed Image %d, width = %d, height = %d" % (i, width, height)
-
-                    # Convert image to Mono8
-                    image_converted = image_result.Convert(PySpin.PixelFormat_Mono8)
-
-                    # Create a unique filename
-                    if device_serial_number:
-                        filename = "ImageFormatControlQS-%s-%d.jpg" % (device_serial_number, i)
-                    else:
-                        filename = "ImageFormatControlQS-%d.jpg" % i
+                    write_raw_file(raw_filename + ".raw", frames[complete_frames])
 
-                    # Save image
-                    image_converted.Save(filename)
+                with open(raw_filename + ".json", "w") as info_file:
+                    json.dump({"width": frames.shape[2], "height": frames.shape[1], "pixel_format": "Mono8",
+                               "num_images": len(complete_frames)}, info_file)
 
-                    print "Image saved at %s" % filename
+                print("%d images saved at %s.raw" % (len(complete_frames), raw_filename))
 
-                # Release image
-                image_result.Release()
-
-            except PySpin.SpinnakerException as ex:
-                print "Error: %s" % ex
+            except OSError as ex:
+                print("Error: %s" % ex)
                 result = False
 
-        # End acquisition
-        cam.EndAcquisition()
-
     except PySpin.SpinnakerException as ex:
-        print "Error: %s" % ex
+        print("Error: %s" % ex)
         result = False
 
     return result
 
 
-def run_single_camera(cam):
+def run_single_camera(cam, cpu_index=None):
     """
      This function acts as the body of the example; please see NodeMapInfo_QuickSpin example for more
      in-depth comments on setting up cameras.
 
      :param cam: Camera to run example on.
+     :param cpu_index: Index used to choose a CPU to pin the calling thread to during acquisition, or None.
      :type cam: CameraPtr
+     :type cpu_index: int
      :return: True if successful, False otherwise.
      :rtype: bool
     """
@@ -279,7 +596,7 @@ def run_single_camera(cam):
             return False
 
         # Acquire images
-        result &= acquire_images(cam)
+        result &= acquire_images(cam, LOW_LATENCY, cpu_index)
 
         # Deinitialize camera
         cam.DeInit()
@@ -287,10 +604,69 @@ def run_single_camera(cam):
         return result
 
     except PySpin.SpinnakerException as ex:
-        print "Error: %s" % ex
+        print("Error: %s" % ex)
         return False
 
 
+def pin_thread(index):
+    """
+    This function pins the calling thread to one of the CPUs the process may
+    run on, chosen by index, so that the scheduler does not move it between
+    CPUs. It is only applied where the platform supports it (Linux).
+
+    :param index: Index used to choose the CPU, e.g. the index of a camera.
+    :type index: int
+    :rtype: None
+    """
+    if process_cpus is None:
+        return
+
+    cpus = sorted(process_cpus)
+    try:
+        os.sched_setaffinity(0, {cpus[index % len(cpus)]})
+    except OSError:
+        pass
+
+
+def unpin_thread():
+    """
+    This function lets the calling thread run on all CPUs the process may run
+    on again. Threads inherit the CPUs of the thread that started them, so it
+    is run by threads started from a pinned thread.
+
+    :rtype: None
+    """
+    if process_cpus is None:
+        return
+
+    try:
+        os.sched_setaffinity(0, process_cpus)
+    except OSError:
+        pass
+
+
+def run_camera_thread(cam, index, results):
+    """
+    This function runs the example on a single camera and stores the result. It
+    is the target of the thread started for each camera by main().
+
+    :param cam: Camera to run example on.
+    :param index: Index of the camera in the camera list.
+    :param results: List in which the result is stored at the camera's index.
+    :type cam: CameraPtr
+    :type index: int
+    :type results: list
+    :rtype: None
+    """
+    print("Running example for camera %d..." % index)
+
+    # Each camera thread is pinned to one CPU, chosen by the index of its
+    # camera, once acquisition has begun; see acquire_images()
+    results[index] = run_single_camera(cam, index)
+
+    print("Camera %d example complete..." % index)
+
+
 def main():
     """
     Example entry point; please see Enumeration_QuickSpin example for more
@@ -307,7 +683,7 @@ def main():
 
     num_cameras = cam_list.GetSize()
 
-    print "Number of cameras detected: %d" % num_cameras
+    print("Number of cameras detected: %d" % num_cameras)
 
     # Finish if there are no cameras
     if num_cameras == 0:
@@ -317,17 +693,42 @@ def main():
         # Release system
         system.ReleaseInstance()
 
-        print "Not enough cameras!"
-        raw_input("Done! Press Enter to exit...")
+        print("Not enough cameras!")
+        input("Done! Press Enter to exit...")
         return False
 
-    # Release example on each camera
-    for i in range(num_cameras):
-        print "Running example for camera %d..." % i
+    # Run example on all cameras at once
+    #
+    # *** NOTES ***
+    # Each camera is run on its own thread, so that cameras acquire and save
+    # images at the same time rather than one after another. Images are saved
+    # with the serial number of their camera in the filename, so cameras do
+    # not overwrite each other's images. Each thread stores its result at the
+    # index of its camera.
+    #
+    # Threads are used rather than processes, as cameras cannot be passed to
+    # another process.
+    #
+    # Messages logged while the cameras run are written by the log listener.
+    log_listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler(sys.stdout))
+    log_listener.start()
+
+    results = [False] * num_cameras
+    threads = [threading.Thread(target=run_camera_thread, args=(cam_list.GetByIndex(i), i, results))
+               for i in range(num_cameras)]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    log_listener.stop()
 
-        result = run_single_camera(cam_list.GetByIndex(i))
+    result = all(results)
 
-        print "Camera %d example complete..." % i
+    # Release references to cameras held by the threads
+    del threads
 
     # Clear camera list before releasing system
     cam_list.Clear()
@@ -335,7 +736,7 @@ def main():
     # Release system
     system.ReleaseInstance()
 
-    raw_input("Done! Press Enter to exit...")
+    input("Done! Press Enter to exit...")
     return result
 
 if __name__ == "__main__":
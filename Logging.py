@@ -29,6 +29,11 @@
 #  	define any properties, parameters, and the event itself while LoggingEvent
 #  	allows the child class to appropriately interface with the Spinnaker SDK.
 
+import logging
+import logging.handlers
+import queue
+import sys
+
 import PySpin
 
 
@@ -36,6 +41,36 @@ import PySpin
 # information on logging level philosophy.
 LOGGING_LEVEL = PySpin.LOG_LEVEL_DEBUG  # change to any LOG_LEVEL_* constant
 
+# Logging events are logged through a queue; a listener started in main()
+# writes them to stdout on its own thread, so that the logging event handler
+# does not wait on the console.
+log_queue = queue.Queue(-1)
+log = logging.getLogger("Logging")
+log.setLevel(logging.DEBUG)
+log.propagate = False
+log.addHandler(logging.handlers.QueueHandler(log_queue))
+
+
+def get_log_level(priority):
+    """
+    This function maps the priority of a Spinnaker logging event to the Python
+    logging level it is logged at.
+
+    :param priority: Priority value of the logging event.
+    :type priority: int
+    :return: Python logging level.
+    :rtype: int
+    """
+    if priority <= PySpin.LOG_LEVEL_CRIT:
+        return logging.CRITICAL
+    if priority <= PySpin.LOG_LEVEL_ERROR:
+        return logging.ERROR
+    if priority <= PySpin.LOG_LEVEL_WARN:
+        return logging.WARNING
+    if priority <= PySpin.LOG_LEVEL_INFO:
+        return logging.INFO
+    return logging.DEBUG
+
 
 class LoggingEventHandler(PySpin.LoggingEvent):
     """
@@ -47,7 +82,7 @@ class LoggingEventHandler(PySpin.LoggingEvent):
     """
 
     def __init__(self):
-        super(LoggingEventHandler, self).__init__()
+        super().__init__()
 
     def OnLogEvent(self, logging_event_data):
         """
@@ -57,15 +92,42 @@ class LoggingEventHandler(PySpin.LoggingEvent):
         :type logging_event_data: LoggingEventData
         :rtype: None
         """
-        print "--------Log Event Received----------"
-        print "Category: %s" % logging_event_data.GetCategoryName()
-        print "Priority Value: %s" % logging_event_data.GetPriority()
-        print "Priority Name: %s" % logging_event_data.GetPriorityName()
-        print "Timestamp: %s" % logging_event_data.GetTimestamp()
-        print "NDC: %s" % logging_event_data.GetNDC()
-        print "Thread: %s" % logging_event_data.GetThreadName()
-        print "Message: %s" % logging_event_data.GetLogMessage()
-        print "------------------------------------\n"
+        # Ignore events below the logging level
+        #
+        # *** NOTES ***
+        # Events may still be delivered for a short while after the logging
+        # level is raised. Lower priority events have higher priority values,
+        # so anything with a value above LOGGING_LEVEL is dropped before any
+        # other information is retrieved.
+        priority = logging_event_data.GetPriority()
+        if priority > LOGGING_LEVEL:
+            return
+
+        # Retrieve logging information
+        category_name = logging_event_data.GetCategoryName()
+        priority_name = logging_event_data.GetPriorityName()
+        timestamp = logging_event_data.GetTimestamp()
+        ndc = logging_event_data.GetNDC()
+        thread_name = logging_event_data.GetThreadName()
+        log_message = logging_event_data.GetLogMessage()
+
+        # Log logging information
+        #
+        # *** NOTES ***
+        # Logging events can be very frequent at the debug level, so each event
+        # is logged as a single message, which is written to stdout by the log
+        # listener rather than on the thread delivering the events.
+        log.log(get_log_level(priority),
+                "--------Log Event Received----------\n"
+                "Category: %s\n"
+                "Priority Value: %s\n"
+                "Priority Name: %s\n"
+                "Timestamp: %s\n"
+                "NDC: %s\n"
+                "Thread: %s\n"
+                "Message: %s\n"
+                "------------------------------------\n",
+                category_name, priority, priority_name, timestamp, ndc, thread_name, log_message)
 
 
 def main():
@@ -78,6 +140,10 @@ def main():
     :rtype: None
     """
 
+    # Start log listener, which writes the logging events to stdout
+    log_listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler(sys.stdout))
+    log_listener.start()
+
     # Retrieve singleton reference to system object
     system = PySpin.System.GetInstance()
 
@@ -105,7 +171,7 @@ def main():
 
     num_cams = cam_list.GetSize()
 
-    print "Number of cameras detected: %i" % num_cams
+    print("Number of cameras detected: %i" % num_cams)
 
     # Clear camera list before releasing system
     cam_list.Clear()
@@ -119,7 +185,9 @@ def main():
     # Release system
     system.ReleaseInstance()
 
-    raw_input("Done! Press Enter to exit...")
+    log_listener.stop()
+
+    input("Done! Press Enter to exit...")
 
 
 if __name__ == "__main__":
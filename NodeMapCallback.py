@@ -28,66 +28,93 @@
 #  Once comfortable with NodeMapCallback, we suggest checking out any of the
 #  events examples: DeviceEvents, EnumerationEvents, ImageEvents, or Logging.
 
+import collections
+
 import PySpin
 
+# Messages queued by the node callbacks and printed later by
+# print_callback_messages; bounded so a node firing in bursts cannot grow it
+# without limit.
+callback_messages = collections.deque(maxlen=1024)
+
+# GainAuto entry values, resolved once per camera in run_single_camera so that
+# switching automatic gain is a single SetIntValue call.
+gain_auto_off = None
+gain_auto_continuous = None
 
-class HeightNodeCallback(PySpin.NodeCallback):
+
+class NodeChangeCallback(PySpin.NodeCallback):
     """
-    This is the first of two callback classes.  This callback will be registered to the height node.
+    This callback class is registered to both the height and the gain node; each instance is given the pointer type
+    to cast its node to, along with a label and a format for the new value.
     Node callbacks must inherit from NodeCallback, and must implement CallbackFunction with the same function signature.
 
     NOTE: Instances of callback classes must not go out of scope until they are deregistered, otherwise segfaults
     will occur.
     """
-    def __init__(self):
-        super(HeightNodeCallback, self).__init__()
+    def __init__(self, cast_ctor, label, fmt):
+        """
+        :param cast_ctor: Node pointer type used to read the node value, e.g. CIntegerPtr.
+        :param label: Name of the node, used in the callback message.
+        :param fmt: Format for the node value, e.g. "%d".
+        :type cast_ctor: type
+        :type label: str
+        :type fmt: str
+        """
+        super().__init__()
+        self._cast = cast_ctor
+        self._label = label
+        self._fmt = "%s callback message:\n\tLook! %s changed to " + fmt + "...\n"
 
     def CallbackFunction(self, node):
         """
-        This function gets called when the height node changes and triggers a callback.
+        This function gets called when the node changes and triggers a callback.
 
-        :param node: Height node.
+        :param node: Node the callback is registered to.
         :type node: INode
         :rtype: None
         """
-        node_height = PySpin.CIntegerPtr(node)
-        print "Height callback message:\n\tLook! Height changed to %f...\n" % node_height.GetValue()
+        # Queue the new value
+        #
+        # *** NOTES ***
+        # The callback only records the new value; printing is left to
+        # print_callback_messages so that the callback returns to the driver
+        # without waiting on console output.
+        callback_messages.append((self._fmt, self._label, self._cast(node).GetValue()))
 
 
-class GainNodeCallback(PySpin.NodeCallback):
-    """
-    This is the second callback class, registered to the gain node.
+def print_callback_messages():
     """
-    def __init__(self):
-        super(GainNodeCallback, self).__init__()
+    This function prints and removes the messages queued by the node callbacks.
+    Node callbacks run within the SetValue() call that triggers them, so their
+    messages are queued by the time SetValue() returns.
 
-    def CallbackFunction(self, node):
-        """
-        This function gets called when the gain node changes and triggers a callback.
-
-        :param node: Gain node.
-        :type node: INode
-        :rtype: None
-        """
-        node_gain = PySpin.CFloatPtr(node)
-        print "Gain callback message:\n\tLook! Gain changed to %f...\n" % node_gain.GetValue()
+    :rtype: None
+    """
+    while callback_messages:
+        fmt, label, value = callback_messages.popleft()
+        print(fmt % (label, label, value))
 
 
-def configure_callbacks(nodemap):
+def configure_callbacks(node_height, node_gain, node_gain_auto):
     """
     This function sets up the example by disabling automatic gain, creating the callbacks, and registering them to
     their specific nodes.
 
-    :param nodemap: Device nodemap.
-    :type nodemap: INodeMap
+    :param node_height: Height node.
+    :param node_gain: Gain node.
+    :param node_gain_auto: GainAuto node.
+    :type node_height: CIntegerPtr
+    :type node_gain: CFloatPtr
+    :type node_gain_auto: CEnumerationPtr
     :returns: tuple (result, callback_height, callback_gain)
         WHERE
         result is True if successful, False otherwise
-        callback_height is the HeightNodeCallback instance registered to the height node
-        callback_gain is the GainNodeCallback instance registered to the gain node
-    :rtype: (bool, HeightNodeCallback, GainNodeCallback)
+        callback_height is the NodeChangeCallback instance registered to the height node
+        callback_gain is the NodeChangeCallback instance registered to the gain node
+    :rtype: (bool, NodeChangeCallback, NodeChangeCallback)
     """
-    print "\n*** CONFIGURING CALLBACKS ***\n"
+    print("\n*** CONFIGURING CALLBACKS ***\n")
     try:
         result = True
 
@@ -100,18 +127,8 @@ def configure_callbacks(nodemap):
         # *** LATER ***
         # Automatic exposure is turned off at the end of the example in order
         # to restore the camera to its default state.
-        node_gain_auto = PySpin.CEnumerationPtr(nodemap.GetNode("GainAuto"))
-        if not PySpin.IsAvailable(node_gain_auto) or not PySpin.IsWritable(node_gain_auto):
-            print "Unable to disable automatic gain (node retrieval). Aborting..."
-            return False
-
-        node_gain_auto_off = PySpin.CEnumEntryPtr(node_gain_auto.GetEntryByName("Off"))
-        if not PySpin.IsAvailable(node_gain_auto_off) or not PySpin.IsReadable(node_gain_auto_off):
-            print "Unable to disable automatic gain (enum entry retrieval). Aborting..."
-            return False
-
-        node_gain_auto.SetIntValue(node_gain_auto_off.GetValue())
-        print "Automatic gain disabled..."
+        node_gain_auto.SetIntValue(gain_auto_off)
+        print("Automatic gain disabled...")
 
         # Register callback to height node
         #
@@ -124,60 +141,47 @@ def configure_callbacks(nodemap):
         # *** LATER ***
         # Each callback needs to be unregistered individually before releasing
         # the system or an exception will be thrown.
-        node_height = PySpin.CIntegerPtr(nodemap.GetNode("Height"))
-        if not PySpin.IsAvailable(node_height) or not PySpin.IsWritable(node_height):
-            print "Unable to retrieve height. Aborting...\n"
-            return False
-
-        print "Height ready..."
-
-        callback_height = HeightNodeCallback()
+        callback_height = NodeChangeCallback(PySpin.CIntegerPtr, "Height", "%d")
         PySpin.RegisterNodeCallback(node_height.GetNode(), callback_height)
 
-        print "Height callback registered..."
+        print("Height callback registered...")
 
         # Register callback to gain node
         #
         # *** NOTES ***
         # Depending on the specific goal of the function, it can be important
-        # to notice the node type that a callback is registered to. Notice in
-        # the callback functions above that the callback registered to height
-        # casts its node as an integer whereas the callback registered to gain
-        # casts as a float.
+        # to notice the node type that a callback is registered to. Notice
+        # that the callback registered to height casts its node as an integer
+        # whereas the callback registered to gain casts as a float.
         #
         # *** LATER ***
         # Each callback needs to be unregistered individually before releasing
         # the system or an exception will be thrown.
-        node_gain = PySpin.CFloatPtr(nodemap.GetNode("Gain"))
-        if not PySpin.IsAvailable(node_gain) or not PySpin.IsWritable(node_gain):
-            print "Unable to retrieve gain. Aborting...\n"
-            return False
-
-        print "Gain ready..."
-
-        callback_gain = GainNodeCallback()
+        callback_gain = NodeChangeCallback(PySpin.CFloatPtr, "Gain", "%f")
         PySpin.RegisterNodeCallback(node_gain.GetNode(), callback_gain)
-        print "Gain callback registered...\n"
+        print("Gain callback registered...\n")
 
     except PySpin.SpinnakerException as ex:
-        print "Error: %s" % ex
+        print("Error: %s" % ex)
         result = False
 
     return result, callback_height, callback_gain
 
 
-def change_height_and_gain(nodemap):
+def change_height_and_gain(node_height, node_gain):
     """
     This function demonstrates the triggering of the nodemap callbacks. First it
     changes height, which executes the callback registered to the height node, and
     then it changes gain, which executes the callback registered to the gain node.
 
-    :param nodemap: Device nodemap.
-    :type nodemap: INodeMap
+    :param node_height: Height node.
+    :param node_gain: Gain node.
+    :type node_height: CIntegerPtr
+    :type node_gain: CFloatPtr
     :return: True if successful, False otherwise.
     :rtype: bool
     """
-    print "\n***CHANGE HEIGHT & GAIN ***\n"
+    print("\n***CHANGE HEIGHT & GAIN ***\n")
 
     try:
         result = True
@@ -187,18 +191,12 @@ def change_height_and_gain(nodemap):
         # *** NOTES ***
         # Notice that changing the height only triggers the callback function
         # registered to the height node.
-        node_height = PySpin.CIntegerPtr(nodemap.GetNode("Height"))
-        if not PySpin.IsAvailable(node_height) or not PySpin.IsWritable(node_height) \
-                or node_height.GetInc() == 0 or node_height.GetMax() == 0:
-
-            print "Unable to retrieve height. Aborting..."
-            return False
-
         height_to_set = node_height.GetMax()
 
-        print "Regular function message:\n\tHeight about to be changed to %i...\n" % height_to_set
+        print("Regular function message:\n\tHeight about to be changed to %i...\n" % height_to_set)
 
         node_height.SetValue(height_to_set)
+        print_callback_messages()
 
         # Change gain to trigger gain callback
         #
@@ -206,34 +204,30 @@ def change_height_and_gain(nodemap):
         # The same is true of changing the gain node; changing a node will
         # only ever trigger the callback function (or functions) currently
         # registered to it.
-        node_gain = PySpin.CFloatPtr(nodemap.GetNode("Gain"))
-        if not PySpin.IsAvailable(node_gain) or not PySpin.IsWritable(node_gain) or node_gain.GetMax() == 0:
-            print "Unable to retrieve gain..."
-            return False
-
         gain_to_set = node_gain.GetMax() / 2.0
 
-        print "Regular function message:\n\tGain about to be changed to %f...\n" % gain_to_set
+        print("Regular function message:\n\tGain about to be changed to %f...\n" % gain_to_set)
         node_gain.SetValue(gain_to_set)
+        print_callback_messages()
 
     except PySpin.SpinnakerException as ex:
-        print "Error: %s" % ex
+        print("Error: %s" % ex)
         result = False
 
     return result
 
 
-def reset_callbacks(nodemap, callback_height, callback_gain):
+def reset_callbacks(node_gain_auto, callback_height, callback_gain):
     """
     This function cleans up the example by deregistering the callbacks and 
     turning automatic gain back on.
 
-    :param nodemap: Device nodemap.
+    :param node_gain_auto: GainAuto node.
     :param callback_height: Height node callback instance to deregister.
     :param callback_gain: Gain node callback instance to deregister.
-    :type nodemap: INodeMap
-    :type callback_height: HeightNodeCallback
-    :type callback_gain: GainNodeCallback
+    :type node_gain_auto: CEnumerationPtr
+    :type callback_height: NodeChangeCallback
+    :type callback_gain: NodeChangeCallback
     :return: True if successful, False otherwise.
     :rtype: bool
     """
@@ -248,28 +242,18 @@ def reset_callbacks(nodemap, callback_height, callback_gain):
         PySpin.DeregisterNodeCallback(callback_height)
         PySpin.DeregisterNodeCallback(callback_gain)
 
-        print "Callbacks deregistered..."
+        print("Callbacks deregistered...")
 
         # Turn automatic gain back on
         # 
         # *** NOTES ***
         # Automatic gain is turned back on in order to restore the camera to 
         # its default state.
-        node_gain_auto = PySpin.CEnumerationPtr(nodemap.GetNode("GainAuto"))
-        if not PySpin.IsAvailable(node_gain_auto) or not PySpin.IsWritable(node_gain_auto):
-            print "Unable to enable automatic gain (node retrieval). Aborting..."
-            return False
-
-        node_gain_auto_continuous = PySpin.CEnumEntryPtr(node_gain_auto.GetEntryByName("Continuous"))
-        if not PySpin.IsAvailable(node_gain_auto_continuous) or not PySpin.IsReadable(node_gain_auto_continuous):
-            print "Unable to enable automatic gain (enum entry retrieval). Aborting..."
-            return False
-
-        node_gain_auto.SetIntValue(node_gain_auto_continuous.GetValue())
-        print "Automatic gain disabled..."
+        node_gain_auto.SetIntValue(gain_auto_continuous)
+        print("Automatic gain disabled...")
 
     except PySpin.SpinnakerException as ex:
-        print "Error: %s" % ex
+        print("Error: %s" % ex)
         result = False
 
     return result
@@ -287,7 +271,7 @@ def print_device_info(nodemap):
     :rtype: bool
     """
 
-    print "*** DEVICE INFORMATION ***\n"
+    print("*** DEVICE INFORMATION ***\n")
 
     try:
         result = True
@@ -297,19 +281,71 @@ def print_device_info(nodemap):
             features = node_device_information.GetFeatures()
             for feature in features:
                 node_feature = PySpin.CValuePtr(feature)
-                print "%s: %s" % (node_feature.GetName(),
-                                  node_feature.ToString() if PySpin.IsReadable(node_feature) else "Node not readable")
+                print("%s: %s" % (node_feature.GetName(),
+                                  node_feature.ToString() if PySpin.IsReadable(node_feature) else "Node not readable"))
 
         else:
-            print "Device control information not available."
+            print("Device control information not available.")
 
     except PySpin.SpinnakerException as ex:
-        print "Error: %s" % ex
+        print("Error: %s" % ex)
         return False
 
     return result
 
 
+def get_callback_nodes(nodemap):
+    """
+    This function retrieves and validates the height, gain and automatic gain
+    nodes, and resolves the GainAuto entries used to switch automatic gain off
+    and back on.
+
+    :param nodemap: Device nodemap.
+    :type nodemap: INodeMap
+    :returns: tuple (node_height, node_gain, node_gain_auto), or None if any node is unavailable.
+    :rtype: (CIntegerPtr, CFloatPtr, CEnumerationPtr)
+    """
+    global gain_auto_off, gain_auto_continuous
+
+    # Retrieve nodes
+    #
+    # *** NOTES ***
+    # Each node is looked up by name only once here and then handed to the
+    # functions that use it, rather than every function retrieving and
+    # checking it again.
+    node_height = PySpin.CIntegerPtr(nodemap.GetNode("Height"))
+    if not PySpin.IsAvailable(node_height) or not PySpin.IsWritable(node_height) \
+            or node_height.GetInc() == 0 or node_height.GetMax() == 0:
+        print("Unable to retrieve height. Aborting...")
+        return None
+
+    print("Height ready...")
+
+    node_gain = PySpin.CFloatPtr(nodemap.GetNode("Gain"))
+    if not PySpin.IsAvailable(node_gain) or not PySpin.IsWritable(node_gain) or node_gain.GetMax() == 0:
+        print("Unable to retrieve gain. Aborting...")
+        return None
+
+    print("Gain ready...")
+
+    node_gain_auto = PySpin.CEnumerationPtr(nodemap.GetNode("GainAuto"))
+    if not PySpin.IsAvailable(node_gain_auto) or not PySpin.IsWritable(node_gain_auto):
+        print("Unable to retrieve automatic gain (node retrieval). Aborting...")
+        return None
+
+    node_gain_auto_off = PySpin.CEnumEntryPtr(node_gain_auto.GetEntryByName("Off"))
+    node_gain_auto_continuous = PySpin.CEnumEntryPtr(node_gain_auto.GetEntryByName("Continuous"))
+    if not PySpin.IsAvailable(node_gain_auto_off) or not PySpin.IsReadable(node_gain_auto_off) \
+            or not PySpin.IsAvailable(node_gain_auto_continuous) or not PySpin.IsReadable(node_gain_auto_continuous):
+        print("Unable to retrieve automatic gain (enum entry retrieval). Aborting...")
+        return None
+
+    gain_auto_off = node_gain_auto_off.GetValue()
+    gain_auto_continuous = node_gain_auto_continuous.GetValue()
+
+    return node_height, node_gain, node_gain_auto
+
+
 def run_single_camera(cam):
     """
     This function acts as the body of the example; please see NodeMapInfo example
@@ -334,22 +370,30 @@ def run_single_camera(cam):
         # Retrieve GenICam nodemap
         nodemap = cam.GetNodeMap()
 
+        # Retrieve height, gain and automatic gain nodes
+        nodes = get_callback_nodes(nodemap)
+        if nodes is None:
+            cam.DeInit()
+            return False
+
+        node_height, node_gain, node_gain_auto = nodes
+
         # Configure callbacks
-        err, callback_height, callback_gain = configure_callbacks(nodemap)
+        err, callback_height, callback_gain = configure_callbacks(node_height, node_gain, node_gain_auto)
         if not err:
             return err
 
         # Change height and gain to trigger callbacks
-        result &= change_height_and_gain(nodemap)
+        result &= change_height_and_gain(node_height, node_gain)
 
         # Reset callbacks
-        result &= reset_callbacks(nodemap, callback_height, callback_gain)
+        result &= reset_callbacks(node_gain_auto, callback_height, callback_gain)
 
         # Deinitialize camera
         cam.DeInit()
 
     except PySpin.SpinnakerException as ex:
-        print "Error: %s" % ex
+        print("Error: %s" % ex)
         return False
 
     return result
@@ -373,7 +417,7 @@ def main():
 
     num_cameras = cam_list.GetSize()
 
-    print "Number of cameras detected: %d" % num_cameras
+    print("Number of cameras detected: %d" % num_cameras)
 
     # Finish if there are no cameras
     if num_cameras == 0:
@@ -384,18 +428,18 @@ def main():
         # Release system
         system.ReleaseInstance()
 
-        print "Not enough cameras!"
-        raw_input("Done! Press Enter to exit...")
+        print("Not enough cameras!")
+        input("Done! Press Enter to exit...")
         return False
 
     # Run example on each camera
     for i in range(num_cameras):
         cam = cam_list.GetByIndex(i)
 
-        print "Running example for camera %d..." % i
+        print("Running example for camera %d..." % i)
 
         result &= run_single_camera(cam)
-        print "Camera %d example complete..." % i
+        print("Camera %d example complete..." % i)
 
     # Release reference to camera
     # NOTE: Unlike the C++ examples, we cannot rely on pointer objects being automatically
@@ -410,7 +454,7 @@ def main():
     # Release instance
     system.ReleaseInstance()
 
-    raw_input("Done! Press Enter to exit...")
+    input("Done! Press Enter to exit...")
     return result
 
 if __name__ == "__main__":
@@ -63,7 +63,7 @@ def print_with_indent(level, text):
     ind = ''
     for i in range(level):
         ind += '    '
-    print "%s%s" % (ind, text)
+    print("%s%s" % (ind, text))
 
 
 def print_value_node(node, level):
@@ -110,7 +110,7 @@ def print_value_node(node, level):
         print_with_indent(level, "%s: %s" % (display_name, value))
 
     except PySpin.SpinnakerException as ex:
-        print "Error: %s" % ex
+        print("Error: %s" % ex)
         return False
 
     return result
@@ -150,7 +150,7 @@ def print_string_node(node, level):
         print_with_indent(level, "%s: %s" % (display_name, value))
 
     except PySpin.SpinnakerException as ex:
-        print "Error: %s" % ex
+        print("Error: %s" % ex)
         return False
 
     return result
@@ -187,7 +187,7 @@ def print_integer_node(node, level):
         print_with_indent(level, "%s: %s" % (display_name, value))
 
     except PySpin.SpinnakerException as ex:
-        print "Error: %s" % ex
+        print("Error: %s" % ex)
         return False
 
     return result
@@ -220,7 +220,7 @@ def print_float_node(node, level):
         print_with_indent(level, "%s: %s" % (display_name, value))
 
     except PySpin.SpinnakerException as ex:
-        print "Error: %s" % ex
+        print("Error: %s" % ex)
         return False
 
     return result
@@ -254,7 +254,7 @@ def print_boolean_node(node, level):
         print_with_indent(level, "%s: %s" % (display_name, value))
 
     except PySpin.SpinnakerException as ex:
-        print "Error: %s" % ex
+        print("Error: %s" % ex)
         return False
 
     return result
@@ -298,7 +298,7 @@ def print_command_node(node, level):
         print_with_indent(level, "%s: %s" % (display_name, tooltip))
 
     except PySpin.SpinnakerException as ex:
-        print "Error: %s" % ex
+        print("Error: %s" % ex)
         return False
 
     return result
@@ -346,7 +346,7 @@ def print_enumeration_node_and_current_entry(node, level):
         print_with_indent(level, "%s: %s" % (display_name, entry_symbolic))
 
     except PySpin.SpinnakerException as ex:
-        print "Error: %s" % ex
+        print("Error: %s" % ex)
         return False
 
     return result
@@ -417,10 +417,10 @@ def print_category_node_and_all_features(node, level):
                 elif node_feature.GetPrincipalInterfaceType() == PySpin.intfIEnumeration:
                     result &= print_enumeration_node_and_current_entry(node_feature, level + 1)
 
-        print ""
+        print("")
 
     except PySpin.SpinnakerException as ex:
-        print "Error: %s" % ex
+        print("Error: %s" % ex)
         return False
 
     return result
@@ -449,7 +449,7 @@ def run_single_camera(cam):
         # camera initialization is unnecessary. It provides mostly immutable
         # information fundamental to the camera such as the serial number,
         # vendor, and model.
-        print "\n*** PRINTING TRANSPORT LAYER DEVICE NODEMAP *** \n"
+        print("\n*** PRINTING TRANSPORT LAYER DEVICE NODEMAP *** \n")
 
         nodemap_gentl = cam.GetTLDeviceNodeMap()
 
@@ -463,7 +463,7 @@ def run_single_camera(cam):
         # provides information on the camera's streaming performance at any
         # given moment. Having this information available on the transport layer
         # allows the information to be retrieved without affecting camera performance.
-        print "*** PRINTING TL STREAM NODEMAP ***\n"
+        print("*** PRINTING TL STREAM NODEMAP ***\n")
 
         nodemap_tlstream = cam.GetTLStreamNodeMap()
 
@@ -478,7 +478,7 @@ def run_single_camera(cam):
         #
         # *** LATER ***
         # Cameras should be deinitialized when no longer needed.
-        print "*** PRINTING GENICAM NODEMAP ***\n"
+        print("*** PRINTING GENICAM NODEMAP ***\n")
 
         cam.Init()
 
@@ -501,7 +501,7 @@ def run_single_camera(cam):
         cam.DeInit()
 
     except PySpin.SpinnakerException as ex:
-        print "Error: %s" % ex
+        print("Error: %s" % ex)
         return False
 
     return True
@@ -523,7 +523,7 @@ def main():
 
     num_cameras = cam_list.GetSize()
 
-    print "Number of cameras detected: %d" % num_cameras
+    print("Number of cameras detected: %d" % num_cameras)
 
     # Finish if there are no cameras
     if num_cameras == 0:
@@ -534,18 +534,18 @@ def main():
         # Release system
         system.ReleaseInstance()
 
-        print "Not enough cameras!"
-        raw_input("Done! Press Enter to exit...")
+        print("Not enough cameras!")
+        input("Done! Press Enter to exit...")
         return False
 
     # Run example on each camera
     for i in range(num_cameras):
         cam = cam_list.GetByIndex(i)
 
-        print "Running example for camera %d..." % i
+        print("Running example for camera %d..." % i)
 
         result = run_single_camera(cam)
-        print "Camera %d example complete..." % i
+        print("Camera %d example complete..." % i)
 
     # Release reference to camera
     # NOTE: Unlike the C++ examples, we cannot rely on pointer objects being automatically
@@ -560,7 +560,7 @@ def main():
     # Release instance
     system.ReleaseInstance()
 
-    raw_input("Done! Press Enter to exit...")
+    input("Done! Press Enter to exit...")
     return result
 
 if __name__ == "__main__":
@@ -62,10 +62,10 @@ def print_transport_layer_device_info(cam):
 
         # Print device serial number
         if cam.TLDevice.DeviceSerialNumber.GetAccessMode() == PySpin.RO:
-            print "Device serial number: %s" % cam.TLDevice.DeviceSerialNumber.ToString()
+            print("Device serial number: %s" % cam.TLDevice.DeviceSerialNumber.ToString())
 
         else:
-            print "Device serial number: unavailable"
+            print("Device serial number: unavailable")
             result = False
 
         # Print device vendor name
@@ -75,20 +75,20 @@ def print_transport_layer_device_info(cam):
         # compare its access mode with RO, RW, etc. or you can use
         # the IsReadable/IsWritable functions on the node.
         if PySpin.IsReadable(cam.TLDevice.DeviceVendorName):
-            print "Device vendor name: %s" % cam.TLDevice.DeviceVendorName.ToString()
+            print("Device vendor name: %s" % cam.TLDevice.DeviceVendorName.ToString())
         else:
-            print "Device vendor name: unavailable"
+            print("Device vendor name: unavailable")
             result = False
 
         # Print device display name
         if PySpin.IsReadable(cam.TLDevice.DeviceDisplayName):
-            print "Device display name: %s" % cam.TLDevice.DeviceDisplayName.ToString()
+            print("Device display name: %s" % cam.TLDevice.DeviceDisplayName.ToString())
         else:
-            print "Device display name: unavailable"
+            print("Device display name: unavailable")
             result = False
 
     except PySpin.SpinnakerException as ex:
-        print "Error: %s" % ex
+        print("Error: %s" % ex)
         return False
 
     return result
@@ -116,20 +116,20 @@ def print_transport_layer_stream_info(cam):
 
         # Print stream ID
         if cam.TLStream.StreamID.GetAccessMode() == PySpin.RO:
-            print "Stream ID: %s" % cam.TLStream.StreamID.ToString()
+            print("Stream ID: %s" % cam.TLStream.StreamID.ToString())
         else:
-            print "Stream ID: unavailable"
+            print("Stream ID: unavailable")
             result = False
 
         # Print stream type
         if PySpin.IsReadable(cam.TLStream.StreamType):
-            print "Stream type: %s" % cam.TLStream.StreamType.ToString()
+            print("Stream type: %s" % cam.TLStream.StreamType.ToString())
         else:
-            print "Stream type: unavailable"
+            print("Stream type: unavailable")
             result = False
 
     except PySpin.SpinnakerException as ex:
-        print "Error: %s" % ex
+        print("Error: %s" % ex)
         return False
 
     return result
@@ -162,27 +162,27 @@ def print_transport_layer_interface_info(interface):
 
         # Print interface display name
         if interface.TLInterface.InterfaceDisplayName.GetAccessMode() == PySpin.RO:
-            print "Interface display name: %s" % interface.TLInterface.InterfaceDisplayName.ToString()
+            print("Interface display name: %s" % interface.TLInterface.InterfaceDisplayName.ToString())
         else:
-            print "Interface display name: unavailable"
+            print("Interface display name: unavailable")
             result = False
 
         # Print interface ID
         if interface.TLInterface.InterfaceID.GetAccessMode() == PySpin.RO:
-            print "Interface ID: %s" % interface.TLInterface.InterfaceID.ToString()
+            print("Interface ID: %s" % interface.TLInterface.InterfaceID.ToString())
         else:
-            print "Interface ID: unavailable"
+            print("Interface ID: unavailable")
             result = False
 
         # Print interface type
         if PySpin.IsReadable(interface.TLInterface.InterfaceType.GetAccessMode()):
-            print "Interface type: %s" % interface.TLInterface.InterfaceType.ToString()
+            print("Interface type: %s" % interface.TLInterface.InterfaceType.ToString())
         else:
-            print "Interface type: unavailable"
+            print("Interface type: unavailable")
             result = False
 
     except PySpin.SpinnakerException as ex:
-        print "Error: %s" % ex
+        print("Error: %s" % ex)
         return False
 
     return result
@@ -209,27 +209,27 @@ def print_genicam_device_info(cam):
 
         # Print exposure time
         if cam.ExposureTime.GetAccessMode() == PySpin.RO or cam.ExposureTime.GetAccessMode() == PySpin.RW:
-            print "Exposure time: %s" % cam.ExposureTime.ToString()
+            print("Exposure time: %s" % cam.ExposureTime.ToString())
         else:
-            print "Exposure time: unavailable"
+            print("Exposure time: unavailable")
             result = False
 
         # Print black level
         if PySpin.IsReadable(cam.BlackLevel):
-            print "Black level: %s" % cam.BlackLevel.ToString()
+            print("Black level: %s" % cam.BlackLevel.ToString())
         else:
-            print "Black level: unavailable"
+            print("Black level: unavailable")
             result = False
 
         # Print height
         if PySpin.IsReadable(cam.Height):
-            print "Height: %s" % cam.Height.ToString()
+            print("Height: %s" % cam.Height.ToString())
         else:
-            print "Height: unavailable"
+            print("Height: unavailable")
             result = False
 
     except PySpin.SpinnakerException as ex:
-        print "Error: %s" % ex
+        print("Error: %s" % ex)
         return False
 
     return result
@@ -253,21 +253,21 @@ def main():
 
     num_cams = len(cam_list)
 
-    print "Number of cameras detected: %i \n" % num_cams
+    print("Number of cameras detected: %i \n" % num_cams)
 
     # Retrieve list of interfaces from the system 
     iface_list = sys.GetInterfaces()
 
     num_ifaces = iface_list.GetSize()
 
-    print "Number of interfaces detected: %i \n" % num_ifaces
+    print("Number of interfaces detected: %i \n" % num_ifaces)
 
     # Print information on each interface
     #
     # *** NOTES ***
     # All USB 3 Vision and GigE Vision interfaces should enumerate for
     # Spinnaker.
-    print "\n*** PRINTING INTERFACE INFORMATION ***\n"
+    print("\n*** PRINTING INTERFACE INFORMATION ***\n")
 
     for i in range(num_ifaces):
         result &= print_transport_layer_interface_info(iface_list[i])
@@ -277,7 +277,7 @@ def main():
     # *** NOTES ***
     # Transport layer nodes do not require initialization in order to interact
     # with them.
-    print "\n*** PRINTING TRANSPORT LAYER DEVICE INFORMATION ***\n"
+    print("\n*** PRINTING TRANSPORT LAYER DEVICE INFORMATION ***\n")
 
     for i in range(num_cams):
         result &= print_transport_layer_device_info(cam_list[i])
@@ -287,7 +287,7 @@ def main():
     # *** NOTES ***
     # Again, initialization is not required to print information from the
     # transport layer; this is equally true of streaming information.
-    print "\n*** PRINTING TRANSPORT LAYER STREAMING INFORMATION ***\n"
+    print("\n*** PRINTING TRANSPORT LAYER STREAMING INFORMATION ***\n")
 
     for i in range(num_cams):
         result &= print_transport_layer_stream_info(cam_list[i])
@@ -299,7 +299,7 @@ def main():
     # them; as such, this loop initializes the camera, prints some information
     # from the GenICam nodemap, and then deinitializes it. If the camera were
     # not initialized, node availability would fail.
-    print "\n*** PRINTING GENICAM INFORMATION ***\n"
+    print("\n*** PRINTING GENICAM INFORMATION ***\n")
 
     # NOTE: The CameraList can be iterated over without using an index to grab each camera.
     for cam in cam_list:
@@ -324,7 +324,7 @@ def main():
     # Release system
     sys.ReleaseInstance()
 
-    raw_input("Done! Press Enter to exit...")
+    input("Done! Press Enter to exit...")
     return result
 
 if __name__ == "__main__":
@@ -50,7 +50,7 @@ def save_list_to_avi(nodemap, nodemap_tldevice, images):
     :return: True if successful, False otherwise.
     :rtype: bool
     """
-    print "*** CREATING VIDEO ***"
+    print("*** CREATING VIDEO ***")
 
     try:
         result = True
@@ -61,7 +61,7 @@ def save_list_to_avi(nodemap, nodemap_tldevice, images):
 
         if PySpin.IsAvailable(node_serial) and PySpin.IsReadable(node_serial):
             device_serial_number = node_serial.GetValue()
-            print "Device serial number retrieved as %s..." % device_serial_number
+            print("Device serial number retrieved as %s..." % device_serial_number)
 
         # Get the current frame rate; acquisition frame rate recorded in hertz
         #
@@ -73,12 +73,12 @@ def save_list_to_avi(nodemap, nodemap_tldevice, images):
         node_acquisition_framerate = PySpin.CFloatPtr(nodemap.GetNode("AcquisitionFrameRate"))
 
         if not PySpin.IsAvailable(node_acquisition_framerate) and not PySpin.IsReadable(node_acquisition_framerate):
-            print "Unable to retrieve frame rate. Aborting..."
+            print("Unable to retrieve frame rate. Aborting...")
             return False
 
         framerate_to_set = node_acquisition_framerate.GetValue()
 
-        print "Frame rate to be set to %d..." % framerate_to_set
+        print("Frame rate to be set to %d..." % framerate_to_set)
 
         # Select option and open AVI filetype with unique filename
         #
@@ -124,7 +124,7 @@ def save_list_to_avi(nodemap, nodemap_tldevice, images):
             option.width = images[0].GetWidth()
 
         else:
-            print "Error: Unknown AviType. Aborting..."
+            print("Error: Unknown AviType. Aborting...")
             return False
 
         avi_recorder.AVIOpen(avi_filename, option)
@@ -134,11 +134,11 @@ def save_list_to_avi(nodemap, nodemap_tldevice, images):
         # *** NOTES ***
         # Although the video file has been opened, images must be individually
         # appended in order to construct the video.
-        print "Appending %d images to AVI file: %s.avi..." % (len(images), avi_filename)
+        print("Appending %d images to AVI file: %s.avi..." % (len(images), avi_filename))
 
         for i in range(len(images)):
             avi_recorder.AVIAppend(images[i])
-            print "Appended image %d..." % i
+            print("Appended image %d..." % i)
 
         # Close AVI file
         #
@@ -148,10 +148,10 @@ def save_list_to_avi(nodemap, nodemap_tldevice, images):
         # images can be added.
 
         avi_recorder.AVIClose()
-        print "Video saved at %s.avi" % avi_filename
+        print("Video saved at %s.avi" % avi_filename)
 
     except PySpin.SpinnakerException as ex:
-        print "Error: %s" % ex
+        print("Error: %s" % ex)
         return False
 
     return result
@@ -168,7 +168,7 @@ def print_device_info(nodemap):
     :return: True if successful, False otherwise.
     :rtype: bool
     """
-    print "\n*** DEVICE INFORMATION ***\n"
+    print("\n*** DEVICE INFORMATION ***\n")
 
     try:
         result = True
@@ -178,14 +178,14 @@ def print_device_info(nodemap):
             features = node_device_information.GetFeatures()
             for feature in features:
                 node_feature = PySpin.CValuePtr(feature)
-                print "%s: %s" % (node_feature.GetName(),
-                                  node_feature.ToString() if PySpin.IsReadable(node_feature) else "Node not readable")
+                print("%s: %s" % (node_feature.GetName(),
+                                  node_feature.ToString() if PySpin.IsReadable(node_feature) else "Node not readable"))
 
         else:
-            print "Device control information not available."
+            print("Device control information not available.")
 
     except PySpin.SpinnakerException as ex:
-        print "Error: %s" % ex
+        print("Error: %s" % ex)
         return False
 
     return result
@@ -203,32 +203,32 @@ def acquire_images(cam, nodemap):
     :return: True if successful, False otherwise.
     :rtype: bool
     """
-    print "*** IMAGE ACQUISITION ***\n"
+    print("*** IMAGE ACQUISITION ***\n")
     try:
         result = True
 
         # Set acquisition mode to continuous
         node_acquisition_mode = PySpin.CEnumerationPtr(nodemap.GetNode("AcquisitionMode"))
         if not PySpin.IsAvailable(node_acquisition_mode) or not PySpin.IsWritable(node_acquisition_mode):
-            print "Unable to set acquisition mode to continuous (enum retrieval). Aborting..."
+            print("Unable to set acquisition mode to continuous (enum retrieval). Aborting...")
             return False
 
         # Retrieve entry node from enumeration node
         node_acquisition_mode_continuous = node_acquisition_mode.GetEntryByName("Continuous")
         if not PySpin.IsAvailable(node_acquisition_mode_continuous) or not PySpin.IsReadable(node_acquisition_mode_continuous):
-            print "Unable to set acquisition mode to continuous (entry retrieval). Aborting..."
+            print("Unable to set acquisition mode to continuous (entry retrieval). Aborting...")
             return False
 
         acquisition_mode_continuous = node_acquisition_mode_continuous.GetValue()
 
         node_acquisition_mode.SetIntValue(acquisition_mode_continuous)
 
-        print "Acquisition mode set to continuous..."
+        print("Acquisition mode set to continuous...")
 
         #  Begin acquiring images
         cam.BeginAcquisition()
 
-        print "Acquiring images..."
+        print("Acquiring images...")
 
         # Retrieve, convert, and save images
         images = list()
@@ -240,30 +240,30 @@ def acquire_images(cam, nodemap):
 
                 #  Ensure image completion
                 if image_result.IsIncomplete():
-                    print "Image incomplete with image status %d..." % image_result.GetImageStatus()
+                    print("Image incomplete with image status %d..." % image_result.GetImageStatus())
 
                 else:
                     #  Print image information; height and width recorded in pixels
                     width = image_result.GetWidth()
                     height = image_result.GetHeight()
-                    print "Grabbed Image %d, width = %d, height = %d" % (i, width, height)
+                    print("Grabbed Image %d, width = %d, height = %d" % (i, width, height))
 
                     #  Convert image to mono 8 and append to list
                     images.append(image_result.Convert(PySpin.PixelFormat_Mono8, PySpin.HQ_LINEAR))
 
                     #  Release image
                     image_result.Release()
-                    print ""
+                    print("")
 
             except PySpin.SpinnakerException as ex:
-                print "Error: %s" % ex
+                print("Error: %s" % ex)
                 result = False
 
         # End acquisition
         cam.EndAcquisition()
 
     except PySpin.SpinnakerException as ex:
-        print "Error: %s" % ex
+        print("Error: %s" % ex)
         result = False
 
     return result, images
@@ -305,7 +305,7 @@ def run_single_camera(cam):
         cam.DeInit()
 
     except PySpin.SpinnakerException as ex:
-        print "Error: %s" % ex
+        print("Error: %s" % ex)
         result = False
 
     return result
@@ -328,7 +328,7 @@ def main():
 
     num_cameras = cam_list.GetSize()
 
-    print "Number of cameras detected:", num_cameras
+    print("Number of cameras detected:", num_cameras)
     # Finish if there are no cameras
     if num_cameras == 0:
         # Clear camera list before releasing system
@@ -337,18 +337,18 @@ def main():
         # Release system
         system.ReleaseInstance()
 
-        print "Not enough cameras!"
-        raw_input("Done! Press Enter to exit...")
+        print("Not enough cameras!")
+        input("Done! Press Enter to exit...")
         return False
 
     # Run example on each camera
     for i in range(num_cameras):
         cam = cam_list.GetByIndex(i)
 
-        print "Running example for camera %d..." % i
+        print("Running example for camera %d..." % i)
 
         result = run_single_camera(cam)
-        print "Camera %d example complete..." % i
+        print("Camera %d example complete..." % i)
 
     # Release reference to camera
     del cam
@@ -359,7 +359,7 @@ def main():
     # Release instance
     system.ReleaseInstance()
 
-    raw_input("Done! Press Enter to exit...")
+    input("Done! Press Enter to exit...")
     return result
 
 if __name__ == "__main__":
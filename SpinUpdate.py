@@ -48,7 +48,7 @@ def progress_callback(action, address, global_percent, curr_percent):
     global last_action
     if action != last_action:
         # Prints action only if changed from previous one
-        print "Action: %s" % action
+        print("Action: %s" % action)
         last_action = action
 
     return 1
@@ -64,7 +64,7 @@ def message_callback(message):
     :type message: str
     :rtype: None
     """
-    print "Message: %s" % message
+    print("Message: %s" % message)
 
 
 def main():
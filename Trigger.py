@@ -53,12 +53,12 @@ def configure_trigger(cam):
     """
     result = True
 
-    print "*** CONFIGURING TRIGGER ***\n"
+    print("*** CONFIGURING TRIGGER ***\n")
 
     if CHOSEN_TRIGGER == TriggerType.SOFTWARE:
-        print "Software trigger chosen ..."
+        print("Software trigger chosen ...")
     elif CHOSEN_TRIGGER == TriggerType.HARDWARE:
-        print "Hardware trigger chose ..."
+        print("Hardware trigger chose ...")
 
     try:
         # Ensure trigger mode off
@@ -67,31 +67,31 @@ def configure_trigger(cam):
         nodemap = cam.GetNodeMap()
         node_trigger_mode = PySpin.CEnumerationPtr(nodemap.GetNode("TriggerMode"))
         if not PySpin.IsAvailable(node_trigger_mode) or not PySpin.IsReadable(node_trigger_mode):
-            print "Unable to disable trigger mode (node retrieval). Aborting..."
+            print("Unable to disable trigger mode (node retrieval). Aborting...")
             return False
 
         node_trigger_mode_off = node_trigger_mode.GetEntryByName("Off")
         if not PySpin.IsAvailable(node_trigger_mode_off) or not PySpin.IsReadable(node_trigger_mode_off):
-            print "Unable to disable trigger mode (enum entry retrieval). Aborting..."
+            print("Unable to disable trigger mode (enum entry retrieval). Aborting...")
             return False
 
         node_trigger_mode.SetIntValue(node_trigger_mode_off.GetValue())
 
-        print "Trigger mode disabled..."
+        print("Trigger mode disabled...")
 
         # Select trigger source
         # The trigger source must be set to hardware or software while trigger
         # mode is off.
         node_trigger_source = PySpin.CEnumerationPtr(nodemap.GetNode("TriggerSource"))
         if not PySpin.IsAvailable(node_trigger_source) or not PySpin.IsWritable(node_trigger_source):
-            print "Unable to get trigger source (node retrieval). Aborting..."
+            print("Unable to get trigger source (node retrieval). Aborting...")
             return False
 
         if CHOSEN_TRIGGER == TriggerType.SOFTWARE:
             node_trigger_source_software = node_trigger_source.GetEntryByName("Software")
             if not PySpin.IsAvailable(node_trigger_source_software) or not PySpin.IsReadable(
                     node_trigger_source_software):
-                print "Unable to set trigger source (enum entry retrieval). Aborting..."
+                print("Unable to set trigger source (enum entry retrieval). Aborting...")
                 return False
             node_trigger_source.SetIntValue(node_trigger_source_software.GetValue())
 
@@ -99,7 +99,7 @@ def configure_trigger(cam):
             node_trigger_source_hardware = node_trigger_source.GetEntryByName("Line0")
             if not PySpin.IsAvailable(node_trigger_source_hardware) or not PySpin.IsReadable(
                     node_trigger_source_hardware):
-                print "Unable to set trigger source (enum entry retrieval). Aborting..."
+                print("Unable to set trigger source (enum entry retrieval). Aborting...")
                 return False
             node_trigger_source.SetIntValue(node_trigger_source_hardware.GetValue())
 
@@ -108,14 +108,14 @@ def configure_trigger(cam):
         # on in order to retrieve images using the trigger.
         node_trigger_mode_on = node_trigger_mode.GetEntryByName("On")
         if not PySpin.IsAvailable(node_trigger_mode_on) or not PySpin.IsReadable(node_trigger_mode_on):
-            print "Unable to enable trigger mode (enum entry retrieval). Aborting..."
+            print("Unable to enable trigger mode (enum entry retrieval). Aborting...")
             return False
 
         node_trigger_mode.SetIntValue(node_trigger_mode_on.GetValue())
-        print "Trigger mode turned back on..."
+        print("Trigger mode turned back on...")
 
     except PySpin.SpinnakerException as ex:
-        print "Error: %s" % ex
+        print("Error: %s" % ex)
         return False
 
     return result
@@ -143,12 +143,12 @@ def grab_next_image_by_trigger(nodemap, cam):
 
         if CHOSEN_TRIGGER == TriggerType.SOFTWARE:
             # Get user input
-            raw_input("Press the Enter key to initiate software trigger.")
+            input("Press the Enter key to initiate software trigger.")
 
             # Execute software trigger
             node_softwaretrigger_cmd = PySpin.CCommandPtr(nodemap.GetNode("TriggerSoftware"))
             if not PySpin.IsAvailable(node_softwaretrigger_cmd) or not PySpin.IsWritable(node_softwaretrigger_cmd):
-                print "Unable to execute trigger. Aborting..."
+                print("Unable to execute trigger. Aborting...")
                 return False
 
             node_softwaretrigger_cmd.Execute()
@@ -156,10 +156,10 @@ def grab_next_image_by_trigger(nodemap, cam):
             # TODO: Blackfly and Flea3 GEV cameras need 2 second delay after software trigger
 
         elif CHOSEN_TRIGGER == TriggerType.HARDWARE:
-            print "Use the hardware to trigger image acquisition."
+            print("Use the hardware to trigger image acquisition.")
 
     except PySpin.SpinnakerException as ex:
-        print "Error: %s" % ex
+        print("Error: %s" % ex)
         return False
 
     return result
@@ -180,7 +180,7 @@ def acquire_images(cam, nodemap, nodemap_tldevice):
     :rtype: bool
     """
 
-    print "*** IMAGE ACQUISITION ***\n"
+    print("*** IMAGE ACQUISITION ***\n")
     try:
         result = True
 
@@ -188,14 +188,14 @@ def acquire_images(cam, nodemap, nodemap_tldevice):
         # In order to access the node entries, they have to be casted to a pointer type (CEnumerationPtr here)
         node_acquisition_mode = PySpin.CEnumerationPtr(nodemap.GetNode("AcquisitionMode"))
         if not PySpin.IsAvailable(node_acquisition_mode) or not PySpin.IsWritable(node_acquisition_mode):
-            print "Unable to set acquisition mode to continuous (enum retrieval). Aborting..."
+            print("Unable to set acquisition mode to continuous (enum retrieval). Aborting...")
             return False
 
         # Retrieve entry node from enumeration node
         node_acquisition_mode_continuous = node_acquisition_mode.GetEntryByName("Continuous")
         if not PySpin.IsAvailable(node_acquisition_mode_continuous) or not PySpin.IsReadable(
                 node_acquisition_mode_continuous):
-            print "Unable to set acquisition mode to continuous (entry retrieval). Aborting..."
+            print("Unable to set acquisition mode to continuous (entry retrieval). Aborting...")
             return False
 
         # Retrieve integer value from entry node
@@ -204,12 +204,12 @@ def acquire_images(cam, nodemap, nodemap_tldevice):
         # Set integer value from entry node as new value of enumeration node
         node_acquisition_mode.SetIntValue(acquisition_mode_continuous)
 
-        print "Acquisition mode set to continuous..."
+        print("Acquisition mode set to continuous...")
 
         #  Begin acquiring images
         cam.BeginAcquisition()
 
-        print "Acquiring images..."
+        print("Acquiring images...")
 
         #  Retrieve device serial number for filename
         #
@@ -221,7 +221,7 @@ def acquire_images(cam, nodemap, nodemap_tldevice):
         node_device_serial_number = PySpin.CStringPtr(nodemap_tldevice.GetNode("DeviceSerialNumber"))
         if PySpin.IsAvailable(node_device_serial_number) and PySpin.IsReadable(node_device_serial_number):
             device_serial_number = node_device_serial_number.GetValue()
-            print "Device serial number retrieved as %s..." % device_serial_number
+            print("Device serial number retrieved as %s..." % device_serial_number)
 
         # Retrieve, convert, and save images
         for i in range(NUM_IMAGES):
@@ -235,7 +235,7 @@ def acquire_images(cam, nodemap, nodemap_tldevice):
 
                 #  Ensure image completion
                 if image_result.IsIncomplete():
-                    print "Image incomplete with image status %d ..." % image_result.GetImageStatus()
+                    print("Image incomplete with image status %d ..." % image_result.GetImageStatus())
 
                 else:
 
@@ -247,7 +247,7 @@ def acquire_images(cam, nodemap, nodemap_tldevice):
                     #  name a few.
                     width = image_result.GetWidth()
                     height = image_result.GetHeight()
-                    print "Grabbed Image %d, width = %d, height = %d" % (i, width, height)
+                    print("Grabbed Image %d, width = %d, height = %d" % (i, width, height))
 
                     #  Convert image to mono 8
                     #
@@ -274,7 +274,7 @@ def acquire_images(cam, nodemap, nodemap_tldevice):
                     #  serial numbers to keep images of one device from
                     #  overwriting those of another.
                     image_converted.Save(filename)
-                    print "Image saved at %s" % filename
+                    print("Image saved at %s" % filename)
 
                     #  Release image
                     #
@@ -283,10 +283,10 @@ def acquire_images(cam, nodemap, nodemap_tldevice):
                     #  images) need to be released in order to keep from filling the
                     #  buffer.
                     image_result.Release()
-                    print ""
+                    print("")
 
             except PySpin.SpinnakerException as ex:
-                print "Error: %s" % ex
+                print("Error: %s" % ex)
                 return False
 
         # End acquisition
@@ -297,7 +297,7 @@ def acquire_images(cam, nodemap, nodemap_tldevice):
         cam.EndAcquisition()
 
     except PySpin.SpinnakerException as ex:
-        print "Error: %s" % ex
+        print("Error: %s" % ex)
         return False
 
     return result
@@ -316,20 +316,20 @@ def reset_trigger(nodemap):
         result = True
         node_trigger_mode = PySpin.CEnumerationPtr(nodemap.GetNode("TriggerMode"))
         if not PySpin.IsAvailable(node_trigger_mode) or not PySpin.IsReadable(node_trigger_mode):
-            print "Unable to disable trigger mode (node retrieval). Aborting..."
+            print("Unable to disable trigger mode (node retrieval). Aborting...")
             return False
 
         node_trigger_mode_off = node_trigger_mode.GetEntryByName("Off")
         if not PySpin.IsAvailable(node_trigger_mode_off) or not PySpin.IsReadable(node_trigger_mode_off):
-            print "Unable to disable trigger mode (enum entry retrieval). Aborting..."
+            print("Unable to disable trigger mode (enum entry retrieval). Aborting...")
             return False
 
         node_trigger_mode.SetIntValue(node_trigger_mode_off.GetValue())
 
-        print "Trigger mode disabled..."
+        print("Trigger mode disabled...")
 
     except PySpin.SpinnakerException as ex:
-        print "Error: %s" % ex
+        print("Error: %s" % ex)
         result = False
 
     return result
@@ -347,7 +347,7 @@ def print_device_info(nodemap):
     :rtype: bool
     """
 
-    print "*** DEVICE INFORMATION ***\n"
+    print("*** DEVICE INFORMATION ***\n")
 
     try:
         result = True
@@ -357,14 +357,14 @@ def print_device_info(nodemap):
             features = node_device_information.GetFeatures()
             for feature in features:
                 node_feature = PySpin.CValuePtr(feature)
-                print "%s: %s" % (node_feature.GetName(),
-                                  node_feature.ToString() if PySpin.IsReadable(node_feature) else "Node not readable")
+                print("%s: %s" % (node_feature.GetName(),
+                                  node_feature.ToString() if PySpin.IsReadable(node_feature) else "Node not readable"))
 
         else:
-            print "Device control information not available."
+            print("Device control information not available.")
 
     except PySpin.SpinnakerException as ex:
-        print "Error: %s" % ex
+        print("Error: %s" % ex)
         return False
 
     return result
@@ -409,7 +409,7 @@ def run_single_camera(cam):
         cam.DeInit()
 
     except PySpin.SpinnakerException as ex:
-        print "Error: %s" % ex
+        print("Error: %s" % ex)
         result = False
 
     return result
@@ -431,7 +431,7 @@ def main():
 
     num_cameras = cam_list.GetSize()
 
-    print "Number of cameras detected: %d" % num_cameras
+    print("Number of cameras detected: %d" % num_cameras)
 
     # Finish if there are no cameras
     if num_cameras == 0:
@@ -441,18 +441,18 @@ def main():
         # Release system
         system.ReleaseInstance()
 
-        print "Not enough cameras!"
-        raw_input("Done! Press Enter to exit...")
+        print("Not enough cameras!")
+        input("Done! Press Enter to exit...")
         return False
 
     # Run example on each camera
     for i in range(num_cameras):
         cam = cam_list.GetByIndex(i)
 
-        print "Running example for camera %d..." % i
+        print("Running example for camera %d..." % i)
 
         result = run_single_camera(cam)
-        print "Camera %d example complete... \n" % i
+        print("Camera %d example complete... \n" % i)
 
     # Release reference to camera
     # NOTE: Unlike the C++ examples, we cannot rely on pointer objects being automatically
@@ -466,7 +466,7 @@ def main():
     # Release instance
     system.ReleaseInstance()
 
-    raw_input("Done! Press Enter to exit...")
+    input("Done! Press Enter to exit...")
     return result
 
 
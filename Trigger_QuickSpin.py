@@ -55,12 +55,12 @@ def configure_trigger(cam):
      :rtype: bool
     """
 
-    print "*** CONFIGURING TRIGGER ***\n"
+    print("*** CONFIGURING TRIGGER ***\n")
 
     if CHOSEN_TRIGGER == TriggerType.SOFTWARE:
-        print "Software trigger chosen..."
+        print("Software trigger chosen...")
     elif CHOSEN_TRIGGER == TriggerType.HARDWARE:
-        print "Hardware trigger chosen..."
+        print("Hardware trigger chosen...")
 
     try:
         result = True
@@ -69,18 +69,18 @@ def configure_trigger(cam):
         # The trigger must be disabled in order to configure whether the source
         # is software or hardware.
         if cam.TriggerMode.GetAccessMode() != PySpin.RW:
-            print "Unable to disable trigger mode (node retrieval). Aborting..."
+            print("Unable to disable trigger mode (node retrieval). Aborting...")
             return False
 
         cam.TriggerMode.SetValue(PySpin.TriggerMode_Off)
 
-        print "Trigger mode disabled..."
+        print("Trigger mode disabled...")
 
         # Select trigger source
         # The trigger source must be set to hardware or software while trigger
 		# mode is off.
         if cam.TriggerSource.GetAccessMode() != PySpin.RW:
-            print "Unable to get trigger source (node retrieval). Aborting..."
+            print("Unable to get trigger source (node retrieval). Aborting...")
             return False
 
         if CHOSEN_TRIGGER == TriggerType.SOFTWARE:
@@ -92,10 +92,10 @@ def configure_trigger(cam):
         # Once the appropriate trigger source has been set, turn trigger mode
         # on in order to retrieve images using the trigger.
         cam.TriggerMode.SetValue(PySpin.TriggerMode_On)
-        print "Trigger mode turned back on..."
+        print("Trigger mode turned back on...")
 
     except PySpin.SpinnakerException as ex:
-        print "Error: %s" % ex
+        print("Error: %s" % ex)
         return False
 
     return result
@@ -121,11 +121,11 @@ def grab_next_image_by_trigger(cam):
 
         if CHOSEN_TRIGGER == TriggerType.SOFTWARE:
             # Get user input
-            raw_input("Press the Enter key to initiate software trigger.")
+            input("Press the Enter key to initiate software trigger.")
 
             # Execute software trigger
             if cam.TriggerSoftware.GetAccessMode() != PySpin.WO:
-                print "Unable to execute trigger. Aborting..."
+                print("Unable to execute trigger. Aborting...")
                 return False
 
             cam.TriggerSoftware.Execute()
@@ -133,10 +133,10 @@ def grab_next_image_by_trigger(cam):
             # TODO: Blackfly and Flea3 GEV cameras need 2 second delay after software trigger
 
         elif CHOSEN_TRIGGER == TriggerType.HARDWARE:
-            print "Use the hardware to trigger image acquisition."
+            print("Use the hardware to trigger image acquisition.")
 
     except PySpin.SpinnakerException as ex:
-        print "Error: %s" % ex
+        print("Error: %s" % ex)
         return False
 
     return result
@@ -153,29 +153,29 @@ def acquire_images(cam):
     :rtype: bool
     """
 
-    print "*** IMAGE ACQUISITION ***\n"
+    print("*** IMAGE ACQUISITION ***\n")
     try:
         result = True
 
         # Set acquisition mode to continuous
         if cam.AcquisitionMode.GetAccessMode() != PySpin.RW:
-            print "Unable to set acquisition mode to continuous. Aborting..."
+            print("Unable to set acquisition mode to continuous. Aborting...")
             return False
 
         cam.AcquisitionMode.SetValue(PySpin.AcquisitionMode_Continuous)
-        print "Acquisition mode set to continuous..."
+        print("Acquisition mode set to continuous...")
 
         #  Begin acquiring images
         cam.BeginAcquisition()
 
-        print "Acquiring images..."
+        print("Acquiring images...")
 
         # Get device serial number for filename
         device_serial_number = ""
         if cam.TLDevice.DeviceSerialNumber.GetAccessMode() == PySpin.RO:
             device_serial_number = cam.TLDevice.DeviceSerialNumber.GetValue()
 
-            print "Device serial number retrieved as %s..." % device_serial_number
+            print("Device serial number retrieved as %s..." % device_serial_number)
 
         # Retrieve, convert, and save images
         for i in range(NUM_IMAGES):
@@ -189,14 +189,14 @@ def acquire_images(cam):
 
                 #  Ensure image completion
                 if image_result.IsIncomplete():
-                    print "Image incomplete with image status %d ..." % image_result.GetImageStatus()
+                    print("Image incomplete with image status %d ..." % image_result.GetImageStatus())
 
                 else:
 
                     #  Print image information
                     width = image_result.GetWidth()
                     height = image_result.GetHeight()
-                    print "Grabbed Image %d, width = %d, height = %d" % (i, width, height)
+                    print("Grabbed Image %d, width = %d, height = %d" % (i, width, height))
 
                     #  Convert image to mono 8
                     image_converted = image_result.Convert(PySpin.PixelFormat_Mono8, PySpin.HQ_LINEAR)
@@ -210,21 +210,21 @@ def acquire_images(cam):
                     # Save image
                     image_converted.Save(filename)
 
-                    print "Image saved at %s" % filename
+                    print("Image saved at %s" % filename)
 
                     #  Release image
                     image_result.Release()
-                    print ""
+                    print("")
 
             except PySpin.SpinnakerException as ex:
-                print "Error: %s" % ex
+                print("Error: %s" % ex)
                 return False
 
         # End acquisition
         cam.EndAcquisition()
 
     except PySpin.SpinnakerException as ex:
-        print "Error: %s" % ex
+        print("Error: %s" % ex)
         return False
 
     return result
@@ -245,15 +245,15 @@ def reset_trigger(cam):
         # The trigger must be disabled in order to configure whether the source
         # is software or hardware.
         if cam.TriggerMode.GetAccessMode() != PySpin.RW:
-            print "Unable to disable trigger mode (node retrieval). Aborting..."
+            print("Unable to disable trigger mode (node retrieval). Aborting...")
             return False
 
         cam.TriggerMode.SetValue(PySpin.TriggerMode_Off)
 
-        print "Trigger mode disabled..."
+        print("Trigger mode disabled...")
 
     except PySpin.SpinnakerException as ex:
-        print "Error: %s" % ex
+        print("Error: %s" % ex)
         result = False
 
     return result
@@ -271,7 +271,7 @@ def print_device_info(nodemap):
     :rtype: bool
     """
 
-    print "*** DEVICE INFORMATION ***\n"
+    print("*** DEVICE INFORMATION ***\n")
 
     try:
         result = True
@@ -281,14 +281,14 @@ def print_device_info(nodemap):
             features = node_device_information.GetFeatures()
             for feature in features:
                 node_feature = PySpin.CValuePtr(feature)
-                print "%s: %s" % (node_feature.GetName(),
-                                  node_feature.ToString() if PySpin.IsReadable(node_feature) else "Node not readable")
+                print("%s: %s" % (node_feature.GetName(),
+                                  node_feature.ToString() if PySpin.IsReadable(node_feature) else "Node not readable"))
 
         else:
-            print "Device control information not available."
+            print("Device control information not available.")
 
     except PySpin.SpinnakerException as ex:
-        print "Error: %s" % ex
+        print("Error: %s" % ex)
         return False
 
     return result
@@ -333,7 +333,7 @@ def run_single_camera(cam):
         cam.DeInit()
 
     except PySpin.SpinnakerException as ex:
-        print "Error: %s" % ex
+        print("Error: %s" % ex)
         result = False
 
     return result
@@ -355,7 +355,7 @@ def main():
 
     num_cameras = cam_list.GetSize()
 
-    print "Number of cameras detected: %d" % num_cameras
+    print("Number of cameras detected: %d" % num_cameras)
 
     # Finish if there are no cameras
     if num_cameras == 0:
@@ -365,18 +365,18 @@ def main():
         # Release system
         system.ReleaseInstance()
 
-        print "Not enough cameras!"
-        raw_input("Done! Press Enter to exit...")
+        print("Not enough cameras!")
+        input("Done! Press Enter to exit...")
         return False
 
     # Run example on each camera
     for i in range(num_cameras):
         cam = cam_list.GetByIndex(i)
 
-        print "Running example for camera %d..." % i
+        print("Running example for camera %d..." % i)
 
         result = run_single_camera(cam)
-        print "Camera %d example complete... \n" % i
+        print("Camera %d example complete... \n" % i)
 
     # Release reference to camera
     # NOTE: Unlike the C++ examples, we cannot rely on pointer objects being automatically
@@ -390,7 +390,7 @@ def main():
     # Release instance
     system.ReleaseInstance()
 
-    raw_input("Done! Press Enter to exit...")
+    input("Done! Press Enter to exit...")
     return result
 
 
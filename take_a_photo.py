@@ -23,7 +23,7 @@ cam.BeginAcquisition()
 image_primary = cam.GetNextImage()
 width = image_primary.GetWidth()
 height = image_primary.GetHeight()
-print "width: " + str(width) + ", height: " + str(height)
+print("width: " + str(width) + ", height: " + str(height))
 
 # Pixel array (NumPy array)
 image_array = image_primary.GetData()